@@ -13,7 +13,9 @@ from rita import console as con
 from rita.argocd import parse_argocd_application
 from rita.config import (
     CONFIG_FILE_NAME,
+    DOCKER_HUB_HOSTS,
     RegistryConfig,
+    clear_config_cache,
     fetch_secret_from_aws,
     find_config_file,
     generate_default_config,
@@ -26,6 +28,7 @@ from rita.storage import (
     create_storage_backend,
     get_default_branch,
     list_aws_profiles,
+    probe_bucket_access,
 )
 
 
@@ -51,6 +54,7 @@ def config_init(force: bool) -> None:
 
     with config_path.open("w", encoding="utf-8") as f:
         f.write(config_content)
+    clear_config_cache()
 
     click.echo(f"✓ Created {config_path}")
     click.echo()
@@ -87,6 +91,7 @@ def config_setup() -> None:
 
     if not config_path.exists():
         shutil.copy(template_path, config_path)
+        clear_config_cache()
         con.print_success(f"Created {CONFIG_FILE_NAME} from template")
     else:
         con.print_info(f"Updating existing config: {config_path}")
@@ -183,8 +188,8 @@ def config_setup() -> None:
     con.console.print()
 
     docker_registry = next(
-        (r for r in cfg.registries if "docker" in r.url.lower()), None
-    )
+        (r for r in cfg.registries if r.host in DOCKER_HUB_HOSTS), None
+    ) or next((r for r in cfg.registries if "docker" in r.host), None)
 
     if docker_registry:
         if docker_registry.aws_secret_name:
@@ -294,14 +299,15 @@ def config_setup() -> None:
     con.console.print()
 
     con.print_header("Configuration Summary")
+    summary: list[tuple[str, str]] = []
     if cfg.render.storage:
-        con.print_key_value("S3 bucket", cfg.render.storage.s3_bucket or "(not set)")
-        con.print_key_value(
-            "S3 prefix", cfg.render.storage.s3_prefix or "rendered-manifests"
-        )
-        con.print_key_value("AWS region", cfg.render.storage.aws_region or "(not set)")
-    con.print_key_value("AWS profile", aws_profile)
-    con.print_key_value("Compare branch", compare_branch)
+        summary += [
+            ("S3 bucket", cfg.render.storage.s3_bucket or "(not set)"),
+            ("S3 prefix", cfg.render.storage.s3_prefix or "rendered-manifests"),
+            ("AWS region", cfg.render.storage.aws_region or "(not set)"),
+        ]
+    summary += [("AWS profile", aws_profile), ("Compare branch", compare_branch)]
+    con.print_key_value_batch(summary)
     con.console.print()
 
     con.console.print("[bold]Validating AWS credentials...[/bold]")
@@ -314,7 +320,7 @@ def config_setup() -> None:
         con.console.print("[bold]Checking S3 bucket access...[/bold]")
         try:
             backend = create_storage_backend(cfg)
-            backend.list_manifests()
+            probe_bucket_access(backend, force=True)
             bucket_name = (
                 cfg.render.storage.s3_bucket if cfg.render.storage else "unknown"
             )
@@ -348,7 +354,12 @@ def config_setup() -> None:
 
 
 @config.command("check")
-def config_check() -> None:
+@click.option(
+    "--force",
+    is_flag=True,
+    help="Always probe the S3 bucket, ignoring a recent successful check.",
+)
+def config_check(force: bool) -> None:
     """Check if S3 storage is properly configured and accessible."""
     cfg = load_config()
 
@@ -362,11 +373,15 @@ def config_check() -> None:
 
     storage = cfg.render.storage
 
-    con.print_key_value("Storage type", storage.type)
-    con.print_key_value("S3 bucket", storage.s3_bucket or "(not set)")
-    con.print_key_value("S3 prefix", storage.s3_prefix)
-    con.print_key_value("AWS profile", storage.aws_profile or "(not set)")
-    con.print_key_value("AWS region", storage.aws_region or "(not set)")
+    con.print_key_value_batch(
+        [
+            ("Storage type", storage.type),
+            ("S3 bucket", storage.s3_bucket or "(not set)"),
+            ("S3 prefix", storage.s3_prefix),
+            ("AWS profile", storage.aws_profile or "(not set)"),
+            ("AWS region", storage.aws_region or "(not set)"),
+        ]
+    )
     con.console.print()
     con.console.print("[bold]Checking AWS credentials...[/bold]")
 
@@ -389,8 +404,13 @@ def config_check() -> None:
 
     try:
         backend = create_storage_backend(cfg)
-        backend.list_manifests()
-        con.print_success(f"Successfully accessed bucket: {storage.s3_bucket}")
+        if probe_bucket_access(backend, force=force):
+            con.print_success(f"Successfully accessed bucket: {storage.s3_bucket}")
+        else:
+            con.print_success(
+                f"Bucket access verified recently (cached): {storage.s3_bucket}"
+            )
+            con.print_hint("Use --force to re-check now")
     except Exception as e:
         con.print_error(f"Failed to access bucket: {e}")
         return
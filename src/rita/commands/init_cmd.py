@@ -4,10 +4,15 @@ Creates a new .rita.yaml configuration file with interactive prompts.
 """
 
 from __future__ import annotations
+
+import os
+from functools import lru_cache
 from pathlib import Path
+from typing import Final
 
 import rich_click as click
 from rich.prompt import Confirm, Prompt
+from rich.text import Text
 
 from rita import console as con
 from rita.config import (
@@ -24,6 +29,79 @@ from rita.config import (
 from rita.repository import get_repo_root
 from rita.storage import list_aws_profiles
 
+# Profiles only change when ~/.aws is edited; parse them at most once per run.
+_list_aws_profiles = lru_cache(maxsize=1)(list_aws_profiles)
+
+
+def _menu(*options: str) -> Text:
+    """Build a numbered option menu as a single pre-parsed Text."""
+    return Text.from_markup(
+        "\n".join(f"  [cyan]{i}[/cyan]. {option}" for i, option in enumerate(options, 1))
+    )
+
+
+# Static prompt banners, parsed once at import instead of on every prompt.
+_CHARTS_DIR_HEADER = Text.from_markup(
+    "[bold]Charts Directory[/bold]\n"
+    "[dim]The local directory containing your Helm charts (relative to repo root).[/dim]"
+)
+_OCI_REGISTRY_HEADER = Text.from_markup(
+    "[bold]OCI Registry[/bold]\n"
+    "[dim]The default OCI registry for publishing/pulling charts.[/dim]\n"
+    "[dim]Examples: ghcr.io/myorg, docker.io/myuser, registry.example.com[/dim]"
+)
+_STORAGE_MENU = _menu(
+    "Local filesystem (simple, no setup required)",
+    "AWS S3 (recommended for teams)",
+    "S3-compatible storage (Garage, MinIO, etc.)",
+)
+_S3_PROVIDER_MENU = _menu(
+    "Garage",
+    "MinIO",
+    "DigitalOcean Spaces",
+    "Backblaze B2",
+    "Other S3-compatible",
+)
+_S3_CREDENTIALS_HELP = Text.from_markup(
+    "[bold]Credentials[/bold]\n"
+    "[dim]You can set credentials via environment variables (recommended).[/dim]\n"
+    "\n"
+    "  Environment variables:\n"
+    "    [cyan]AWS_ACCESS_KEY_ID[/cyan] - Access key\n"
+    "    [cyan]AWS_SECRET_ACCESS_KEY[/cyan] - Secret key"
+)
+_PROVIDER_HINTS: Final[tuple[tuple[str, str, str], ...]] = (
+    ("Garage", "http://localhost:3900", "garage"),
+    ("MinIO", "http://localhost:9000", "minio"),
+    ("DigitalOcean Spaces", "https://nyc3.digitaloceanspaces.com", "do-spaces"),
+    ("Backblaze B2", "https://s3.us-west-001.backblazeb2.com", "b2"),
+    ("S3-compatible", "http://localhost:9000", "s3-compatible"),
+)
+"""(name, default endpoint, short id) for each S3-compatible provider menu entry."""
+
+_REGISTRY_URLS: Final[tuple[str, ...]] = ("docker.io", "ghcr.io", "ecr.aws", "gcr.io", "")
+"""Registry URL for each registry menu entry; empty means prompt for one."""
+
+_REGISTRY_MENU = _menu(
+    "Docker Hub (docker.io)",
+    "GitHub Container Registry (ghcr.io)",
+    "AWS ECR",
+    "Google Artifact Registry",
+    "Other",
+)
+_AUTH_METHOD_MENU = _menu(
+    "Environment variables (recommended)",
+    "AWS Secrets Manager",
+    "Direct credentials (not recommended)",
+)
+_COMMON_COMMANDS = Text.from_markup(
+    "  Common commands:\n"
+    "    [cyan]rita chart list[/cyan]         - List local charts\n"
+    "    [cyan]rita render list[/cyan]        - List ArgoCD applications\n"
+    "    [cyan]rita render apply[/cyan]       - Render all manifests\n"
+    "    [cyan]rita schema list[/cyan]        - List charts with schemas"
+)
+
 
 def _prompt_charts_config() -> ChartConfig:
     """Interactively configure charts settings."""
@@ -34,11 +112,7 @@ def _prompt_charts_config() -> ChartConfig:
     )
     con.console.print()
 
-    
-    con.console.print("[bold]Charts Directory[/bold]")
-    con.console.print(
-        "[dim]The local directory containing your Helm charts (relative to repo root).[/dim]"
-    )
+    con.console.print(_CHARTS_DIR_HEADER)
     con.console.print()
 
     charts_path: str = Prompt.ask(
@@ -48,12 +122,7 @@ def _prompt_charts_config() -> ChartConfig:
 
     con.console.print()
 
-    
-    con.console.print("[bold]OCI Registry[/bold]")
-    con.console.print(
-        "[dim]The default OCI registry for publishing/pulling charts.[/dim]"
-    )
-    con.console.print("[dim]Examples: ghcr.io/myorg, docker.io/myuser, registry.example.com[/dim]")
+    con.console.print(_OCI_REGISTRY_HEADER)
     con.console.print()
 
     registry: str = Prompt.ask(
@@ -166,9 +235,7 @@ def _prompt_storage_config() -> StorageConfig | None:
 
     con.console.print("[bold]Storage Backend[/bold]")
     con.console.print()
-    con.console.print("  [cyan]1[/cyan]. Local filesystem (simple, no setup required)")
-    con.console.print("  [cyan]2[/cyan]. AWS S3 (recommended for teams)")
-    con.console.print("  [cyan]3[/cyan]. S3-compatible storage (Garage, MinIO, etc.)")
+    con.console.print(_STORAGE_MENU)
     con.console.print()
 
     storage_choice = Prompt.ask(
@@ -211,7 +278,7 @@ def _prompt_aws_s3_config() -> StorageConfig:
     con.console.print()
 
     
-    profiles = list_aws_profiles()
+    profiles = _list_aws_profiles()
     profile = None
 
     if profiles:
@@ -260,12 +327,7 @@ def _prompt_s3_compatible_config() -> StorageConfig:
     )
     con.console.print()
 
-    
-    con.console.print("  [cyan]1[/cyan]. Garage")
-    con.console.print("  [cyan]2[/cyan]. MinIO")
-    con.console.print("  [cyan]3[/cyan]. DigitalOcean Spaces")
-    con.console.print("  [cyan]4[/cyan]. Backblaze B2")
-    con.console.print("  [cyan]5[/cyan]. Other S3-compatible")
+    con.console.print(_S3_PROVIDER_MENU)
     con.console.print()
 
     provider = Prompt.ask(
@@ -274,15 +336,7 @@ def _prompt_s3_compatible_config() -> StorageConfig:
         default="1",
     )
 
-    provider_hints = {
-        "1": ("Garage", "http://localhost:3900", "garage"),
-        "2": ("MinIO", "http://localhost:9000", "minio"),
-        "3": ("DigitalOcean Spaces", "https://nyc3.digitaloceanspaces.com", "do-spaces"),
-        "4": ("Backblaze B2", "https://s3.us-west-001.backblazeb2.com", "b2"),
-        "5": ("S3-compatible", "http://localhost:9000", "s3-compatible"),
-    }
-
-    provider_name, default_endpoint, _ = provider_hints[provider]
+    provider_name, default_endpoint, _ = _PROVIDER_HINTS[int(provider) - 1]
 
     con.console.print()
     con.console.print(f"[bold]{provider_name} Configuration[/bold]")
@@ -301,14 +355,7 @@ def _prompt_s3_compatible_config() -> StorageConfig:
     )
 
     con.console.print()
-    con.console.print("[bold]Credentials[/bold]")
-    con.console.print(
-        "[dim]You can set credentials via environment variables (recommended).[/dim]"
-    )
-    con.console.print()
-    con.console.print("  Environment variables:")
-    con.console.print("    [cyan]AWS_ACCESS_KEY_ID[/cyan] - Access key")
-    con.console.print("    [cyan]AWS_SECRET_ACCESS_KEY[/cyan] - Secret key")
+    con.console.print(_S3_CREDENTIALS_HELP)
     con.console.print()
 
     return StorageConfig(
@@ -374,11 +421,7 @@ def _prompt_registries() -> list[RegistryConfig]:
         con.console.print("[bold]Add Registry[/bold]")
         con.console.print()
         con.console.print("Common registries:")
-        con.console.print("  [cyan]1[/cyan]. Docker Hub (docker.io)")
-        con.console.print("  [cyan]2[/cyan]. GitHub Container Registry (ghcr.io)")
-        con.console.print("  [cyan]3[/cyan]. AWS ECR")
-        con.console.print("  [cyan]4[/cyan]. Google Artifact Registry")
-        con.console.print("  [cyan]5[/cyan]. Other")
+        con.console.print(_REGISTRY_MENU)
         con.console.print()
 
         registry_choice = Prompt.ask(
@@ -387,24 +430,14 @@ def _prompt_registries() -> list[RegistryConfig]:
             default="1",
         )
 
-        registry_urls = {
-            "1": "docker.io",
-            "2": "ghcr.io",
-            "3": "ecr.aws",
-            "4": "gcr.io",
-            "5": "",
-        }
-
-        url = registry_urls[registry_choice]
+        url = _REGISTRY_URLS[int(registry_choice) - 1]
         if not url:
             url = Prompt.ask("Registry URL")
 
         con.console.print()
         con.console.print("[bold]Authentication Method[/bold]")
         con.console.print()
-        con.console.print("  [cyan]1[/cyan]. Environment variables (recommended)")
-        con.console.print("  [cyan]2[/cyan]. AWS Secrets Manager")
-        con.console.print("  [cyan]3[/cyan]. Direct credentials (not recommended)")
+        con.console.print(_AUTH_METHOD_MENU)
         con.console.print()
 
         auth_choice = Prompt.ask(
@@ -518,6 +551,36 @@ def _prompt_test_config() -> ChartTestConfig:
     )
 
 
+def _existing_paths(repo_root: Path, paths: list[str]) -> set[str]:
+    """Return the repo-relative paths that exist, listing each parent directory once."""
+    by_parent: dict[Path, list[str]] = {}
+    for path in paths:
+        by_parent.setdefault((repo_root / path).parent, []).append(path)
+
+    existing: set[str] = set()
+    for parent, children in by_parent.items():
+        try:
+            with os.scandir(parent) as entries:
+                names: set[str] = {entry.name for entry in entries}
+        except OSError:
+            continue
+        existing.update(path for path in children if (repo_root / path).name in names)
+    return existing
+
+
+def _gitignore_mentions(gitignore_path: Path, name: str) -> bool:
+    """Check whether a non-comment line of a .gitignore mentions ``name``.
+
+    Scans the file as bytes line by line and stops at the first match.
+    """
+    needle: bytes = name.encode()
+    with gitignore_path.open("rb") as fh:
+        for line in fh:
+            if needle in line.split(b"#", 1)[0]:
+                return True
+    return False
+
+
 @click.command("init")
 @click.option("--force", "-f", is_flag=True, help="Overwrite existing config file.")
 @click.option("--minimal", "-m", is_flag=True, help="Use minimal prompts with sensible defaults.")
@@ -610,19 +673,21 @@ def init(force: bool, minimal: bool) -> None:
     con.print_header("Configuration Summary")
     con.console.print()
 
-    con.print_key_value("Charts directory", config.charts.path)
-    con.print_key_value("OCI registry", config.charts.registry)
-    con.print_key_value("Environments", ", ".join(e.name for e in config.environments))
-    con.print_key_value(
-        "Storage",
-        config.render.storage.type if config.render.storage else "local",
-    )
+    summary: list[tuple[str, str]] = [
+        ("Charts directory", config.charts.path),
+        ("OCI registry", config.charts.registry),
+        ("Environments", ", ".join(e.name for e in config.environments)),
+        ("Storage", config.render.storage.type if config.render.storage else "local"),
+    ]
     if config.render.storage and config.render.storage.s3_bucket:
-        con.print_key_value("  Bucket", config.render.storage.s3_bucket)
-    con.print_key_value("Output path", config.render.output_path)
-    con.print_key_value("Compare branch", config.render.compare_branch)
-    con.print_key_value("Auto-discover", "yes" if config.auto_discover else "no")
-    con.print_key_value("Registries", str(len(config.registries)))
+        summary.append(("  Bucket", config.render.storage.s3_bucket))
+    summary += [
+        ("Output path", config.render.output_path),
+        ("Compare branch", config.render.compare_branch),
+        ("Auto-discover", "yes" if config.auto_discover else "no"),
+        ("Registries", str(len(config.registries))),
+    ]
+    con.print_key_value_batch(summary)
 
     con.console.print()
 
@@ -645,22 +710,20 @@ def init(force: bool, minimal: bool) -> None:
     else:
         con.console.print(f"  1. Charts directory exists: [success]✓[/success] {config.charts.path}")
 
-    
+    existing_paths = _existing_paths(
+        repo_root, [path for env in config.environments for path in env.paths]
+    )
+    paths_missing = False
     for env in config.environments:
-        for path in env.paths:
-            env_path = repo_root / path
-            if not env_path.exists():
-                con.console.print(f"  2. Create {env.name} applications path: [cyan]mkdir -p {path}[/cyan]")
-                break
-    else:
+        missing = next((path for path in env.paths if path not in existing_paths), None)
+        if missing is not None:
+            con.console.print(f"  2. Create {env.name} applications path: [cyan]mkdir -p {missing}[/cyan]")
+            paths_missing = True
+    if not paths_missing:
         con.console.print("  2. Environment paths configured [success]✓[/success]")
 
     con.console.print()
-    con.console.print("  Common commands:")
-    con.console.print("    [cyan]rita chart list[/cyan]         - List local charts")
-    con.console.print("    [cyan]rita render list[/cyan]        - List ArgoCD applications")
-    con.console.print("    [cyan]rita render apply[/cyan]       - Render all manifests")
-    con.console.print("    [cyan]rita schema list[/cyan]        - List charts with schemas")
+    con.console.print(_COMMON_COMMANDS)
 
     
     if config.render.storage and config.render.storage.type == "s3":
@@ -676,13 +739,11 @@ def init(force: bool, minimal: bool) -> None:
 
     
     gitignore_path = repo_root / ".gitignore"
-    if gitignore_path.exists():
-        gitignore_content = gitignore_path.read_text()
-        if CONFIG_FILE_NAME not in gitignore_content:
-            con.console.print()
-            con.print_hint(
-                f"Consider adding '{CONFIG_FILE_NAME}' to .gitignore if it contains sensitive data."
-            )
-            con.print_hint(
-                "Use '.rita.template.yaml' for team-shared configuration without secrets."
-            )
+    if gitignore_path.exists() and not _gitignore_mentions(gitignore_path, CONFIG_FILE_NAME):
+        con.console.print()
+        con.print_hint(
+            f"Consider adding '{CONFIG_FILE_NAME}' to .gitignore if it contains sensitive data."
+        )
+        con.print_hint(
+            "Use '.rita.template.yaml' for team-shared configuration without secrets."
+        )
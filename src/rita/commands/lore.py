@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import rich_click as click
+from rich.text import Text
 
 from rita import console as con
 
@@ -63,7 +64,11 @@ RITA_LORE = """
 """
 
 
+_LORE_TEXT = Text(RITA_LORE)
+"""The lore wrapped once as plain Text, so it is never re-scanned for markup."""
+
+
 @click.command("lore")
 def lore() -> None:
     """Discover the story behind RITA."""
-    con.print_lore(RITA_LORE)
+    con.print_lore(_LORE_TEXT)
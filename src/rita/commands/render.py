@@ -2,20 +2,30 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 import os
+import re
 import shutil
 import subprocess
 import tempfile
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from dataclasses import dataclass
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, BinaryIO
 
 import rich_click as click
 import yaml
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
 from rita import console as con
 from rita.config import RitaConfig, get_canonical_env_name, load_config
 from rita.helm import (
@@ -25,26 +35,245 @@ from rita.helm import (
 )
 from rita.kustomize import render_kustomize, render_plain_manifests
 from rita.repository import (
+    apps_by_name,
     get_chart_path,
+    get_rendered_manifests_path,
     get_rendered_path,
     get_repo_root,
     list_apps_for_env,
     list_available_envs,
 )
 from rita.storage import (
+    S3_RANGE_MAX_WORKERS,
     AWSTokenExpiredError,
+    ManifestObject,
     ManifestRef,
     S3StorageBackend,
     StorageBackend,
     create_storage_backend,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from concurrent.futures import Future, ProcessPoolExecutor
+    from multiprocessing.context import BaseContext
+
 
 @click.group()
 def render() -> None:
     pass
 
 
+_render_pool: ProcessPoolExecutor | None = None
+_render_pool_workers: int = 0
+
+
+_diff_pool: ProcessPoolExecutor | None = None
+_diff_pool_key: tuple[int, tuple[str, ...]] | None = None
+
+# Per-worker state for diff tasks, populated once by _init_diff_worker.
+_diff_worker_state: dict[str, Any] = {}
+
+# Longest a finished app's line waits in render diff's output buffer.
+_OUTPUT_FLUSH_SECONDS = 0.25
+
+
+def _pool_context() -> BaseContext:
+    import multiprocessing
+
+    start_method = (
+        "forkserver"
+        if "forkserver" in multiprocessing.get_all_start_methods()
+        else "spawn"
+    )
+    return multiprocessing.get_context(start_method)
+
+
+def _get_render_pool(workers: int) -> ProcessPoolExecutor:
+    """Get the shared process pool for rendering, creating it on first use.
+
+    Rendering mixes helm/kustomize subprocesses with YAML splitting and file
+    I/O in Python, so worker processes avoid serializing on the GIL. The pool
+    is kept for the life of the process so repeated renders (e.g. one per
+    environment) don't pay worker start-up again.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    global _render_pool, _render_pool_workers
+
+    if _render_pool is None or _render_pool_workers != workers:
+        if _render_pool is not None:
+            _render_pool.shutdown()
+        _render_pool = ProcessPoolExecutor(
+            max_workers=workers, mp_context=_pool_context()
+        )
+        _render_pool_workers = workers
+
+    return _render_pool
+
+
+def _discard_pool(pool: ProcessPoolExecutor) -> None:
+    """Forget a pool whose worker died, so the next use starts a fresh one."""
+    global _render_pool, _diff_pool
+
+    if pool is _render_pool:
+        _render_pool = None
+    if pool is _diff_pool:
+        _diff_pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _init_diff_worker(envs: tuple[str, ...]) -> None:
+    """Load the repo root and apps once per diff worker."""
+    _diff_worker_state.clear()
+    try:
+        _diff_worker_state["repo_root"] = get_repo_root()
+        _diff_worker_state["apps_by_env"] = {env: apps_by_name(env) for env in envs}
+    except Exception as e:
+        _diff_worker_state["error"] = str(e)
+
+
+def _get_diff_pool(workers: int, envs: tuple[str, ...]) -> ProcessPoolExecutor:
+    """Get the shared process pool for diffing, creating it on first use.
+
+    Workers load each environment's apps in their initializer, so individual
+    diff tasks only render and compare.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    global _diff_pool, _diff_pool_key
+
+    key = (workers, envs)
+    if _diff_pool is None or _diff_pool_key != key:
+        if _diff_pool is not None:
+            _diff_pool.shutdown()
+        _diff_pool = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=_pool_context(),
+            initializer=_init_diff_worker,
+            initargs=(envs,),
+        )
+        _diff_pool_key = key
+
+    return _diff_pool
+
+
+class _ScratchDirPool:
+    """Reusable scratch directories for multi-source renders and diffs.
+
+    Each process keeps one root per parent directory (the system temp dir by
+    default), named after its PID. Slots are emptied and handed back after
+    use rather than created and removed per task. Roots are removed when the
+    process exits; roots left by processes that were killed are swept the
+    next time any process creates a root under the same parent.
+    """
+
+    _PREFIX = ".rita-scratch-"
+
+    def __init__(self) -> None:
+        self._pid: int = 0
+        self._roots: dict[Path | None, Path] = {}
+        self._free: dict[Path, list[Path]] = {}
+        self._slot_count: int = 0
+        # Worker processes run one task at a time, but nothing stops a caller
+        # from sharing the pool between threads.
+        self._lock = threading.Lock()
+
+    def _ensure_root(self, parent: Path | None) -> Path:
+        if self._pid != os.getpid():
+            self._pid = os.getpid()
+            self._roots = {}
+            self._free = {}
+            self._slot_count = 0
+
+        root: Path | None = self._roots.get(parent)
+        if root is None:
+            import multiprocessing.util
+
+            if parent is not None:
+                parent.mkdir(parents=True, exist_ok=True)
+                self._sweep_stale_roots(parent)
+            root = Path(
+                tempfile.mkdtemp(prefix=f"{self._PREFIX}{self._pid}-", dir=parent)
+            )
+            self._roots[parent] = root
+            self._free[root] = []
+            # Finalize (unlike atexit) also runs when pool workers exit.
+            multiprocessing.util.Finalize(
+                None,
+                shutil.rmtree,
+                args=(root,),
+                kwargs={"ignore_errors": True},
+                exitpriority=0,
+            )
+        return root
+
+    @classmethod
+    def _sweep_stale_roots(cls, parent: Path) -> None:
+        """Remove roots under parent whose owning process no longer exists."""
+        if os.name != "posix":
+            # os.kill(pid, 0) terminates the process on Windows.
+            return
+        for entry in os.scandir(parent):
+            if not entry.name.startswith(cls._PREFIX):
+                continue
+            pid_text: str = entry.name.removeprefix(cls._PREFIX).partition("-")[0]
+            if not pid_text.isdigit():
+                continue
+            try:
+                os.kill(int(pid_text), 0)
+            except ProcessLookupError:
+                shutil.rmtree(entry.path, ignore_errors=True)
+            except OSError:
+                pass
+
+    @contextmanager
+    def acquire(self, parent: Path | None = None) -> Iterator[Path]:
+        """Borrow an empty slot, created under `parent` if given.
+
+        Pass a directory on the output's filesystem when results are
+        hardlinked out of the slot, but never one inside the output tree.
+        """
+        with self._lock:
+            root: Path = self._ensure_root(parent)
+            free: list[Path] = self._free[root]
+            if free:
+                slot: Path = free.pop()
+            else:
+                slot = root / f"slot-{self._slot_count}"
+                slot.mkdir()
+                self._slot_count += 1
+
+        try:
+            yield slot
+        finally:
+            for entry in os.scandir(slot):
+                if entry.is_dir(follow_symlinks=False):
+                    shutil.rmtree(entry.path, ignore_errors=True)
+                else:
+                    Path(entry.path).unlink(missing_ok=True)
+            with self._lock:
+                free.append(slot)
+
+
+_scratch_pool = _ScratchDirPool()
+
+
+def _scratch_parent() -> Path:
+    """Directory for render scratch roots: a hidden sibling of the output tree.
+
+    Keeping scratch beside rendered/ means results can be hardlinked into
+    place, while keeping it outside means leftovers from a killed render are
+    never mistaken for apps by `render push` or the local manifest listing.
+    """
+    rendered: Path = get_rendered_manifests_path()
+    parent: Path = rendered.parent / f".{rendered.name}-scratch"
+    if not parent.is_dir():
+        parent.mkdir(parents=True, exist_ok=True)
+        (parent / ".gitignore").write_text("*\n", encoding="utf-8")
+    return parent
+
+
 @dataclass
 class RenderResult:
     app_name: str
@@ -54,6 +283,58 @@ class RenderResult:
     nested_count: int = 0
 
 
+_MANIFEST_SEPARATOR: bytes = b"\n---\n"
+
+
+def _copy_stripped(src: BinaryIO, dst: BinaryIO, chunk_size: int = 1 << 20) -> None:
+    """Stream src into dst without its leading and trailing whitespace."""
+    leading: bool = True
+    pending: bytes = b""
+
+    while chunk := src.read(chunk_size):
+        if leading:
+            chunk = chunk.lstrip()
+            if not chunk:
+                continue
+            leading = False
+
+        body: bytes = chunk.rstrip()
+        if body:
+            dst.write(pending)
+            dst.write(body)
+            pending = chunk[len(body) :]
+        else:
+            pending += chunk
+
+
+def _concat_manifests(sources: list[Path], dest: Path) -> None:
+    """Write sources to dest, stripped and joined with document separators.
+
+    Equivalent to joining each file's stripped text with ``---`` lines, but
+    streamed so peak memory doesn't grow with manifest size.
+    """
+    with dest.open("wb") as out:
+        for i, source in enumerate(sources):
+            if i:
+                out.write(_MANIFEST_SEPARATOR)
+            with source.open("rb") as f:
+                _copy_stripped(f, out)
+
+
+def _link_or_copy(src: Path, dest: Path) -> None:
+    """Hardlink a scratch file into place, copying if linking isn't possible.
+
+    The scratch copy is discarded afterwards, so sharing its inode is safe.
+    Scratch slots live beside the output tree, so linking only fails on
+    filesystems without hardlinks; copyfile then still copies in-kernel via
+    sendfile on Linux.
+    """
+    try:
+        os.link(src, dest)
+    except OSError:
+        shutil.copyfile(src, dest)
+
+
 def _render_single_app(
     app: Any,
     env: str,
@@ -71,10 +352,12 @@ def _render_single_app(
     source_count: int = sum([has_helm, has_kustomize, has_plain])
 
     if source_count > 1:
-        with tempfile.TemporaryDirectory() as tmpdir:
-            helm_dir: Path = Path(tmpdir) / "helm"
-            kustomize_dir: Path = Path(tmpdir) / "kustomize"
-            plain_dir: Path = Path(tmpdir) / "plain"
+        # Scratch beside the output tree so single-source files can be
+        # hardlinked.
+        with _scratch_pool.acquire(_scratch_parent()) as tmpdir:
+            helm_dir: Path = tmpdir / "helm"
+            kustomize_dir: Path = tmpdir / "kustomize"
+            plain_dir: Path = tmpdir / "plain"
             helm_dir.mkdir()
             kustomize_dir.mkdir()
             plain_dir.mkdir()
@@ -134,7 +417,6 @@ def _render_single_app(
 
             output_path.mkdir(parents=True, exist_ok=True)
 
-            combined_content = []
             source_dirs = []
             if has_helm:
                 source_dirs.append(helm_dir)
@@ -143,28 +425,29 @@ def _render_single_app(
             if has_plain:
                 source_dirs.append(plain_dir)
 
+            # One scandir per source finds both the combined and per-kind files.
+            all_yaml_files: list[Path] = []
+            files_by_name: dict[str, list[Path]] = {}
             for src_dir in source_dirs:
-                all_yaml = src_dir / "_all.yaml"
-                if all_yaml.exists():
-                    combined_content.append(
-                        all_yaml.read_text(encoding="utf-8").strip()
-                    )
-
-            combined_all: Path = output_path / "_all.yaml"
-            combined_all.write_text("\n---\n".join(combined_content), encoding="utf-8")
+                with os.scandir(src_dir) as entries:
+                    for entry in entries:
+                        if not entry.name.endswith(".yaml") or not entry.is_file():
+                            continue
+                        if entry.name == "_all.yaml":
+                            all_yaml_files.append(Path(entry.path))
+                        else:
+                            files_by_name.setdefault(entry.name, []).append(
+                                Path(entry.path)
+                            )
 
-            from shutil import copy2
+            _concat_manifests(all_yaml_files, output_path / "_all.yaml")
 
-            for src_dir in source_dirs:
-                for yaml_file in src_dir.glob("*.yaml"):
-                    if yaml_file.name != "_all.yaml":
-                        dest: Path = output_path / yaml_file.name
-                        if dest.exists():
-                            existing: str = dest.read_text(encoding="utf-8").strip()
-                            new = yaml_file.read_text(encoding="utf-8").strip()
-                            dest.write_text(f"{existing}\n---\n{new}", encoding="utf-8")
-                        else:
-                            copy2(yaml_file, dest)
+            for name, yaml_files in files_by_name.items():
+                dest: Path = output_path / name
+                if len(yaml_files) == 1:
+                    _link_or_copy(yaml_files[0], dest)
+                else:
+                    _concat_manifests(yaml_files, dest)
 
             rel_path = str(output_path.relative_to(repo_root))
 
@@ -273,20 +556,42 @@ def _render_applications(
             success_count += 1
         return success_count, failure_count
 
-    if workers > 1:
+    # A single app isn't worth starting worker processes for.
+    if workers > 1 and len(apps) > 1:
+        from concurrent.futures import as_completed
+        from concurrent.futures.process import BrokenProcessPool
+
         results: list[RenderResult] = []
 
-        with con.status(f"Rendering {len(apps)} apps with {workers} workers..."), ThreadPoolExecutor(max_workers=workers) as executor:
-                futures = {
-                    executor.submit(
-                        _render_single_app, app, env, recursive, repo_root
-                    ): app
-                    for app in apps
-                }
+        with con.create_progress() as progress:
+            task = progress.add_task(
+                f"Rendering {len(apps)} apps with {workers} workers...",
+                total=len(apps),
+            )
+            executor: ProcessPoolExecutor = _get_render_pool(workers)
+            futures = {
+                executor.submit(_render_single_app, app, env, recursive, repo_root): app
+                for app in apps
+            }
 
-                for future in as_completed(futures):
+            for future in as_completed(futures):
+                try:
                     result = future.result()
-                    results.append(result)
+                except BrokenProcessPool as e:
+                    # A worker was killed (e.g. out of memory); every pending
+                    # render fails with it, and the next run gets a new pool.
+                    _discard_pool(executor)
+                    result = RenderResult(
+                        app_name=futures[future].name,
+                        success=False,
+                        message=f"Render worker exited unexpectedly: {e}",
+                    )
+                results.append(result)
+                progress.update(
+                    task,
+                    advance=1,
+                    description=f"Rendering apps... ({len(results)}/{len(apps)})",
+                )
 
         for result in sorted(results, key=lambda r: r.app_name):
             if result.success:
@@ -298,18 +603,22 @@ def _render_applications(
                 con.print_error(f"{result.app_name}: {result.message}")
                 failure_count += 1
     else:
-        for app in apps:
-            with con.status(f"Rendering {app.name}..."):
+        # One live display for the whole loop; results print above it.
+        with con.create_progress() as progress:
+            task = progress.add_task("Rendering...", total=len(apps))
+            for app in apps:
+                progress.update(task, description=f"Rendering {app.name}...")
                 result = _render_single_app(app, env, recursive, repo_root)
+                progress.advance(task)
 
-            if result.success:
-                con.print_success(f"{result.app_name} → {result.rel_path}")
-                if result.message and result.nested_count > 1:
-                    con.print_info(f"  ↳ {result.message}")
-                success_count += 1
-            else:
-                con.print_error(f"{result.app_name}: {result.message}")
-                failure_count += 1
+                if result.success:
+                    con.print_success(f"{result.app_name} → {result.rel_path}")
+                    if result.message and result.nested_count > 1:
+                        con.print_info(f"  ↳ {result.message}")
+                    success_count += 1
+                else:
+                    con.print_error(f"{result.app_name}: {result.message}")
+                    failure_count += 1
 
     return success_count, failure_count
 
@@ -441,12 +750,21 @@ def render_apply(
         con.print_success(f"Rendered {total_success} applications")
 
 
+def _push_manifest(backend: S3StorageBackend, s3_key: str, manifest_file: Path) -> None:
+    backend.upload_manifest(s3_key, manifest_file.read_text(encoding="utf-8"))
+
+
 @render.command("push")
 @click.option("--env", "-e", default="dev", help="Environment to push.")
 @click.option("--all-envs", is_flag=True, help="Push all environments.")
 @click.option("--branch", "-b", help="Branch name for the manifest set.")
 @click.option("--dry-run", is_flag=True, help="Show what would be pushed.")
-def render_push(env: str, all_envs: bool, branch: str | None, dry_run: bool) -> None:
+@click.option(
+    "--push-workers", default=8, help="Number of concurrent manifest uploads."
+)
+def render_push(
+    env: str, all_envs: bool, branch: str | None, dry_run: bool, push_workers: int
+) -> None:
     """Push rendered manifests to S3 storage."""
     cfg: RitaConfig = load_config()
 
@@ -502,17 +820,29 @@ def render_push(env: str, all_envs: bool, branch: str | None, dry_run: bool) ->
 
         con.print_header(f"Pushing {current_env}")
 
-        for manifest_file in all_yaml_files:
-            rel_to_env = manifest_file.relative_to(rendered_dir)
-            s3_key = f"{current_env}/{rel_to_env}"
+        s3_keys: dict[Path, str] = {
+            manifest_file: f"{current_env}/{manifest_file.relative_to(rendered_dir)}"
+            for manifest_file in all_yaml_files
+        }
 
-            if dry_run:
-                con.print_info(f"Would push: {current_env}/{rel_to_env}")
-            else:
-                with manifest_file.open(encoding="utf-8") as f:
-                    content: str = f.read()
-                backend.upload_manifest(s3_key, content)
-                con.print_success(f"Pushed: {current_env}/{rel_to_env}")
+        if dry_run:
+            for s3_key in s3_keys.values():
+                con.print_info(f"Would push: {s3_key}")
+            continue
+
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+
+        # Uploads are network-bound, so threads sharing one client suffice.
+        # Touch the client first so it isn't lazily created from every thread.
+        _ = backend.client
+        with ThreadPoolExecutor(max_workers=max(1, push_workers)) as executor:
+            futures = {
+                executor.submit(_push_manifest, backend, s3_key, manifest_file): s3_key
+                for manifest_file, s3_key in s3_keys.items()
+            }
+            for future in as_completed(futures):
+                future.result()
+                con.print_success(f"Pushed: {futures[future]}")
 
     if not dry_run:
         con.console.print()
@@ -602,49 +932,200 @@ def _get_manifest_name(doc: dict) -> str:
     return f"{kind}/{name}"
 
 
+# Fast-path identity extraction for block-style manifests, as emitted by
+# helm and kustomize. Anything these can't read unambiguously (quoted keys or
+# scalars, special scalars, flow style, anchors, merge keys, comments inside
+# the block, multi-line values) falls back to YAML.
+_KIND_RE = re.compile(r"^kind:(.*)$", re.MULTILINE)
+_METADATA_BLOCK_RE = re.compile(
+    r"^metadata:[ \t]*\n((?:[ \t]+\S[^\n]*\n|[ \t]*\n)*)", re.MULTILINE
+)
+_METADATA_LINE_RE = re.compile(r"([ \t]*)(?:([A-Za-z_][\w.-]*):(?:[ \t](.*))?)?")
+_PLAIN_SCALAR_RE = re.compile(r"[ \t]*([A-Za-z](?:[\w.:/-]*[\w./-])?)(?:[ \t]+(?:#.*)?)?")
+_YAML_SPECIAL_WORDS: frozenset[str] = frozenset(
+    {"y", "n", "yes", "no", "on", "off", "true", "false", "null"}
+)
+
+
+def _plain_scalar(value: str) -> str | None:
+    match = _PLAIN_SCALAR_RE.fullmatch(value)
+    if not match or match.group(1).lower() in _YAML_SPECIAL_WORDS:
+        return None
+    return match.group(1)
+
+
+def _manifest_identity(raw: str) -> str | None:
+    """Get a manifest's identity without parsing it, or None if unsure.
+
+    Returns the same string as ``_get_manifest_name`` on the parsed document.
+    Documents without a ``metadata.name`` return None, so they are keyed by
+    the parser and never collide on a shared ``unnamed`` identity here.
+    """
+    kinds: list[str] = _KIND_RE.findall(raw)
+    if len(kinds) != 1 or not (kind := _plain_scalar(kinds[0])):
+        return None
+
+    blocks: list[re.Match[str]] = list(_METADATA_BLOCK_RE.finditer(raw + "\n"))
+    if len(blocks) != 1 or not blocks[0].group(1).strip():
+        return None
+    # A column-0 comment ends the regex block but not the YAML mapping.
+    if raw[blocks[0].end() :].startswith("#"):
+        return None
+    lines: list[str] = [line for line in blocks[0].group(1).splitlines() if line.strip()]
+    indent: str = lines[0][: len(lines[0]) - len(lines[0].lstrip())]
+
+    fields: dict[str, str] = {}
+    current: str | None = None
+    for line in lines:
+        match = _METADATA_LINE_RE.match(line)
+        line_indent: str = match.group(1)
+        if line_indent != indent:
+            # Deeper lines belong to the current key; under name or
+            # namespace they are continuations of the scalar.
+            if not line_indent.startswith(indent) or current in fields:
+                return None
+            continue
+        current = match.group(2)
+        if current is None or match.end() != len(line):
+            return None
+        if current not in ("name", "namespace"):
+            continue
+        if current in fields or not (scalar := _plain_scalar(match.group(3) or "")):
+            return None
+        fields[current] = scalar
+
+    if "name" not in fields:
+        return None
+    name: str = fields["name"]
+    namespace: str = fields.get("namespace", "")
+    if namespace:
+        return f"{kind}/{namespace}/{name}"
+    return f"{kind}/{name}"
+
+
+@lru_cache(maxsize=64)
+def _parse_docs(content: str) -> dict[str, str]:
+    """Split a combined manifest into raw documents keyed by identity.
+
+    Cached because identical content (e.g. an unchanged baseline shared by
+    several environments) is often diffed more than once per worker. The
+    returned dict is shared between callers and must not be modified.
+    """
+    result: dict[str, str] = {}
+    for raw in content.split("\n---\n"):
+        raw = raw.strip()
+        if not raw:
+            continue
+        identity: str | None = _manifest_identity(raw)
+        if identity is not None:
+            result[identity] = raw
+            continue
+        try:
+            doc = yaml.load(raw, Loader=_SafeLoader)
+            if doc and isinstance(doc, dict):
+                result[_get_manifest_name(doc)] = raw
+        except yaml.YAMLError:
+            # Deterministic across processes and runs, unlike hash(), so the
+            # sorted diff output is stable.
+            digest: str = hashlib.blake2b(raw.encode(), digest_size=8).hexdigest()
+            result[f"unparseable-{digest}"] = raw
+    return result
+
+
+_TOP_LEVEL_KEY_RE = re.compile(r"([A-Za-z_][\w.-]*):(?:[ \t]|$)")
+
+
+def _top_level_blocks(raw: str) -> dict[str, list[str]] | None:
+    """Split a block-style document into the lines under each top-level key.
+
+    Lines before the first key are kept under ``""``. Returns None if the
+    document has top-level content that isn't a plain ``key:`` line, or
+    repeats a key.
+    """
+    blocks: dict[str, list[str]] = {"": []}
+    current: list[str] = blocks[""]
+    for line in f"{raw}\n".splitlines(keepends=True):
+        if line[0].isspace() or line.startswith("#"):
+            current.append(line)
+            continue
+        match = _TOP_LEVEL_KEY_RE.match(line)
+        if not match or match.group(1) in blocks:
+            return None
+        current = blocks[match.group(1)] = [line]
+    return blocks
+
+
+def _unified_manifest_diff(
+    identity: str, baseline_raw: str, new_raw: str
+) -> Iterator[str]:
+    """Yield a unified diff of one manifest, grouped by top-level key.
+
+    Only keys whose lines changed are diffed, with a few lines of context,
+    so a small edit inside a large spec stays small. Documents that can't be
+    split by key are diffed whole, with the original wide context.
+    """
+    import difflib
+
+    old_blocks = _top_level_blocks(baseline_raw)
+    new_blocks = _top_level_blocks(new_raw)
+    if old_blocks is not None and new_blocks is not None:
+        changed_keys: list[str] = [
+            key
+            for key in [*new_blocks, *(k for k in old_blocks if k not in new_blocks)]
+            if old_blocks.get(key, []) != new_blocks.get(key, [])
+        ]
+        # Equal blocks in a different order: nothing to attribute per key.
+        if changed_keys:
+            yield f"--- baseline/{identity}\n"
+            yield f"+++ current/{identity}\n"
+            for key in changed_keys:
+                yield f"### key: {key}\n" if key else "### (document start)\n"
+                hunks = difflib.unified_diff(
+                    old_blocks.get(key, []), new_blocks.get(key, []), n=3
+                )
+                yield from islice(hunks, 2, None)
+            return
+
+    yield from difflib.unified_diff(
+        baseline_raw.splitlines(keepends=True),
+        new_raw.splitlines(keepends=True),
+        fromfile=f"baseline/{identity}",
+        tofile=f"current/{identity}",
+        n=150,
+    )
+
+
 def _diff_manifests(
     baseline_content: str,
     new_content: str,
     max_lines_per_manifest: int = 250,
+    with_content: bool = True,
 ) -> tuple[bool, str]:
     """Diff YAML content at the manifest level.
 
     Instead of diffing the whole file, split by '---' and diff each
-    manifest individually. Only show manifests that have changes.
+    manifest individually. Only show manifests that have changes, and
+    within them only the top-level keys that changed. Without
+    `with_content`, only whether anything changed is computed.
     """
-    import difflib
-
-    baseline_docs_raw = baseline_content.split("\n---\n")
-    new_docs_raw = new_content.split("\n---\n")
-
-    def parse_docs(docs_raw: list[str]) -> dict[str, tuple[str, dict]]:
-        result = {}
-        for raw in docs_raw:
-            raw = raw.strip()
-            if not raw:
-                continue
-            try:
-                doc = yaml.safe_load(raw)
-                if doc and isinstance(doc, dict):
-                    identity = _get_manifest_name(doc)
-                    result[identity] = (raw, doc)
-            except yaml.YAMLError:
-                result[f"unparseable-{hash(raw)}"] = (raw, {})
-        return result
+    if baseline_content == new_content:
+        return False, ""
 
-    baseline_docs = parse_docs(baseline_docs_raw)
-    new_docs = parse_docs(new_docs_raw)
+    baseline_docs: dict[str, str] = _parse_docs(baseline_content)
+    new_docs: dict[str, str] = _parse_docs(new_content)
 
     all_identities = set(baseline_docs.keys()) | set(new_docs.keys())
+    changed: list[tuple[str, str, str]] = [
+        (identity, baseline_raw, new_raw)
+        for identity in sorted(all_identities)
+        if (baseline_raw := baseline_docs.get(identity, ""))
+        != (new_raw := new_docs.get(identity, ""))
+    ]
+    if not with_content:
+        return bool(changed), ""
 
     diffs = []
-    for identity in sorted(all_identities):
-        baseline_raw = baseline_docs.get(identity, ("", {}))[0]
-        new_raw = new_docs.get(identity, ("", {}))[0]
-
-        if baseline_raw == new_raw:
-            continue
-
+    for identity, baseline_raw, new_raw in changed:
         baseline_lines = baseline_raw.splitlines(keepends=True) if baseline_raw else []
         new_lines = new_raw.splitlines(keepends=True) if new_raw else []
 
@@ -665,13 +1146,11 @@ def _diff_manifests(
                     f"... ({len(baseline_lines) - max_lines_per_manifest} more lines)\n"
                 )
         else:
+            # Only format one line past the limit; the rest would be dropped.
             diff: list[str] = list(
-                difflib.unified_diff(
-                    baseline_lines,
-                    new_lines,
-                    fromfile=f"baseline/{identity}",
-                    tofile=f"current/{identity}",
-                    n=150,
+                islice(
+                    _unified_manifest_diff(identity, baseline_raw, new_raw),
+                    max_lines_per_manifest + 1,
                 )
             )
             if diff:
@@ -698,37 +1177,58 @@ def _get_changed_files_from_git(base_ref: str) -> list[str]:
     Uses three-dot syntax to compare from merge-base, showing only changes
     in the current branch (like GitHub PR diffs).
     """
+    # -z gives NUL-terminated paths: no per-line stripping, and no C-style
+    # quoting of paths with spaces or non-ASCII characters. --no-renames skips
+    # rename detection, and lists both sides of a move, so a file moved out
+    # of a chart still marks that chart as changed.
     try:
         result = subprocess.run(
-            ["git", "diff", "--name-only", f"{base_ref}...HEAD"],
+            [
+                "git",
+                "diff",
+                "--name-only",
+                "-z",
+                "--no-renames",
+                f"{base_ref}...HEAD",
+            ],
             capture_output=True,
             text=True,
             check=True,
         )
-        return [f.strip() for f in result.stdout.strip().split("\n") if f.strip()]
+        return [f for f in result.stdout.split("\0") if f]
     except subprocess.CalledProcessError:
         return []
 
 
 def _find_affected_apps(
-    changed_files: list[str], envs: list[str]
+    changed_files: Iterable[str], envs: list[str]
 ) -> list[tuple[str, Any, str]]:
+    # Index changed files once: position of each file, and the first changed
+    # file under every charts/<name>/ and kubernetes/<name>/ directory. Each
+    # app then needs a few dict lookups instead of a scan of all files.
+    position: dict[str, int] = {}
+    first_under: dict[tuple[str, str], str] = {}
+    for i, changed_file in enumerate(changed_files):
+        position.setdefault(changed_file, i)
+        parts: list[str] = changed_file.split("/", 2)
+        if len(parts) == 3 and parts[0] in ("charts", "kubernetes"):
+            first_under.setdefault((parts[0], parts[1]), changed_file)
+
     affected = []
 
     for env in envs:
         apps = list_apps_for_env(env)
         for app in apps:
-            for changed_file in changed_files:
-                conditions = [
-                    app.is_local_chart
-                    and changed_file.startswith(f"charts/{app.chart_name}/"),
-                    changed_file.startswith(f"kubernetes/{app.name}/"),
-                    changed_file in app.values_files,
-                ]
-
-                if any(conditions):
-                    affected.append((env, app, changed_file))
-                    break
+            candidates: list[str] = [f for f in app.values_files if f in position]
+            if app.is_local_chart and (
+                chart_file := first_under.get(("charts", app.chart_name))
+            ):
+                candidates.append(chart_file)
+            if kube_file := first_under.get(("kubernetes", app.name)):
+                candidates.append(kube_file)
+
+            if candidates:
+                affected.append((env, app, min(candidates, key=position.__getitem__)))
 
     return affected
 
@@ -741,31 +1241,71 @@ def _read_combined_manifest(directory: Path) -> str:
     return ""
 
 
+def _prefetch_baseline_index(
+    backend: S3StorageBackend, envs: tuple[str, ...]
+) -> dict[tuple[str, str], ManifestObject]:
+    """List the baselines of all envs concurrently, keyed by (env, app)."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=max(len(envs), 1)) as pool:
+        listings = list(pool.map(backend.list_manifest_objects, envs))
+
+    return {
+        (obj.ref.env, obj.ref.app_name): obj
+        for listing in listings
+        for obj in listing
+        if obj.ref.git_ref is None
+    }
+
+
+def _fetch_baseline(
+    backend: StorageBackend,
+    env: str,
+    app_name: str,
+    index: dict[tuple[str, str], ManifestObject] | None = None,
+) -> str | None:
+    """Read an app's baseline manifest, or None if there is none yet.
+
+    With a listing `index`, apps missing from it are known to have no
+    baseline and skip the GET, and listed ones are read by ETag and size.
+    """
+    if index is None:
+        return backend.read(ManifestRef(env=env, app_name=app_name, git_ref=None))
+
+    obj: ManifestObject | None = index.get((env, app_name))
+    if obj is None:
+        return None
+    return backend.read_object(obj)
+
+
+def _worker_backend() -> StorageBackend:
+    """The diff worker's storage backend, created on first use."""
+    if "backend" not in _diff_worker_state:
+        _diff_worker_state["backend"] = create_storage_backend(load_config())
+    return _diff_worker_state["backend"]
+
+
 def _diff_single_app(args: tuple) -> DiffResult:
-    """Diff a single app against S3 baseline."""
-    import tempfile
-
-    (
-        env,
-        app_name,
-        _chart_name,
-        _chart_repo,
-        _chart_version,
-        _values_files,
-        _namespace,
-        _release_name,
-        _is_local_chart,
-        _base_ref,
-        recursive,
-    ) = args
+    """Diff a single app against its S3 baseline content.
 
-    try:
-        cfg = load_config()
-        backend = create_storage_backend(cfg)
-        repo_root = get_repo_root()
+    The baseline is either its content (None if there is none yet) or the
+    listed `ManifestObject`, which is only downloaded if the render differs.
+    The diff text is only built when `with_content` is set.
+    """
+    env, app_name, recursive, baseline_content, with_content = args
 
-        apps = list_apps_for_env(env)
-        app = next((a for a in apps if a.name == app_name), None)
+    if "error" in _diff_worker_state:
+        return DiffResult(
+            env=env,
+            app_name=app_name,
+            has_diff=False,
+            diff_content="",
+            error=_diff_worker_state["error"],
+        )
+
+    try:
+        repo_root: Path = _diff_worker_state["repo_root"]
+        app = _diff_worker_state["apps_by_env"].get(env, {}).get(app_name)
 
         if not app:
             return DiffResult(
@@ -776,8 +1316,8 @@ def _diff_single_app(args: tuple) -> DiffResult:
                 error="App not found",
             )
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            render_dir = Path(tmpdir) / "render"
+        with _scratch_pool.acquire() as tmpdir:
+            render_dir = tmpdir / "render"
             render_dir.mkdir()
 
             if app.is_kustomize:
@@ -809,11 +1349,17 @@ def _diff_single_app(args: tuple) -> DiffResult:
                 )
 
             current_combined: str = _read_combined_manifest(render_dir)
-            current_file: Path = Path(tmpdir) / "current.yaml"
-            current_file.write_text(current_combined, encoding="utf-8")
-            ref = ManifestRef(env=env, app_name=app_name, git_ref=None)
 
-            if not backend.exists(ref):
+            if isinstance(baseline_content, ManifestObject):
+                # Only the listing was fetched; skip the download entirely
+                # when the stored object is byte-identical to this render.
+                if baseline_content.matches(current_combined):
+                    return DiffResult(
+                        env=env, app_name=app_name, has_diff=False, diff_content=""
+                    )
+                baseline_content = _worker_backend().read_object(baseline_content)
+
+            if baseline_content is None:
                 return DiffResult(
                     env=env,
                     app_name=app_name,
@@ -821,9 +1367,9 @@ def _diff_single_app(args: tuple) -> DiffResult:
                     diff_content="New app (no baseline in S3)",
                 )
 
-            baseline_content = backend.read(ref) or ""
-
-            has_diff, diff_content = _diff_manifests(baseline_content, current_combined)
+            has_diff, diff_content = _diff_manifests(
+                baseline_content, current_combined, with_content=with_content
+            )
 
             return DiffResult(
                 env=env, app_name=app_name, has_diff=has_diff, diff_content=diff_content
@@ -835,6 +1381,16 @@ def _diff_single_app(args: tuple) -> DiffResult:
         )
 
 
+def _diff_result_record(result: DiffResult) -> dict[str, Any]:
+    """Machine-readable summary of a diff result for JSON output."""
+    return {
+        "env": result.env,
+        "app": result.app_name,
+        "has_diff": result.has_diff,
+        "error": result.error,
+    }
+
+
 def _format_github_diff(
     results: list[DiffResult], changed_files: list[str], elapsed: float, workers: int
 ) -> str:
@@ -851,16 +1407,18 @@ def _format_github_diff(
     by_env: dict[str, list[DiffResult]] = {}
     for r in results_with_diff:
         by_env.setdefault(r.env, []).append(r)
+    sorted_envs: list[tuple[str, list[DiffResult]]] = sorted(by_env.items())
 
     lines.append("| Environment | Apps Changed | Changed Files |")
     lines.append("|-------------|--------------|---------------|")
 
-    for env, env_results in sorted(by_env.items()):
+    for env, env_results in sorted_envs:
         env_icon = "🔧" if env == "dev" else "🚀" if env == "prod" else "📦"
-        env_files = set()
-        for cf in changed_files:
-            if any(env in cf or app.app_name in cf for app in env_results):
-                env_files.add(cf)
+        # A file belongs to the env if it mentions the env or any changed app.
+        mentions = re.compile(
+            "|".join(map(re.escape, {env, *(r.app_name for r in env_results)}))
+        )
+        env_files = {cf for cf in changed_files if mentions.search(cf)}
         files_str = ", ".join(f"`{f}`" for f in sorted(env_files)[:3])
         if len(env_files) > 3:
             files_str += f" (+{len(env_files) - 3} more)"
@@ -868,7 +1426,7 @@ def _format_github_diff(
 
     lines.append("")
 
-    for env, env_results in sorted(by_env.items()):
+    for env, env_results in sorted_envs:
         lines.append(f"### {env}\n")
 
         for r in env_results:
@@ -896,7 +1454,12 @@ def _format_github_diff(
 @click.option("--app", "-a", "app_name", help="Name of the application to diff.")
 @click.option("--env", "-e", "env_name", help="Environment to diff (supports aliases).")
 @click.option("--base-ref", "-b", "base_ref", help="Git reference to compare against.")
-@click.option("--workers", "-w", default=4, help="Number of parallel workers.")
+@click.option(
+    "--workers",
+    "-w",
+    default=4,
+    help="Number of parallel workers (0 picks one per CPU, capped at the app count).",
+)
 @click.option(
     "--changed-only", is_flag=True, help="Only diff apps affected by changed files."
 )
@@ -915,9 +1478,9 @@ def _format_github_diff(
 @click.option(
     "--output-format",
     "-f",
-    type=click.Choice(["text", "json", "github"]),
+    type=click.Choice(["text", "json", "ndjson", "github"]),
     default="text",
-    help="Output format.",
+    help="Output format. ndjson prints one line per app as it completes.",
 )
 def render_diff(
     app_name: str | None,
@@ -964,7 +1527,7 @@ def render_diff(
         affected: list[tuple[str, Any, str]] = _find_affected_apps(changed_files, envs)
 
         if not affected:
-            if output_format == "json":
+            if output_format in ("json", "ndjson"):
                 click.echo(
                     json.dumps(
                         {
@@ -987,29 +1550,22 @@ def render_diff(
             f"Found {len(apps_to_diff)} affected apps from {len(changed_files)} changed files",
             err=True,
         )
-    elif app_name:
-        apps_to_diff = []
-        for env in envs:
-            apps = list_apps_for_env(env)
-            for app in apps:
-                if app.name == app_name and app.is_local_chart:
-                    apps_to_diff.append((env, app))
+    else:
+        apps_to_diff = [
+            (env, app)
+            for env in envs
+            for app in list_apps_for_env(env)
+            if app.is_local_chart and (app_name is None or app.name == app_name)
+        ]
 
-        if not apps_to_diff:
+        if app_name and not apps_to_diff:
             con.print_error(
                 f"Application '{app_name}' not found or doesn't use a local chart."
             )
             raise SystemExit(1)
-    else:
-        apps_to_diff = []
-        for env in envs:
-            apps = list_apps_for_env(env)
-            for app in apps:
-                if app.is_local_chart:
-                    apps_to_diff.append((env, app))
 
     if not apps_to_diff:
-        if output_format == "json":
+        if output_format in ("json", "ndjson"):
             click.echo(json.dumps({"has_diff": False, "results": []}))
         elif output_format == "github":
             click.echo("✅ **No apps to diff**\n\nNo local chart applications found.")
@@ -1017,52 +1573,206 @@ def render_diff(
             con.print_warning("No apps to diff.")
         return
 
-    diff_args = [
-        (
-            env,
-            app.name,
-            app.chart_name,
-            app.chart_repo,
-            app.chart_version,
-            app.values_files,
-            app.namespace,
-            app.release_name,
-            app.is_local_chart,
-            base_ref,
-            recursive,
-        )
-        for env, app in apps_to_diff
-    ]
+    diff_args = [(env, app.name, recursive) for env, app in apps_to_diff]
+    diff_envs: tuple[str, ...] = tuple(sorted({env for env, _ in apps_to_diff}))
+    if workers <= 0:
+        workers = min(len(diff_args), os.cpu_count() or 1)
 
     start_time: int | float = time.time()
     results: list[DiffResult] = []
 
     use_spinner: bool = output_format in ("github", "json")
 
+    try:
+        backend: StorageBackend = create_storage_backend(config)
+    except ValueError as e:
+        con.print_error(str(e))
+        con.print_hint("Run: rita config setup")
+        raise SystemExit(1) from e
+
+    # Baseline reads are network-bound, so they run on threads here sharing one
+    # pooled S3 client; the process pool only renders and compares. Each diff
+    # is submitted as soon as its baseline arrives, and at most `io_workers`
+    # apps are between fetch start and diff completion, bounding the number
+    # of baselines held in memory.
+    io_workers: int = workers * 4
+    if isinstance(backend, S3StorageBackend):
+        # Large baselines also borrow up to S3_RANGE_MAX_WORKERS connections
+        # for parallel range GETs.
+        backend.max_pool_connections = io_workers + S3_RANGE_MAX_WORKERS
+        try:
+            _ = backend.client
+        except Exception as e:
+            con.print_error(f"Failed to create S3 client: {e}")
+            con.print_hint("Check your AWS profile, or run: rita config setup")
+            raise SystemExit(1) from e
+
+    # Only the GitHub comment shows diff text; other formats report has_diff.
+    with_content: bool = output_format == "github"
+
     def _run_diff_with_progress() -> None:
-        with ThreadPoolExecutor(max_workers=workers) as executor:
-            futures = {
-                executor.submit(_diff_single_app, args): args for args in diff_args
-            }
+        from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+        from concurrent.futures.process import BrokenProcessPool
 
-            for future in as_completed(futures):
-                result = future.result()
-                results.append(result)
+        baseline_index: dict[tuple[str, str], ManifestObject] | None = None
+        if isinstance(backend, S3StorageBackend):
+            import botocore.exceptions
 
-                if output_format == "text":
-                    if result.error:
-                        click.echo(
-                            f"✗ {result.env}/{result.app_name}: {result.error}",
-                            err=True,
-                        )
-                    elif result.has_diff:
-                        click.echo(f"⚡ {result.env}/{result.app_name} has changes")
-                    else:
-                        click.echo(f"✓ {result.env}/{result.app_name} unchanged")
-                elif use_spinner and status_updater:
-                    status_updater.update(
-                        f"Diffing apps... ({len(results)}/{len(diff_args)})"
+            try:
+                baseline_index = _prefetch_baseline_index(backend, diff_envs)
+            except (botocore.exceptions.BotoCoreError, botocore.exceptions.ClientError):
+                # Listing can fail where reads succeed (no s3:ListBucket);
+                # fall back to one GET per app, which reports its own errors.
+                baseline_index = None
+
+        def _listed_baseline(env: str, name: str) -> ManifestObject | None:
+            # Single-part uploads can be compared by ETag after rendering,
+            # so their download is deferred to the worker.
+            if baseline_index is None:
+                return None
+            obj: ManifestObject | None = baseline_index.get((env, name))
+            if obj is None or "-" in obj.etag:
+                return None
+            return obj
+
+        if len(diff_args) == 1:
+            # A single app isn't worth starting worker processes for.
+            env, name, recursive_ = diff_args[0]
+            _init_diff_worker(diff_envs)
+            _diff_worker_state["backend"] = backend
+            try:
+                baseline: str | ManifestObject | None = _listed_baseline(
+                    env, name
+                ) or _fetch_baseline(backend, env, name, baseline_index)
+            except Exception as e:
+                result = DiffResult(
+                    env=env, app_name=name, has_diff=False, diff_content="", error=str(e)
+                )
+            else:
+                result = _diff_single_app(
+                    (env, name, recursive_, baseline, with_content)
+                )
+            results.append(result)
+            _report(result)
+            return
+
+        pending: Iterator[tuple[str, str, bool]] = iter(diff_args)
+        fetches: dict[Future, tuple[str, str, bool]] = {}
+        diffs: dict[Future, tuple[str, str, ProcessPoolExecutor]] = {}
+
+        def _worker_died(
+            env: str, name: str, pool: ProcessPoolExecutor, error: Exception
+        ) -> DiffResult:
+            # A killed worker (e.g. out of memory) breaks its whole pool;
+            # later diffs are submitted to a fresh one.
+            _discard_pool(pool)
+            return DiffResult(
+                env=env,
+                app_name=name,
+                has_diff=False,
+                diff_content="",
+                error=f"Diff worker exited unexpectedly: {error}",
+            )
+
+        def _submit_diff(
+            env: str, name: str, recursive_: bool, baseline: str | ManifestObject | None
+        ) -> None:
+            pool = _get_diff_pool(workers, diff_envs)
+            try:
+                diff = pool.submit(
+                    _diff_single_app, (env, name, recursive_, baseline, with_content)
+                )
+            except BrokenProcessPool as e:
+                result = _worker_died(env, name, pool, e)
+                results.append(result)
+                _report(result)
+            else:
+                diffs[diff] = (env, name, pool)
+
+        with ThreadPoolExecutor(max_workers=io_workers) as io_pool:
+
+            def _start_fetches() -> None:
+                while len(fetches) + len(diffs) < io_workers:
+                    args = next(pending, None)
+                    if args is None:
+                        return
+                    env, name, recursive_ = args
+                    listed: ManifestObject | None = _listed_baseline(env, name)
+                    if listed is not None:
+                        _submit_diff(env, name, recursive_, listed)
+                        continue
+                    fetch = io_pool.submit(
+                        _fetch_baseline, backend, env, name, baseline_index
                     )
+                    fetches[fetch] = args
+
+            _start_fetches()
+            while fetches or diffs:
+                done, _ = wait(
+                    [*fetches, *diffs],
+                    timeout=_OUTPUT_FLUSH_SECONDS,
+                    return_when=FIRST_COMPLETED,
+                )
+                for future in done:
+                    if future in diffs:
+                        env, name, pool = diffs.pop(future)
+                        try:
+                            result: DiffResult = future.result()
+                        except BrokenProcessPool as e:
+                            result = _worker_died(env, name, pool, e)
+                    else:
+                        env, name, recursive_ = fetches.pop(future)
+                        try:
+                            baseline: str | None = future.result()
+                        except Exception as e:
+                            result = DiffResult(
+                                env=env,
+                                app_name=name,
+                                has_diff=False,
+                                diff_content="",
+                                error=str(e),
+                            )
+                        else:
+                            _submit_diff(env, name, recursive_, baseline)
+                            continue
+                    results.append(result)
+                    _report(result)
+                _flush_output()
+                _start_fetches()
+
+    # Streamed per-app lines are written in batches: hundreds of apps can
+    # finish within a second, and each echo is a separate write.
+    out_lines: list[str] = []
+    err_lines: list[str] = []
+    last_flush: float = time.monotonic()
+
+    def _flush_output(force: bool = False) -> None:
+        nonlocal last_flush
+        due: bool = time.monotonic() - last_flush >= _OUTPUT_FLUSH_SECONDS
+        if not (force or due or len(out_lines) + len(err_lines) >= 25):
+            return
+        if err_lines:
+            click.echo("\n".join(err_lines), err=True)
+            err_lines.clear()
+        if out_lines:
+            click.echo("\n".join(out_lines))
+            out_lines.clear()
+        last_flush = time.monotonic()
+
+    def _report(result: DiffResult) -> None:
+        if output_format == "text":
+            if result.error:
+                err_lines.append(f"✗ {result.env}/{result.app_name}: {result.error}")
+            elif result.has_diff:
+                out_lines.append(f"⚡ {result.env}/{result.app_name} has changes")
+            else:
+                out_lines.append(f"✓ {result.env}/{result.app_name} unchanged")
+        elif output_format == "ndjson":
+            out_lines.append(
+                json.dumps(_diff_result_record(result), separators=(",", ":"))
+            )
+        elif use_spinner and status_updater:
+            status_updater.update(f"Diffing apps... ({len(results)}/{len(diff_args)})")
 
     status_updater = None
     if use_spinner:
@@ -1071,6 +1781,7 @@ def render_diff(
             _run_diff_with_progress()
     else:
         _run_diff_with_progress()
+    _flush_output(force=True)
 
     elapsed: int | float = time.time() - start_time
 
@@ -1078,17 +1789,17 @@ def render_diff(
         output_data = {
             "has_diff": any(r.has_diff for r in results),
             "elapsed_seconds": elapsed,
-            "results": [
-                {
-                    "env": r.env,
-                    "app": r.app_name,
-                    "has_diff": r.has_diff,
-                    "error": r.error,
-                }
-                for r in results
-            ],
+            "results": [_diff_result_record(r) for r in results],
         }
         click.echo(json.dumps(output_data, indent=2))
+    elif output_format == "ndjson":
+        # Results were streamed as they completed; finish with the summary.
+        summary = {
+            "has_diff": any(r.has_diff for r in results),
+            "elapsed_seconds": elapsed,
+            "count": len(results),
+        }
+        click.echo(json.dumps(summary, separators=(",", ":")))
     elif output_format == "github":
         click.echo(_format_github_diff(results, changed_files, elapsed, workers))
     else:
@@ -1106,14 +1817,38 @@ def render_diff(
             con.print_success(f"No changes detected ({elapsed:.1f}s)")
 
 
+def _fast_rmtree(path: Path, workers: int = 8) -> None:
+    """Remove a directory tree, unlinking its files on a thread pool.
+
+    Rendered trees hold many small files, so overlapping the unlink calls
+    beats rmtree's one-at-a-time walk. Symlinks are removed, not followed.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    files: list[str] = []
+    dirs: list[str] = [str(path)]
+    for directory in dirs:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    dirs.append(entry.path)
+                else:
+                    files.append(entry.path)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(os.unlink, files))
+
+    # Directories were discovered parents-first; remove them children-first.
+    for directory in reversed(dirs):
+        Path(directory).rmdir()
+
+
 @render.command("clean")
 @click.option("--env", "-e", help="Environment to clean.")
 @click.option("--all", "clean_all", is_flag=True, help="Clean all rendered manifests.")
 @click.option("--dry-run", is_flag=True, help="Show what would be deleted.")
 def render_clean(env: str | None, clean_all: bool, dry_run: bool) -> None:
     """Remove rendered manifests."""
-    import shutil
-
     repo_root: Path = get_repo_root()
     rendered_dir: Path = repo_root / "rendered"
 
@@ -1125,7 +1860,7 @@ def render_clean(env: str | None, clean_all: bool, dry_run: bool) -> None:
         if dry_run:
             con.print_info(f"Would remove: {rendered_dir}")
         else:
-            shutil.rmtree(rendered_dir)
+            _fast_rmtree(rendered_dir)
             con.print_success("Removed all rendered manifests")
     elif env:
         env_dir: Path = rendered_dir / env
@@ -1136,7 +1871,7 @@ def render_clean(env: str | None, clean_all: bool, dry_run: bool) -> None:
         if dry_run:
             con.print_info(f"Would remove: {env_dir}")
         else:
-            shutil.rmtree(env_dir)
+            _fast_rmtree(env_dir)
             con.print_success(f"Removed rendered manifests for {env}")
     else:
         con.print_error("Specify --env or --all")
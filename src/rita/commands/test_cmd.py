@@ -6,7 +6,7 @@ from pathlib import Path
 
 import rich_click as click
 
-from rita.repository import get_chart_path, get_repo_root, list_apps_for_env
+from rita.repository import apps_by_name, get_chart_path, get_repo_root
 from rita.testing import (
     ChartTestResult,
     KindClusterManager,
@@ -138,8 +138,7 @@ def test_dry_run(
             values_files=values_files,
         )
     else:
-        apps = list_apps_for_env(env)
-        app = next((a for a in apps if a.name == app_name), None)
+        app = apps_by_name(env).get(app_name)
 
         if not app:
             click.echo(f"Error: Application '{app_name}' not found in {env}.", err=True)
@@ -207,8 +206,7 @@ def test_deploy(
         namespace = "default"
         values_files = None
     else:
-        apps = list_apps_for_env(env)
-        app = next((a for a in apps if a.name == app_name), None)
+        app = apps_by_name(env).get(app_name)
 
         if not app:
             click.echo(f"Error: Application '{app_name}' not found in {env}.", err=True)
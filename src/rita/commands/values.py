@@ -2,14 +2,24 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import rich_click as click
 from rich.prompt import Prompt
 
 from rita import console as con
 from rita.helm import list_helm_chart_versions, pull_helm_chart_values
-from rita.repository import get_repo_root, list_apps_for_env, list_available_envs
+from rita.repository import (
+    apps_by_name,
+    get_repo_root,
+    list_apps_for_env,
+    list_available_envs,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
 
 
 @click.group()
@@ -69,8 +79,7 @@ def values_list(env: str, all_envs: bool) -> None:
 )
 def values_versions(app_name: str, env: str, max_versions: int) -> None:
     """List available versions of a Helm chart."""
-    apps = list_apps_for_env(env)
-    app = next((a for a in apps if a.name == app_name), None)
+    app = apps_by_name(env).get(app_name)
 
     if not app:
         con.print_error(f"Application '{app_name}' not found in {env}.")
@@ -151,8 +160,7 @@ def values_fetch(
     use_current: bool,
 ) -> None:
     """Fetch default values from a Helm chart."""
-    apps = list_apps_for_env(env)
-    app = next((a for a in apps if a.name == app_name), None)
+    app = apps_by_name(env).get(app_name)
 
     if not app:
         con.print_error(f"Application '{app_name}' not found in {env}.")
@@ -235,6 +243,21 @@ def values_fetch(
         raise SystemExit(1)
 
 
+def _iter_temp_files(root: Path) -> Iterator[Path]:
+    """Yield every *.temp.yaml under root, without following symlinks.
+
+    Uses the file type scandir already read, so no entry needs a stat call.
+    """
+    stack: list[str] = [str(root)]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(".temp.yaml"):
+                    yield Path(entry.path)
+
+
 @values.command("clean")
 @click.option(
     "--path",
@@ -257,19 +280,22 @@ def values_clean(search_path: str, dry_run: bool) -> None:
         con.print_warning(f"Path not found: {search_dir}")
         return
 
-    temp_files: list[Path] = list(search_dir.rglob("*.temp.yaml"))
+    temp_files: list[Path] = sorted(_iter_temp_files(search_dir))
 
     if not temp_files:
         con.console.print("No .temp.yaml files found.")
         return
 
-    for temp_file in temp_files:
-        rel_path: Path = temp_file.relative_to(repo_root)
-        if dry_run:
-            con.console.print(f"Would delete: {rel_path}")
-        else:
-            temp_file.unlink()
-            con.console.print(f"Deleted: {rel_path}")
+    if not dry_run:
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(os.unlink, temp_files))
+
+    verb: str = "Would delete" if dry_run else "Deleted"
+    con.console.print(
+        "\n".join(f"{verb}: {f.relative_to(repo_root)}" for f in temp_files)
+    )
 
     if dry_run:
         con.console.print(f"\n{len(temp_files)} files would be deleted.")
@@ -6,28 +6,65 @@ with support for auto-discovery of ArgoCD applications.
 
 from __future__ import annotations
 
+import copy
 import json
 import os
+import re
+import threading
 from dataclasses import dataclass, field
+from functools import cache, lru_cache
 from pathlib import Path
 from typing import Any
+from urllib.parse import urlparse
 
 import yaml
+from yaml.representer import SafeRepresenter
 
 try:
-    import boto3
-    from botocore.exceptions import ClientError
-
-    HAS_BOTO3 = True
+    from yaml import CSafeDumper as _SafeDumper
+    from yaml import CSafeLoader as _SafeLoader
 except ImportError:
-    HAS_BOTO3 = False
-    boto3 = None  # type: ignore[assignment]
-    ClientError = Exception  # type: ignore[misc,assignment]
+    from yaml import SafeDumper as _SafeDumper  # type: ignore[assignment]
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
 
 CONFIG_FILE_NAME = ".rita.yaml"
 
+_ENV_VAR_RE: re.Pattern[str] = re.compile(r"\$(?:\{(.*)\}|(.*))", re.DOTALL)
+"""An env var reference, `${NAME}` or `$NAME`; every `$`-prefixed value matches."""
+
+DOCKER_HUB_HOSTS: frozenset[str] = frozenset(
+    {"docker.io", "index.docker.io", "registry-1.docker.io"}
+)
+"""Hostnames that all refer to Docker Hub."""
+
+
+class _RitaDumper(_SafeDumper):
+    """Safe YAML dumper for config files, with representers registered once at import."""
+
+    def ignore_aliases(self, data: Any) -> bool:  # noqa: ARG002
+        # Configs built in code (e.g. by `rita init`) may share list objects
+        # between entries; always emit plain values rather than &id anchors.
+        return True
+
+
+_RitaDumper.add_representer(tuple, SafeRepresenter.represent_list)
+
+
+def _registry_host(url: str) -> str:
+    """Extract the lowercase hostname from a registry URL, with or without a scheme."""
+    parsed = urlparse(url if "://" in url else f"//{url}")
+    return parsed.hostname or ""
+
+
+def _registry_match_url(url: str) -> str:
+    return url.lower().removeprefix("https://").removeprefix("http://")
+
 
-@dataclass
+def _mentions_docker_hub(match_url: str) -> bool:
+    return any(host in match_url for host in DOCKER_HUB_HOSTS)
+
+
+@dataclass(slots=True)
 class EnvironmentConfig:
     """Configuration for a single environment."""
 
@@ -51,7 +88,7 @@ class EnvironmentConfig:
     """Glob patterns to exclude when searching for applications."""
 
 
-@dataclass
+@dataclass(slots=True)
 class ChartConfig:
     """Configuration for charts."""
 
@@ -62,7 +99,7 @@ class ChartConfig:
     """Default OCI registry for charts."""
 
 
-@dataclass
+@dataclass(slots=True)
 class StorageConfig:
     """Configuration for manifest storage backend."""
 
@@ -85,7 +122,7 @@ class StorageConfig:
     """Custom S3 endpoint URL for S3-compatible storage (Garage, MinIO, etc.)."""
 
 
-@dataclass
+@dataclass(slots=True)
 class RenderConfig:
     """Configuration for manifest rendering."""
 
@@ -102,7 +139,7 @@ class RenderConfig:
     """Default branch to compare against when diffing."""
 
 
-@dataclass
+@dataclass(slots=True)
 class RegistryConfig:
     """Configuration for an OCI registry authentication."""
 
@@ -118,8 +155,22 @@ class RegistryConfig:
     aws_secret_name: str | None = None
     """AWS Secrets Manager secret name containing credentials (JSON with 'username' and 'password' keys)."""
 
+    host: str = field(default="", init=False, repr=False, compare=False)
+    """Normalized hostname of the registry URL, computed once on construction."""
+
+    match_url: str = field(default="", init=False, repr=False, compare=False)
+    """Lowercase URL without its scheme, as matched by get_registry_credentials."""
+
+    is_docker_hub: bool = field(default=False, init=False, repr=False, compare=False)
+    """Whether the URL refers to Docker Hub under any of its hostnames."""
 
-@dataclass
+    def __post_init__(self) -> None:
+        self.host = _registry_host(self.url)
+        self.match_url = _registry_match_url(self.url)
+        self.is_docker_hub = _mentions_docker_hub(self.match_url)
+
+
+@dataclass(slots=True)
 class ChartTestConfig:
     """Configuration for ephemeral cluster testing."""
 
@@ -139,7 +190,7 @@ class ChartTestConfig:
     """Manifests to install before testing (e.g., CRDs)."""
 
 
-@dataclass
+@dataclass(slots=True)
 class RitaConfig:
     """Main configuration for rita."""
 
@@ -300,33 +351,38 @@ class RitaConfig:
                 "cleanup_on_failure": self.test.cleanup_on_failure,
                 "pre_install_manifests": self.test.pre_install_manifests,
             },
-            "registries": [
-                {
-                    k: v
-                    for k, v in {
-                        "url": reg.url,
-                        "username": reg.username,
-                        "password": reg.password,
-                        "aws_secret_name": reg.aws_secret_name,
-                    }.items()
-                    if v is not None
-                }
-                for reg in self.registries
-            ]
-            if self.registries
-            else [],
+            "registries": [_registry_to_dict(reg) for reg in self.registries],
         }
 
 
+def _registry_to_dict(reg: RegistryConfig) -> dict[str, str]:
+    """Serialize a registry, leaving out fields that are not set."""
+    reg_dict: dict[str, str] = {}
+    for key in ("url", "username", "password", "aws_secret_name"):
+        value: str | None = getattr(reg, key)
+        if value is not None:
+            reg_dict[key] = value
+    return reg_dict
+
+
 def find_config_file(start_path: Path | None = None) -> Path | None:
     """Find the config file by walking up the directory tree.
 
     Starts from start_path (or cwd) and walks up looking for .rita.yaml.
+    The walk is memoized per starting directory; a found file is re-checked
+    on each call, and clear_config_cache() forgets missing ones.
     """
-    if start_path is None:
-        start_path: Path = Path.cwd()
+    start: str = str((start_path if start_path is not None else Path.cwd()).absolute())
+    found: Path | None = _find_config_file(start)
+    if found is not None and not found.exists():
+        _find_config_file.cache_clear()
+        found = _find_config_file(start)
+    return found
 
-    current: Path = start_path
+
+@lru_cache(maxsize=32)
+def _find_config_file(start: str) -> Path | None:
+    current: Path = Path(start)
     while current != current.parent:
         config_path: Path = current / CONFIG_FILE_NAME
         if config_path.exists():
@@ -345,11 +401,27 @@ def load_config(config_path: Path | None = None) -> RitaConfig:
     if config_path is None:
         config_path: Path | None = find_config_file()
 
-    if config_path is None or not config_path.exists():
+    if config_path is None:
+        return RitaConfig.get_default()
+
+    try:
+        stat: os.stat_result = config_path.stat()
+    except FileNotFoundError:
         return RitaConfig.get_default()
 
-    with config_path.open(encoding="utf-8") as f:
-        data = yaml.safe_load(f) or {}
+    # Callers may edit the config before saving it, so never hand out the
+    # cached instance itself.
+    return copy.deepcopy(
+        _load_config_file(str(config_path.resolve()), stat.st_mtime_ns, stat.st_size)
+    )
+
+
+@lru_cache(maxsize=8)
+def _load_config_file(path: str, mtime_ns: int, size: int) -> RitaConfig:  # noqa: ARG001
+    # mtime_ns and size are only part of the cache key: editing the file
+    # changes them and forces a re-parse.
+    with Path(path).open(encoding="utf-8") as f:
+        data = yaml.load(f, Loader=_SafeLoader) or {}
 
     return RitaConfig.from_dict(data)
 
@@ -357,13 +429,33 @@ def load_config(config_path: Path | None = None) -> RitaConfig:
 def save_config(config: RitaConfig, config_path: Path) -> None:
     """Save configuration to a file."""
     with config_path.open("w", encoding="utf-8") as f:
-        yaml.safe_dump(config.to_dict(), f, default_flow_style=False, sort_keys=False)
+        yaml.dump(
+            config.to_dict(),
+            f,
+            Dumper=_RitaDumper,
+            default_flow_style=False,
+            sort_keys=False,
+        )
+    # A quick rewrite can keep the same mtime and size.
+    clear_config_cache()
+
 
+def clear_config_cache() -> None:
+    """Forget config files found and parsed so far, e.g. after writing one."""
+    _find_config_file.cache_clear()
+    _load_config_file.cache_clear()
 
+
+@cache
 def generate_default_config() -> str:
-    """Generate default configuration as YAML string."""
+    """Generate default configuration as YAML string.
+
+    The defaults never change within a process, so the YAML is built once.
+    """
     config: RitaConfig = RitaConfig.get_default()
-    return yaml.safe_dump(config.to_dict(), default_flow_style=False, sort_keys=False)
+    return yaml.dump(
+        config.to_dict(), Dumper=_RitaDumper, default_flow_style=False, sort_keys=False
+    )
 
 
 def resolve_environment(config: RitaConfig, env_name: str) -> EnvironmentConfig | None:
@@ -407,16 +499,39 @@ def resolve_env_var(value: str | None) -> str | None:
 
     Returns None if the value is None or if the env var is not set.
     """
-    if value is None:
-        return None
+    if value is None or not value.startswith("$"):
+        return value
+
+    match: re.Match[str] | None = _ENV_VAR_RE.fullmatch(value)
+    if match is None or match.lastindex is None:
+        return value
+    return os.environ.get(match[match.lastindex])
 
-    if value.startswith("$"):
-        var_name: str = value[1:]
-        if var_name.startswith("{") and var_name.endswith("}"):
-            var_name: str = var_name[1:-1]
-        return os.environ.get(var_name)
 
-    return value
+# Secrets Manager clients and fetched secrets, kept for the process lifetime:
+# a boto3 session takes hundreds of ms to build and every OCI chart pull asks
+# for the same registry credentials.
+_secrets_clients: dict[tuple[str | None, str | None], Any] = {}
+_fetched_secrets: dict[tuple[str, str | None, str | None], dict[str, str]] = {}
+_secrets_lock = threading.Lock()
+
+
+def _secretsmanager_client(region: str | None, profile: str | None) -> Any:
+    """Return the Secrets Manager client for a region and profile, built once."""
+    import boto3
+
+    key: tuple[str | None, str | None] = (region, profile)
+    with _secrets_lock:
+        client: Any = _secrets_clients.get(key)
+        if client is None:
+            session_kwargs: dict[str, str] = {}
+            if profile:
+                session_kwargs["profile_name"] = profile
+            if region:
+                session_kwargs["region_name"] = region
+            session = boto3.Session(**session_kwargs)
+            client = _secrets_clients[key] = session.client("secretsmanager")
+    return client
 
 
 def fetch_secret_from_aws(
@@ -425,29 +540,33 @@ def fetch_secret_from_aws(
     """Fetch a secret from AWS Secrets Manager.
 
     Returns the secret as a dictionary, or None if fetch fails.
+    Successful fetches are reused for the rest of the process.
     NEVER logs the secret values.
     """
-    if not HAS_BOTO3:
-        return None
-
+    # boto3 is imported here rather than at module level: it takes a few
+    # hundred ms to load and most commands never fetch a secret.
     try:
-        session_kwargs: dict[str, str] = {}
-        if (
-            profile
-            and not os.environ.get("CI")
-            and not os.environ.get("GITHUB_ACTIONS")
-        ):
-            session_kwargs["profile_name"] = profile
-        if region:
-            session_kwargs["region_name"] = region
+        from botocore.exceptions import ClientError
+    except ImportError:
+        return None
 
-        session = boto3.Session(**session_kwargs)
-        client = session.client("secretsmanager")
+    if profile and (os.environ.get("CI") or os.environ.get("GITHUB_ACTIONS")):
+        profile = None
+    key: tuple[str, str | None, str | None] = (secret_name, region, profile)
+    with _secrets_lock:
+        cached: dict[str, str] | None = _fetched_secrets.get(key)
+    if cached is not None:
+        return dict(cached)
 
+    try:
+        client: Any = _secretsmanager_client(region, profile)
         response = client.get_secret_value(SecretId=secret_name)
         secret_string = response.get("SecretString")
         if secret_string:
-            return json.loads(secret_string)
+            secret: dict[str, str] = json.loads(secret_string)
+            with _secrets_lock:
+                _fetched_secrets[key] = secret
+            return dict(secret)
     except (ClientError, json.JSONDecodeError, Exception):
         pass
 
@@ -468,19 +587,14 @@ def get_registry_credentials(
     Returns (None, None) if no matching registry is configured.
     NEVER logs credential values.
     """
-    for reg in config.registries:
-        config_url: str = reg.url.lower().replace("https://", "").replace("http://", "")
-        target_url: str = (
-            registry_url.lower().replace("https://", "").replace("http://", "")
-        )
-        docker_domains = ["docker.io", "registry-1.docker.io", "index.docker.io"]
-        config_is_docker: bool = any(d in config_url for d in docker_domains)
-        target_is_docker: bool = any(d in target_url for d in docker_domains)
+    target_url: str = _registry_match_url(registry_url)
+    target_is_docker: bool = _mentions_docker_hub(target_url)
 
+    for reg in config.registries:
         if (
-            (config_is_docker and target_is_docker)
-            or config_url in target_url
-            or target_url in config_url
+            (reg.is_docker_hub and target_is_docker)
+            or reg.match_url in target_url
+            or target_url in reg.match_url
         ):
             if reg.aws_secret_name:
                 region = None
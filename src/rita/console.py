@@ -9,19 +9,19 @@ from __future__ import annotations
 from contextlib import contextmanager
 from typing import TYPE_CHECKING, Literal, LiteralString
 
-if TYPE_CHECKING:
-    from collections.abc import Generator
-
+# Only what every command needs is imported eagerly; rich.text comes along with
+# rich.console anyway. Panels, tables, syntax highlighting (pygments) and live
+# displays are imported where they are used, which keeps `rita --help` fast.
 from rich.console import Console
-from rich.live import Live
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
-from rich.spinner import Spinner
-from rich.syntax import Syntax
-from rich.table import Table
 from rich.text import Text
 from rich.theme import Theme
 
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+    from rich.progress import Progress
+    from rich.table import Table
+
 RITA_THEME = Theme(
     {
         "info": "cyan",
@@ -41,8 +41,10 @@ RITA_THEME = Theme(
 )
 
 
-console = Console(theme=RITA_THEME)
-err_console = Console(theme=RITA_THEME, stderr=True)
+# Output is styled explicitly through the theme, so Rich's regex highlighter
+# (numbers, paths, URLs) is off; it roughly doubled the cost of each print.
+console = Console(theme=RITA_THEME, highlight=False)
+err_console = Console(theme=RITA_THEME, stderr=True, highlight=False)
 
 
 def print_success(message: str, prefix: str = "✓") -> None:
@@ -90,6 +92,18 @@ def print_key_value(key: str, value: str, indent: int = 0) -> None:
     console.print(f"{spaces}[muted]{key}:[/muted] {value}")
 
 
+def print_key_value_batch(items: list[tuple[str, str]], indent: int = 0) -> None:
+    """Print several key-value pairs as one aligned block in a single write."""
+    from rich.table import Table
+
+    table: Table = Table.grid(padding=(0, 1))
+    table.add_column(style="muted")
+    table.add_column()
+    for key, value in items:
+        table.add_row(f"{'  ' * indent}{key}:", value)
+    console.print(table)
+
+
 def print_bullet(text: str, indent: int = 1) -> None:
     """Print a bullet point."""
     spaces: LiteralString = "  " * indent
@@ -145,6 +159,8 @@ def format_local_marker(is_local: bool) -> str:
 
 def create_table(title: str | None = None, show_header: bool = True) -> Table:
     """Create a styled table."""
+    from rich.table import Table
+
     return Table(
         title=title,
         show_header=show_header,
@@ -154,6 +170,18 @@ def create_table(title: str | None = None, show_header: bool = True) -> Table:
     )
 
 
+# Pre-styled table cells: Rich parses markup strings on every add_row, while
+# Text instances are used as they are.
+_CHECK_MARKS: dict[bool, Text] = {
+    True: Text("✓", style="success"),
+    False: Text("✗", style="error"),
+}
+_LOCAL_MARKERS: dict[bool, Text] = {
+    True: Text("📦", style="chart"),
+    False: Text("🌐", style="muted"),
+}
+
+
 def print_chart_list(charts: list[tuple[str, bool]]) -> None:
     """Print a list of charts with their existence status."""
     table: Table = create_table()
@@ -161,8 +189,7 @@ def print_chart_list(charts: list[tuple[str, bool]]) -> None:
     table.add_column("Chart", style="chart")
 
     for chart_name, exists in charts:
-        status: str = format_check(exists)
-        table.add_row(status, chart_name)
+        table.add_row(_CHECK_MARKS[exists], chart_name)
 
     console.print(table)
 
@@ -181,9 +208,10 @@ def print_app_list(apps: list[tuple[str, str, str, str, bool, list[str]]]) -> No
     table.add_column("Values", style="muted")
 
     for name, chart_name, version, namespace, is_local, values_files in apps:
-        marker: str = format_local_marker(is_local)
         values: str = ", ".join(values_files) if values_files else "-"
-        table.add_row(marker, name, chart_name, version, namespace, values)
+        table.add_row(
+            _LOCAL_MARKERS[is_local], name, chart_name, version, namespace, values
+        )
 
     console.print(table)
 
@@ -202,6 +230,9 @@ def print_env_list(envs: list[tuple[str, int]]) -> None:
 
 def print_yaml(content: str, title: str | None = None) -> None:
     """Print YAML content with syntax highlighting."""
+    from rich.panel import Panel
+    from rich.syntax import Syntax
+
     syntax = Syntax(content, "yaml", theme="monokai", line_numbers=False)
     if title:
         console.print(Panel(syntax, title=title, border_style="muted"))
@@ -211,6 +242,9 @@ def print_yaml(content: str, title: str | None = None) -> None:
 
 def print_json(content: str, title: str | None = None) -> None:
     """Print JSON content with syntax highlighting."""
+    from rich.panel import Panel
+    from rich.syntax import Syntax
+
     syntax = Syntax(content, "json", theme="monokai", line_numbers=False)
     if title:
         console.print(Panel(syntax, title=title, border_style="muted"))
@@ -218,26 +252,39 @@ def print_json(content: str, title: str | None = None) -> None:
         console.print(syntax)
 
 
+_DIFF_LINE_STYLES: dict[str, str] = {"+": "green", "-": "red"}
+
+
 def print_diff(diff_lines: list[str]) -> None:
     """Print diff output with appropriate coloring."""
-    for line in diff_lines:
-        if line.startswith("+") and not line.startswith("+++"):
-            console.print(f"[green]{line.rstrip()}[/green]")
-        elif line.startswith("-") and not line.startswith("---"):
-            console.print(f"[red]{line.rstrip()}[/red]")
-        elif line.startswith("@@"):
-            console.print(f"[cyan]{line.rstrip()}[/cyan]")
-        else:
-            console.print(line.rstrip())
+    if not diff_lines:
+        return
+    # One styled Text printed once, rather than a markup string parsed and
+    # written per line; it also keeps `[...]` in manifests from reading as markup.
+    text = Text()
+    for i, line in enumerate(diff_lines):
+        if i:
+            text.append("\n")
+        style: str | None = None
+        if line.startswith("@@"):
+            style = "cyan"
+        elif not line.startswith(("+++", "---")):
+            style = _DIFF_LINE_STYLES.get(line[:1])
+        text.append(line.rstrip(), style=style)
+    console.print(text)
 
 
 def print_panel(content: str, title: str | None = None, style: str = "info") -> None:
     """Print content in a panel/box."""
+    from rich.panel import Panel
+
     console.print(Panel(content, title=title, border_style=style))
 
 
 def print_banner(title: str, subtitle: str | None = None) -> None:
     """Print a banner/header for the CLI."""
+    from rich.panel import Panel
+
     text = Text()
     text.append(title, style="bold magenta")
     if subtitle:
@@ -263,15 +310,27 @@ def print_summary(success: int, errors: int) -> None:
         )
 
 
-def print_lore(text: str) -> None:
-    """Print the RITA lore with styling."""
+_LORE_TITLE = Text("✨ RITA Lore ✨", style="bold magenta")
+
+
+def print_lore(text: str | Text) -> None:
+    """Print the RITA lore with styling.
+
+    The lore is decorative plain text, so it skips markup, emoji and highlighting.
+    """
+    from rich.panel import Panel
+
+    body: Text = Text(text) if isinstance(text, str) else text
     console.print(
         Panel(
-            text,
-            title="[bold magenta]✨ RITA Lore ✨[/bold magenta]",
+            body,
+            title=_LORE_TITLE,
             border_style="magenta",
             padding=(1, 2),
-        )
+        ),
+        markup=False,
+        highlight=False,
+        emoji=False,
     )
 
 
@@ -309,6 +368,9 @@ def spinner(
         with spinner("Rendering...", done_message="Rendered 5 charts"):
             do_long_task()
     """
+    from rich.live import Live
+    from rich.spinner import Spinner
+
     spin = Spinner("dots", text=f" {message}", style="cyan")
     with Live(spin, console=console, refresh_per_second=10, transient=True):
         yield
@@ -327,6 +389,8 @@ def status(message: str) -> Generator[StatusUpdater]:
                 s.update(f"Rendering {chart.name}... ({i+1}/{len(charts)})")
                 render_chart(chart)
     """
+    from rich.live import Live
+
     updater = StatusUpdater(message)
     with Live(updater.spinner, console=console, refresh_per_second=10, transient=True):
         yield updater
@@ -336,6 +400,8 @@ class StatusUpdater:
     """Helper class for updating spinner status text."""
 
     def __init__(self, initial_message: str):
+        from rich.spinner import Spinner
+
         self.message = initial_message
         self.spinner = Spinner("dots", text=f" {initial_message}", style="cyan")
 
@@ -357,6 +423,8 @@ def create_progress(
                 render_app(app)
                 progress.advance(task)
     """
+    from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
+
     columns = [
         SpinnerColumn("dots"),
         TextColumn("[progress.description]{task.description}"),
@@ -364,4 +432,7 @@ def create_progress(
     if show_time:
         columns.append(TimeElapsedColumn())
 
-    return Progress(*columns, console=console, transient=True)
+    # Off a terminal the live display would only leave a stray blank line.
+    return Progress(
+        *columns, console=console, transient=True, disable=not console.is_terminal
+    )
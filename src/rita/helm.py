@@ -3,18 +3,36 @@
 from __future__ import annotations
 
 import contextlib
+import hashlib
 import json
+import math
 import os
+import re
 import shutil
 import subprocess
 import tempfile
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
 from subprocess import CompletedProcess
-from typing import TYPE_CHECKING, Any, TypedDict
+from typing import IO, TYPE_CHECKING, Any, TypedDict
 
 import yaml
 
+try:
+    import fcntl
+except ImportError:  # Windows: only threads in this process are serialized
+    fcntl = None  # type: ignore[assignment]
+
+try:
+    from yaml import CSafeDumper as _SafeDumper
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeDumper as _SafeDumper  # type: ignore[assignment]
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
 if TYPE_CHECKING:
     from collections.abc import Callable
 
@@ -31,8 +49,9 @@ from rita.storage import (
     AWSTokenExpiredError,
     S3StorageBackend,
     download_cached_chart,
+    get_cache_dir,
     get_chart_cache,
-    upload_chart_to_cache,
+    queue_chart_upload,
 )
 
 
@@ -55,7 +74,7 @@ class ChartMetadata(TypedDict, total=False):
     dependencies: list[dict[str, Any]]
 
 
-OCI_REGISTRY_INDICATORS = [
+OCI_REGISTRY_INDICATORS = (
     "ghcr.io",
     "gcr.io",
     "azurecr.io",
@@ -64,16 +83,23 @@ OCI_REGISTRY_INDICATORS = [
     "docker.io",
     "registry.io",
     "quay.io",
-]
+)
 
-TRADITIONAL_REPO_INDICATORS = [
+TRADITIONAL_REPO_INDICATORS = (
     "github.io",
     "charts.",
     "/charts",
     "/helm",
     "hub.jupyter.org",
     "tigera.io",
-]
+)
+
+
+# A plain top-level `version:` scalar; anything fancier falls back to YAML.
+_CHART_VERSION_RE: re.Pattern[bytes] = re.compile(
+    rb"^version:[ \t]*[\"']?([^\s\"'#|>&*!{\[][^\s\"'#]*)", re.MULTILINE
+)
+_CHART_HEAD_BYTES = 2048
 
 
 def get_local_chart_version(chart_path: Path) -> str | None:
@@ -82,24 +108,43 @@ def get_local_chart_version(chart_path: Path) -> str | None:
         return None
 
     try:
+        # `version` sits near the top of Chart.yaml, ahead of descriptions and
+        # dependency lists, so usually the first few lines are enough.
+        with chart_yaml.open("rb") as f:
+            head: bytes = f.read(_CHART_HEAD_BYTES)
+        if len(head) == _CHART_HEAD_BYTES:
+            head = head[: head.rfind(b"\n") + 1]
+        match: re.Match[bytes] | None = _CHART_VERSION_RE.search(head)
+        if match:
+            return match[1].decode()
+
         with chart_yaml.open(encoding="utf-8") as f:
-            chart_data: Any = yaml.safe_load(f)
+            chart_data: Any = yaml.load(f, Loader=_SafeLoader)
         return chart_data.get("version")
     except Exception:
         return None
 
 
+_TRADITIONAL_REPO_RE: re.Pattern[str] = re.compile(
+    "|".join(map(re.escape, TRADITIONAL_REPO_INDICATORS))
+)
+_OCI_REGISTRY_RE: re.Pattern[str] = re.compile(
+    "|".join(map(re.escape, OCI_REGISTRY_INDICATORS))
+)
+
+
+# Every app asks about one of a handful of repo URLs.
+@lru_cache(maxsize=256)
 def is_oci_registry(repo_url: str) -> bool:
     repo_lower: str = repo_url.lower()
 
     if repo_lower.startswith("oci://"):
         return True
 
-    for indicator in TRADITIONAL_REPO_INDICATORS:
-        if indicator in repo_lower:
-            return False
-
-    return any(indicator in repo_lower for indicator in OCI_REGISTRY_INDICATORS)
+    return (
+        _TRADITIONAL_REPO_RE.search(repo_lower) is None
+        and _OCI_REGISTRY_RE.search(repo_lower) is not None
+    )
 
 
 def has_packaged_dependencies(chart_path: Path) -> bool:
@@ -146,33 +191,25 @@ def ensure_registry_auth(registry_url: str) -> bool:
         return False
 
 
+@lru_cache(maxsize=256)
 def _extract_registry_host(registry_url: str) -> str:
-    registry: str = registry_url.replace("https://", "").replace("http://", "")
-    if "/" in registry:
-        registry: str = registry.split("/")[0]
-    return registry
+    registry: str = registry_url.removeprefix("https://").removeprefix("http://")
+    return registry.partition("/")[0]
 
 
 def pull_traditional_helm_chart(
     repo_url: str, chart_name: str, version: str, dest_dir: Path
 ) -> tuple[bool, str]:
-    with tempfile.TemporaryDirectory() as temp_config_dir:
-        temp_config: Path = Path(temp_config_dir)
-        temp_repo_name: str = "rita-temp-repo"
-        helm_env: dict[str, str] = _create_isolated_helm_env(temp_config)
-
-        try:
-            if not _add_helm_repo(temp_repo_name, repo_url, helm_env):
-                return False, f"Failed to add helm repo: {repo_url}"
-
-            _update_helm_repo(temp_repo_name, helm_env)
-            _pull_chart_from_repo(
-                temp_repo_name, chart_name, version, dest_dir, helm_env
-            )
-            return _find_extracted_chart(dest_dir, chart_name)
+    helm_env: dict[str, str] | None = _shared_helm_repo(repo_url)
+    if helm_env is None:
+        return False, f"Failed to add helm repo: {repo_url}"
 
-        except subprocess.CalledProcessError as e:
-            return False, f"Failed to pull chart: {e.stderr}"
+    try:
+        _pull_chart_from_repo(HELM_REPO_NAME, chart_name, version, dest_dir, helm_env)
+        return _find_extracted_chart(dest_dir, chart_name)
+
+    except subprocess.CalledProcessError as e:
+        return False, f"Failed to pull chart: {e.stderr}"
 
 
 def pull_oci_chart(
@@ -199,6 +236,56 @@ def pull_oci_chart(
         return False, f"Failed to pull chart: {e.stderr}"
 
 
+HELM_REPO_NAME = "rita-temp-repo"
+"""Name traditional helm repos are added under in their isolated helm config."""
+
+HELM_REPO_INDEX_TTL_SECONDS = 600
+"""How long a downloaded helm repo index is used before `helm repo update`."""
+
+_helm_repo_locks: dict[Path, threading.Lock] = {}
+_helm_repo_locks_lock = threading.Lock()
+
+
+def _shared_helm_repo(repo_url: str) -> dict[str, str] | None:
+    """Return a helm env in which repo_url is added as HELM_REPO_NAME.
+
+    The helm config and downloaded index.yaml live in the user cache, one
+    directory per repo URL, so pulls and version listings across apps and runs
+    reuse the index instead of each downloading it again. Returns None if the
+    repo can't be added.
+    """
+    digest: str = hashlib.blake2b(repo_url.encode(), digest_size=16).hexdigest()
+    repo_dir: Path = get_cache_dir() / "helm-repos" / digest
+    repo_dir.mkdir(parents=True, exist_ok=True)
+    helm_env: dict[str, str] = _create_isolated_helm_env(repo_dir)
+    index_file: Path = repo_dir / "cache" / f"{HELM_REPO_NAME}-index.yaml"
+
+    with _helm_repo_locks_lock:
+        thread_lock: threading.Lock = _helm_repo_locks.setdefault(
+            repo_dir, threading.Lock()
+        )
+
+    # Only adding or refreshing the repo is serialized, across threads and
+    # rita processes; helm replaces the index atomically, so pulls don't wait.
+    with thread_lock, (repo_dir / ".lock").open("a") as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        if not (repo_dir / "repositories.yaml").exists():
+            # `helm repo add` downloads the index too.
+            if not _add_helm_repo(HELM_REPO_NAME, repo_url, helm_env):
+                return None
+        elif _repo_index_age(index_file) > HELM_REPO_INDEX_TTL_SECONDS:
+            _update_helm_repo(HELM_REPO_NAME, helm_env)
+    return helm_env
+
+
+def _repo_index_age(index_file: Path) -> float:
+    try:
+        return time.time() - index_file.stat().st_mtime
+    except OSError:
+        return float("inf")
+
+
 def _create_isolated_helm_env(temp_config: Path) -> dict[str, str]:
     helm_env: dict[str, str] = os.environ.copy()
     helm_env["HELM_REPOSITORY_CONFIG"] = str(temp_config / "repositories.yaml")
@@ -250,13 +337,19 @@ def _find_extracted_chart(dest_dir: Path, chart_name: str) -> tuple[bool, str]:
     if chart_dir.exists():
         return True, str(chart_dir)
 
-    subdirs = [d for d in dest_dir.iterdir() if d.is_dir()]
-    if subdirs:
-        return True, str(subdirs[0])
+    subdir: Path | None = _first_subdir(dest_dir)
+    if subdir is not None:
+        return True, str(subdir)
 
     return False, f"Chart extracted but directory not found in {dest_dir}"
 
 
+def _first_subdir(directory: Path) -> Path | None:
+    # scandir answers is_dir() from the directory entry, without a stat each.
+    with os.scandir(directory) as entries:
+        return next((Path(e.path) for e in entries if e.is_dir()), None)
+
+
 def prepare_chart_for_rendering(
     app: ArgoAppConfig,
     temp_dir: Path,
@@ -266,10 +359,8 @@ def prepare_chart_for_rendering(
     if not app.is_local_chart:
         return _prepare_external_chart(app, temp_dir, use_chart_cache)
 
-    local_version: str | None = get_local_chart_version(
-        chart_path_resolver(app.chart_name)
-    )
     local_chart_path: Path = chart_path_resolver(app.chart_name)
+    local_version: str | None = get_local_chart_version(local_chart_path)
 
     if local_version == app.chart_version:
         return _prepare_local_chart(app, temp_dir, local_chart_path)
@@ -316,8 +407,9 @@ def _cache_chart_if_possible(
     cache: Any, chart_name: str, version: str, chart_path: Path
 ) -> None:
     if cache:
+        # The upload runs in the background so rendering isn't held up by it.
         with contextlib.suppress(Exception):
-            upload_chart_to_cache(cache, chart_name, version, chart_path)
+            queue_chart_upload(cache, chart_name, version, chart_path)
 
 
 def _prepare_local_chart(
@@ -325,9 +417,9 @@ def _prepare_local_chart(
 ) -> tuple[bool, str, Path | None]:
     local_version: str | None = get_local_chart_version(local_chart_path)
     temp_chart_path: Path = temp_dir / app.chart_name
-    shutil.copytree(local_chart_path, temp_chart_path, dirs_exist_ok=True)
+    _copy_chart_tree(local_chart_path, temp_chart_path)
 
-    _copy_file_dependencies(temp_chart_path, local_chart_path.parent, temp_dir)
+    _copy_file_dependencies(local_chart_path, local_chart_path.parent, temp_dir)
 
     if not has_packaged_dependencies(temp_chart_path):
         success, msg = build_chart_dependencies(temp_chart_path)
@@ -345,20 +437,10 @@ def _copy_file_dependencies(chart_path: Path, charts_dir: Path, temp_dir: Path)
 
     The dependency path is resolved relative to the original chart's location
     in charts_dir, then copied to temp_dir to maintain the same relative structure.
+    Chart.yaml is read from the original chart (not the copy), so its parse is
+    memoized across renders.
     """
-    chart_yaml: Path = chart_path / "Chart.yaml"
-    if not chart_yaml.exists():
-        return
-
-    try:
-        with chart_yaml.open(encoding="utf-8") as f:
-            chart_data = yaml.safe_load(f)
-    except Exception:
-        return
-
-    dependencies = chart_data.get("dependencies", [])
-    for dep in dependencies:
-        repo = dep.get("repository", "")
+    for repo in _chart_dependency_repos(chart_path / "Chart.yaml") or ():
         if repo.startswith("file://"):
             rel_path = repo.replace("file://", "")
             source_path = (charts_dir / chart_path.name / rel_path).resolve()
@@ -366,8 +448,56 @@ def _copy_file_dependencies(chart_path: Path, charts_dir: Path, temp_dir: Path)
             if source_path.exists() and source_path.is_dir():
                 dest_path = temp_dir / source_path.name
                 if not dest_path.exists():
-                    shutil.copytree(source_path, dest_path, dirs_exist_ok=True)
-                    _copy_file_dependencies(dest_path, charts_dir, temp_dir)
+                    _copy_chart_tree(source_path, dest_path)
+                    _copy_file_dependencies(source_path, charts_dir, temp_dir)
+
+
+def _copy_chart_tree(source: Path, dest: Path) -> None:
+    """Copy a chart's files for rendering.
+
+    Only contents are copied: copyfile skips copy2's chmod/utime/xattr calls
+    and copies in-kernel (sendfile on Linux, fcopyfile on macOS). VCS
+    metadata is left behind.
+    """
+    shutil.copytree(
+        source,
+        dest,
+        copy_function=shutil.copyfile,
+        ignore=shutil.ignore_patterns(".git"),
+        dirs_exist_ok=True,
+    )
+
+
+def _chart_dependency_repos(chart_yaml: Path) -> tuple[str, ...] | None:
+    """Return the `repository` of each dependency in a Chart.yaml.
+
+    Returns None if the file is missing or isn't valid YAML.
+    """
+    try:
+        stat: os.stat_result = chart_yaml.stat()
+    except OSError:
+        return None
+    return _read_chart_dependency_repos(
+        str(chart_yaml), stat.st_mtime_ns, stat.st_size
+    )
+
+
+@lru_cache(maxsize=256)
+def _read_chart_dependency_repos(
+    chart_yaml: str,
+    mtime_ns: int,  # noqa: ARG001
+    size: int,  # noqa: ARG001
+) -> tuple[str, ...] | None:
+    try:
+        with Path(chart_yaml).open(encoding="utf-8") as f:
+            chart_data: Any = yaml.load(f, Loader=_SafeLoader) or {}
+    except (OSError, yaml.YAMLError):
+        return None
+    return tuple(
+        dep.get("repository", "")
+        for dep in chart_data.get("dependencies") or []
+        if isinstance(dep, dict)
+    )
 
 
 def _prepare_versioned_chart(
@@ -398,6 +528,334 @@ def _prepare_versioned_chart(
     return True, f"Chart pulled from OCI (v{app.chart_version})", chart_path
 
 
+# Charts prepared for rendering in this process, keyed by _chart_cache_key.
+# Apps sharing a chart reuse one copied/pulled chart directory instead of each
+# re-running the copy, `helm dependency build` or registry pull.
+_prepared_charts: dict[tuple, tuple[str, Path]] = {}
+_prepared_chart_locks: dict[tuple, threading.Lock] = {}
+_prepared_charts_lock = threading.Lock()
+_prepared_charts_root: Path | None = None
+
+
+def _chart_cache_key(
+    app: ArgoAppConfig, chart_path_resolver: Callable[[str], Path]
+) -> tuple:
+    key: tuple = (
+        app.chart_name,
+        app.chart_version,
+        app.chart_repo,
+        app.oci_chart_name,
+        app.is_local_chart,
+    )
+    if app.is_local_chart:
+        local_chart_path: Path = chart_path_resolver(app.chart_name)
+        with contextlib.suppress(OSError):
+            key += (str(local_chart_path), local_chart_path.stat().st_mtime_ns)
+    return key
+
+
+def _get_prepared_charts_root() -> Path:
+    global _prepared_charts_root
+
+    if _prepared_charts_root is None:
+        import multiprocessing.util
+
+        _prepared_charts_root = Path(tempfile.mkdtemp(prefix="rita-charts-"))
+        # Finalize (unlike atexit) also runs when pool workers exit.
+        multiprocessing.util.Finalize(
+            None,
+            shutil.rmtree,
+            args=(_prepared_charts_root,),
+            kwargs={"ignore_errors": True},
+            exitpriority=0,
+        )
+    return _prepared_charts_root
+
+
+def get_prepared_chart(
+    app: ArgoAppConfig, chart_path_resolver: Callable[[str], Path]
+) -> tuple[bool, str, Path | None]:
+    """Prepare an app's chart once per process and reuse it afterwards.
+
+    Like prepare_chart_for_rendering, but the chart lives in a process-wide
+    directory that callers must treat as read-only. Failures aren't cached.
+    """
+    key: tuple = _chart_cache_key(app, chart_path_resolver)
+
+    with _prepared_charts_lock:
+        key_lock: threading.Lock = _prepared_chart_locks.setdefault(
+            key, threading.Lock()
+        )
+
+    with key_lock:
+        if key in _prepared_charts:
+            msg, chart_path = _prepared_charts[key]
+            return True, msg, chart_path
+
+        dest_dir = Path(tempfile.mkdtemp(dir=_get_prepared_charts_root()))
+        success, msg, chart_path = prepare_chart_for_rendering(
+            app, dest_dir, chart_path_resolver
+        )
+        if success and chart_path is not None:
+            _prepared_charts[key] = (msg, chart_path)
+        else:
+            shutil.rmtree(dest_dir, ignore_errors=True)
+        return success, msg, chart_path
+
+
+# `helm template` output rendered in this process, keyed by
+# _template_cache_key. Apps with the same chart, release, namespace and
+# values (e.g. one app deployed identically to several envs) render once.
+_template_cache: OrderedDict[str, str] = OrderedDict()
+_template_cache_lock = threading.Lock()
+_TEMPLATE_CACHE_SIZE = 64
+
+
+# `helm template` output persisted across runs, keyed by content so a CI job
+# re-rendering unchanged charts and values skips helm entirely.
+_TEMPLATE_DISK_CACHE_BYTES = 256 * 1024 * 1024
+_template_disk_cache_culled = False
+
+# Only an exact version pins a remote chart's content. `latest`, ranges
+# (`>=1.0.0`, `^1.2`) and wildcards (`1.2.*`) resolve to whatever the repo
+# currently publishes, so caching their renders would serve stale output.
+_PINNED_VERSION_RE: re.Pattern[str] = re.compile(
+    r"v?\d+\.\d+\.\d+(?:-[0-9A-Za-z.-]+)?(?:\+[0-9A-Za-z.-]+)?"
+)
+
+
+def _template_cache_key(
+    app: ArgoAppConfig,
+    repo_root: Path,
+    chart_path_resolver: Callable[[str], Path],
+    include_crds: bool,
+    inline_values: Any = None,
+    chart_key: object = None,
+) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    parts: list[object] = [
+        chart_key or _chart_cache_key(app, chart_path_resolver),
+        app.release_name,
+        app.namespace,
+        include_crds,
+        _canonical_values(inline_values),
+    ]
+    for part in parts:
+        digest.update(repr(part).encode())
+        digest.update(b"\0")
+    for vf in app.values_files:
+        values_path: Path = repo_root / vf
+        digest.update(str(values_path).encode())
+        with contextlib.suppress(OSError):
+            digest.update(hashlib.sha256(values_path.read_bytes()).digest())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _canonical_values(value: Any) -> Any:
+    """Order-independent form of a values tree whose repr is a stable key.
+
+    Mapping keys are sorted by type name and repr rather than by value,
+    since YAML allows keys of mixed types (`{1: x, b: y}`) that can't be
+    compared with each other.
+    """
+    if isinstance(value, dict):
+        items: list[tuple[str, str, Any]] = [
+            (type(k).__name__, repr(k), _canonical_values(v)) for k, v in value.items()
+        ]
+        return tuple(sorted(items, key=lambda item: item[:2]))
+    if isinstance(value, (list, tuple)):
+        return [_canonical_values(v) for v in value]
+    return value
+
+
+@lru_cache(maxsize=1)
+def _helm_binary_identity() -> tuple:
+    """Identify the installed helm binary, so upgrading it invalidates renders."""
+    helm_path: str | None = shutil.which("helm")
+    if helm_path is None:
+        return ()
+    stat = Path(helm_path).stat()
+    return (helm_path, stat.st_size, stat.st_mtime_ns)
+
+
+@lru_cache(maxsize=256)
+def _local_chart_digest(chart_dir: str, _depth: int = 0) -> str | None:
+    """Digest a local chart's files, including its file:// dependencies.
+
+    Returns None if the rendered output could change without the files
+    changing: remote dependencies that are neither packaged nor locked are
+    resolved to the newest matching version by `helm dependency build`.
+    """
+    chart_path = Path(chart_dir)
+    if _depth > 8 or not chart_path.is_dir():
+        return None
+
+    digest = hashlib.blake2b(digest_size=16)
+    for path in sorted(p for p in chart_path.rglob("*") if p.is_file()):
+        digest.update(str(path.relative_to(chart_path)).encode())
+        digest.update(b"\0")
+        digest.update(hashlib.sha256(path.read_bytes()).digest())
+
+    repos: tuple[str, ...] | None = _chart_dependency_repos(chart_path / "Chart.yaml")
+    if repos is None:
+        return None
+
+    locked: bool = (chart_path / "Chart.lock").exists() or has_packaged_dependencies(
+        chart_path
+    )
+    for repo in repos:
+        if repo.startswith("file://"):
+            dep_path: Path = (chart_path / repo.removeprefix("file://")).resolve()
+            dep_digest: str | None = _local_chart_digest(str(dep_path), _depth + 1)
+            if dep_digest is None:
+                return None
+            digest.update(dep_digest.encode())
+        elif not locked:
+            return None
+    return digest.hexdigest()
+
+
+def _persistent_template_key(
+    app: ArgoAppConfig,
+    repo_root: Path,
+    chart_path_resolver: Callable[[str], Path],
+    include_crds: bool,
+    inline_values: Any = None,
+) -> str | None:
+    """Key for the on-disk template cache, or None if the app can't use it.
+
+    Unlike the in-process key, local charts are identified by their content
+    rather than their mtime, which a fresh checkout always changes.
+    """
+    if app.is_local_chart:
+        chart_digest: str | None = _local_chart_digest(
+            str(chart_path_resolver(app.chart_name))
+        )
+        if chart_digest is None:
+            return None
+    elif _PINNED_VERSION_RE.fullmatch(app.chart_version or "") is None:
+        return None
+    else:
+        chart_digest = None
+
+    chart_key: tuple = (
+        app.chart_name,
+        app.chart_version,
+        app.chart_repo,
+        app.oci_chart_name,
+        chart_digest,
+        _helm_binary_identity(),
+    )
+    return _template_cache_key(
+        app, repo_root, chart_path_resolver, include_crds, inline_values, chart_key
+    )
+
+
+def _template_disk_path(disk_key: str) -> Path:
+    return get_cache_dir() / "helm-template" / disk_key[:2] / f"{disk_key}.yaml"
+
+
+def _read_template_disk_cache(disk_key: str) -> str | None:
+    path: Path = _template_disk_path(disk_key)
+    try:
+        rendered: str = path.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError):
+        return None
+    # Bump the mtime so culling drops the least recently used renders.
+    with contextlib.suppress(OSError):
+        os.utime(path)
+    return rendered
+
+
+def _write_template_disk_cache(disk_key: str, rendered: str) -> None:
+    global _template_disk_cache_culled
+
+    path: Path = _template_disk_path(disk_key)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write then rename, so concurrent renders never read a partial file.
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(rendered)
+        Path(tmp_name).replace(path)
+    except OSError:
+        return
+
+    if not _template_disk_cache_culled:
+        _template_disk_cache_culled = True
+        _cull_template_disk_cache(path.parent.parent)
+
+
+def _cull_template_disk_cache(
+    root: Path, max_bytes: int = _TEMPLATE_DISK_CACHE_BYTES
+) -> None:
+    """Drop the least recently used renders until the cache fits `max_bytes`."""
+    entries: list[tuple[float, int, Path]] = []
+    for path in root.glob("*/*.yaml"):
+        with contextlib.suppress(OSError):
+            stat = path.stat()
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+    total: int = sum(size for _, size, _ in entries)
+    if total <= max_bytes:
+        return
+
+    # Cull to 80% so the next few writes don't immediately cull again.
+    for _, size, path in sorted(entries):
+        if total <= max_bytes * 0.8:
+            break
+        with contextlib.suppress(OSError):
+            path.unlink()
+            total -= size
+
+
+def _cached_template(cache_key: str, disk_key: str | None) -> str | None:
+    """Output of an identical earlier render, from this process or from disk."""
+    with _template_cache_lock:
+        cached: str | None = _template_cache.get(cache_key)
+        if cached is not None:
+            _template_cache.move_to_end(cache_key)
+            return cached
+
+    if disk_key is None:
+        return None
+    cached = _read_template_disk_cache(disk_key)
+    if cached is not None:
+        with _template_cache_lock:
+            _template_cache[cache_key] = cached
+            if len(_template_cache) > _TEMPLATE_CACHE_SIZE:
+                _template_cache.popitem(last=False)
+    return cached
+
+
+def _run_helm_template(
+    cmd: list[str], repo_root: Path, cache_key: str, disk_key: str | None = None
+) -> str:
+    """Run `helm template`, reusing the output of an identical earlier run.
+
+    Successful output is also saved to the on-disk cache under `disk_key`,
+    if given. Raises like subprocess.run; failures aren't cached.
+    """
+    with _template_cache_lock:
+        cached: str | None = _template_cache.get(cache_key)
+        if cached is not None:
+            _template_cache.move_to_end(cache_key)
+            return cached
+
+    result: CompletedProcess[str] = subprocess.run(
+        cmd, capture_output=True, text=True, check=True, cwd=str(repo_root)
+    )
+    if disk_key is not None:
+        _write_template_disk_cache(disk_key, result.stdout)
+
+    with _template_cache_lock:
+        _template_cache[cache_key] = result.stdout
+        if len(_template_cache) > _TEMPLATE_CACHE_SIZE:
+            _template_cache.popitem(last=False)
+    return result.stdout
+
+
 def render_helm_chart(
     app: ArgoAppConfig,
     output_dir: Path,
@@ -405,39 +863,40 @@ def render_helm_chart(
     chart_path_resolver: Callable[[str], Path],
     include_crds: bool = True,
 ) -> tuple[bool, str]:
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
+    for vf in app.values_files:
+        values_path: Path = repo_root / vf
+        if not values_path.exists():
+            return False, f"Values file not found: {values_path}"
 
-        success, prep_msg, chart_path = prepare_chart_for_rendering(
-            app, temp_path, chart_path_resolver
-        )
-        if not success:
-            return False, prep_msg
+    cache_key: str = _template_cache_key(
+        app, repo_root, chart_path_resolver, include_crds
+    )
+    disk_key: str | None = _persistent_template_key(
+        app, repo_root, chart_path_resolver, include_crds
+    )
+    cached: str | None = _cached_template(cache_key, disk_key)
+    if cached is not None:
+        doc_count: int = _write_rendered_output(cached, output_dir)
+        return True, f"Rendered {doc_count} resources (cached render)"
 
-        if chart_path is None:
-            return False, "Chart path not set"
+    success, prep_msg, chart_path = get_prepared_chart(app, chart_path_resolver)
+    if not success:
+        return False, prep_msg
 
-        for vf in app.values_files:
-            values_path: Path = repo_root / vf
-            if not values_path.exists():
-                return False, f"Values file not found: {values_path}"
+    if chart_path is None:
+        return False, "Chart path not set"
 
-        cmd: list[str] = _build_template_command(
-            app, chart_path, repo_root, include_crds
-        )
+    cmd: list[str] = _build_template_command(app, chart_path, repo_root, include_crds)
 
-        try:
-            result: CompletedProcess[str] = subprocess.run(
-                cmd, capture_output=True, text=True, check=True, cwd=str(repo_root)
-            )
-            rendered: str = result.stdout
-        except subprocess.CalledProcessError as e:
-            return False, f"Helm template failed: {e.stderr}"
-        except FileNotFoundError:
-            return False, "helm command not found. Please install Helm."
+    try:
+        rendered: str = _run_helm_template(cmd, repo_root, cache_key, disk_key)
+    except subprocess.CalledProcessError as e:
+        return False, f"Helm template failed: {e.stderr}"
+    except FileNotFoundError:
+        return False, "helm command not found. Please install Helm."
 
-        doc_count: int = _write_rendered_output(rendered, output_dir)
-        return True, f"Rendered {doc_count} resources ({prep_msg})"
+    doc_count: int = _write_rendered_output(rendered, output_dir)
+    return True, f"Rendered {doc_count} resources ({prep_msg})"
 
 
 def _build_template_command(
@@ -464,57 +923,51 @@ def _build_template_command(
     return cmd
 
 
-def _write_rendered_output(rendered: str, output_dir: Path) -> int:
-    output_dir.mkdir(parents=True, exist_ok=True)
+# Helm output is a stream of documents; each is bucketed by its top-level
+# `kind:` (the only unindented one) without a YAML parse and written verbatim.
+_DOC_SEPARATOR_RE: re.Pattern[str] = re.compile(r"^---[ \t]*$", re.MULTILINE)
+_TOP_LEVEL_KIND_RE: re.Pattern[str] = re.compile(
+    r"^kind:[ \t]*[\"']?([\w.-]+)", re.MULTILINE
+)
+_CONTENT_LINE_RE: re.Pattern[str] = re.compile(r"^[ \t]*[^#\s]", re.MULTILINE)
 
-    try:
-        docs = list(yaml.load_all(rendered, Loader=_create_safe_loader()))
-        by_kind: dict[str, list[dict[str, Any]]] = _group_docs_by_kind(docs)
 
-        for kind, resources in by_kind.items():
-            _write_kind_file(output_dir, kind, resources)
+def _write_rendered_output(
+    rendered: str, output_dir: Path, write_combined: bool = True
+) -> int:
+    output_dir.mkdir(parents=True, exist_ok=True)
 
-        doc_count: int = len([d for d in docs if d])
-    except yaml.YAMLError:
-        doc_count: int = rendered.count("\n---\n") + 1
+    doc_count: int = _write_kind_files(rendered, output_dir)
 
-    all_file: Path = output_dir / "_all.yaml"
-    with all_file.open("w", encoding="utf-8") as f:
-        f.write(rendered)
+    if write_combined:
+        all_file: Path = output_dir / "_all.yaml"
+        with all_file.open("w", encoding="utf-8") as f:
+            f.write(rendered)
 
     return doc_count
 
 
-def _create_safe_loader():
-    class SafeLoaderWithValue(yaml.SafeLoader):
-        pass
-
-    SafeLoaderWithValue.add_constructor(
-        "tag:yaml.org,2002:value",
-        lambda loader, node: loader.construct_scalar(node),
-    )
-    return SafeLoaderWithValue
-
-
-def _group_docs_by_kind(docs: list[dict]) -> dict[str, list[dict[str, Any]]]:
-    by_kind: dict[str, list[dict[str, Any]]] = {}
-    for doc in docs:
-        if not doc:
-            continue
-        kind = doc.get("kind", "Unknown")
-        if kind not in by_kind:
-            by_kind[kind] = []
-        by_kind[kind].append(doc)
-    return by_kind
-
-
-def _write_kind_file(output_dir: Path, kind: str, resources: list[dict]) -> None:
-    kind_file: Path = output_dir / f"{kind.lower()}.yaml"
-    with kind_file.open("w", encoding="utf-8") as f:
-        for i, resource in enumerate(resources):
-            if i > 0:
+def _write_kind_files(rendered: str, output_dir: Path) -> int:
+    doc_count: int = 0
+    with contextlib.ExitStack() as stack:
+        open_files: dict[str, IO[str]] = {}
+        for doc in _DOC_SEPARATOR_RE.split(rendered):
+            # Skip empty and comment-only documents (e.g. a lone `# Source:`).
+            if not _CONTENT_LINE_RE.search(doc):
+                continue
+            match: re.Match[str] | None = _TOP_LEVEL_KIND_RE.search(doc)
+            kind: str = match[1] if match else "Unknown"
+            f: IO[str] | None = open_files.get(kind)
+            if f is None:
+                kind_file: Path = output_dir / f"{kind.lower()}.yaml"
+                f = open_files[kind] = stack.enter_context(
+                    kind_file.open("w", encoding="utf-8")
+                )
+            else:
                 f.write("---\n")
-            yaml.safe_dump(resource, f, default_flow_style=False, sort_keys=False)
+            f.write(doc.strip("\n") + "\n")
+            doc_count += 1
+    return doc_count
 
 
 def list_helm_chart_versions(
@@ -534,44 +987,38 @@ def list_helm_chart_versions(
 def _list_traditional_repo_versions(
     repo_url: str, chart_name: str, max_versions: int
 ) -> tuple[bool, list[str], str]:
-    with tempfile.TemporaryDirectory() as temp_config_dir:
-        temp_config = Path(temp_config_dir)
-        temp_repo_name = "rita-temp-repo"
-        helm_env: dict[str, str] = _create_isolated_helm_env(temp_config)
-
-        try:
-            if not _add_helm_repo(temp_repo_name, repo_url, helm_env):
-                return False, [], f"Failed to add helm repo: {repo_url}"
-
-            _update_helm_repo(temp_repo_name, helm_env)
-
-            search_result: CompletedProcess[str] = subprocess.run(
-                [
-                    "helm",
-                    "search",
-                    "repo",
-                    f"{temp_repo_name}/{chart_name}",
-                    "--versions",
-                    "-o",
-                    "json",
-                ],
-                capture_output=True,
-                text=True,
-                check=True,
-                env=helm_env,
-            )
+    helm_env: dict[str, str] | None = _shared_helm_repo(repo_url)
+    if helm_env is None:
+        return False, [], f"Failed to add helm repo: {repo_url}"
+
+    try:
+        search_result: CompletedProcess[str] = subprocess.run(
+            [
+                "helm",
+                "search",
+                "repo",
+                f"{HELM_REPO_NAME}/{chart_name}",
+                "--versions",
+                "-o",
+                "json",
+            ],
+            capture_output=True,
+            text=True,
+            check=True,
+            env=helm_env,
+        )
 
-            results: Any = json.loads(search_result.stdout)
-            versions = [
-                r.get("version", "") for r in results[:max_versions] if r.get("version")
-            ]
+        results: Any = json.loads(search_result.stdout)
+        versions = [
+            r.get("version", "") for r in results[:max_versions] if r.get("version")
+        ]
 
-            return True, versions, ""
+        return True, versions, ""
 
-        except subprocess.CalledProcessError as e:
-            return False, [], f"Failed to search helm repo: {e.stderr}"
-        except json.JSONDecodeError:
-            return False, [], "Failed to parse helm search output"
+    except subprocess.CalledProcessError as e:
+        return False, [], f"Failed to search helm repo: {e.stderr}"
+    except json.JSONDecodeError:
+        return False, [], "Failed to parse helm search output"
 
 
 def pull_helm_chart_values(
@@ -631,20 +1078,14 @@ def _pull_oci_for_values(
 def _pull_traditional_for_values(
     repo_url: str, chart_name: str, version: str, temp_path: Path
 ) -> tuple[bool, str]:
-    helm_config: Path = temp_path / "helm-config"
-    helm_env: dict[str, str] = _create_isolated_helm_env(helm_config)
-
-    temp_repo_name = "rita-temp-repo"
-
-    if not _add_helm_repo(temp_repo_name, repo_url, helm_env):
+    helm_env: dict[str, str] | None = _shared_helm_repo(repo_url)
+    if helm_env is None:
         return False, f"Failed to add helm repo: {repo_url}"
 
-    _update_helm_repo(temp_repo_name, helm_env)
-
     cmd = [
         "helm",
         "pull",
-        f"{temp_repo_name}/{chart_name}",
+        f"{HELM_REPO_NAME}/{chart_name}",
         "--version",
         version,
         "--destination",
@@ -654,20 +1095,16 @@ def _pull_traditional_for_values(
 
     try:
         subprocess.run(cmd, capture_output=True, text=True, check=True, env=helm_env)
-        return _find_chart_dir(temp_path, exclude="helm-config")
+        return _find_chart_dir(temp_path)
     except subprocess.CalledProcessError as e:
         return False, f"Failed to pull chart: {e.stderr}"
 
 
-def _find_chart_dir(temp_path: Path, exclude: str | None = None) -> tuple[bool, str]:
-    subdirs = [
-        d
-        for d in temp_path.iterdir()
-        if d.is_dir() and (exclude is None or d.name != exclude)
-    ]
-    if not subdirs:
+def _find_chart_dir(temp_path: Path) -> tuple[bool, str]:
+    subdir: Path | None = _first_subdir(temp_path)
+    if subdir is None:
         return False, "Chart extracted but no directory found"
-    return True, str(subdirs[0])
+    return True, str(subdir)
 
 
 # ============================================================================
@@ -675,6 +1112,34 @@ def _find_chart_dir(temp_path: Path, exclude: str | None = None) -> tuple[bool,
 # ============================================================================
 
 
+def _is_json_native(value: Any) -> bool:
+    """Whether value survives a JSON round trip through helm's YAML parser."""
+    if value is None or isinstance(value, (str, bool, int)):
+        return True
+    if isinstance(value, float):
+        return math.isfinite(value)
+    if isinstance(value, list):
+        return all(_is_json_native(v) for v in value)
+    if isinstance(value, dict):
+        return all(
+            isinstance(k, str) and _is_json_native(v) for k, v in value.items()
+        )
+    return False
+
+
+def _dump_inline_values(values: Any, f: IO[str]) -> None:
+    """Write values for `helm template --values`.
+
+    JSON is valid YAML and far cheaper to emit, but only for JSON-native
+    trees: NaN/Infinity would reach helm as strings and dates as quoted
+    strings rather than timestamps, so anything else goes through YAML.
+    """
+    if _is_json_native(values):
+        json.dump(values, f)
+    else:
+        yaml.dump(values, f, Dumper=_SafeDumper, default_flow_style=False)
+
+
 def render_helm_chart_to_string(
     app: ArgoAppConfig,
     repo_root: Path,
@@ -685,42 +1150,52 @@ def render_helm_chart_to_string(
 
     Returns (success, rendered_content, error_message).
     """
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
+    for vf in app.values_files:
+        values_path = repo_root / vf
+        if not values_path.exists():
+            return False, "", f"Values file not found: {values_path}"
 
-        success, prep_msg, chart_path = prepare_chart_for_rendering(
-            app, temp_path, chart_path_resolver
-        )
-        if not success:
-            return False, "", prep_msg
+    cache_key: str = _template_cache_key(
+        app, repo_root, chart_path_resolver, include_crds, app.values_object
+    )
+    disk_key: str | None = _persistent_template_key(
+        app, repo_root, chart_path_resolver, include_crds, app.values_object
+    )
+    cached: str | None = _cached_template(cache_key, disk_key)
+    if cached is not None:
+        return True, cached, "cached render"
+
+    success, prep_msg, chart_path = get_prepared_chart(app, chart_path_resolver)
+    if not success:
+        return False, "", prep_msg
 
-        if chart_path is None:
-            return False, "", "Chart path not set"
+    if chart_path is None:
+        return False, "", "Chart path not set"
 
-        for vf in app.values_files:
-            values_path = repo_root / vf
-            if not values_path.exists():
-                return False, "", f"Values file not found: {values_path}"
+    cmd: list[str] = _build_template_command(app, chart_path, repo_root, include_crds)
 
-        cmd: list[str] = _build_template_command(
-            app, chart_path, repo_root, include_crds
+    # Only inline values need a scratch file; it goes in the process-wide
+    # scratch root rather than a fresh temp dir per render.
+    values_file: Path | None = None
+    if app.values_object:
+        fd, values_name = tempfile.mkstemp(
+            suffix="-values.yaml", dir=_get_prepared_charts_root()
         )
+        values_file = Path(values_name)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            _dump_inline_values(app.values_object, f)
+        cmd.extend(["--values", str(values_file)])
 
-        if app.values_object:
-            values_file: Path = temp_path / "inline-values.yaml"
-            with values_file.open("w", encoding="utf-8") as f:
-                yaml.safe_dump(app.values_object, f, default_flow_style=False)
-            cmd.extend(["--values", str(values_file)])
-
-        try:
-            result: CompletedProcess[str] = subprocess.run(
-                cmd, capture_output=True, text=True, check=True, cwd=str(repo_root)
-            )
-            return True, result.stdout, prep_msg
-        except subprocess.CalledProcessError as e:
-            return False, "", f"Helm template failed: {e.stderr}"
-        except FileNotFoundError:
-            return False, "", "helm command not found. Please install Helm."
+    try:
+        rendered: str = _run_helm_template(cmd, repo_root, cache_key, disk_key)
+        return True, rendered, prep_msg
+    except subprocess.CalledProcessError as e:
+        return False, "", f"Helm template failed: {e.stderr}"
+    except FileNotFoundError:
+        return False, "", "helm command not found. Please install Helm."
+    finally:
+        if values_file is not None:
+            values_file.unlink(missing_ok=True)
 
 
 def render_application_with_appset_expansion(
@@ -729,6 +1204,8 @@ def render_application_with_appset_expansion(
     repo_root: Path,
     chart_path_resolver: Callable[[str], Path],
     include_crds: bool = True,
+    parallel: bool = True,
+    max_workers: int = 4,
 ) -> tuple[bool, str, list[ArgoAppConfig]]:
     """Render an Application and expand any ApplicationSets it produces.
 
@@ -736,9 +1213,13 @@ def render_application_with_appset_expansion(
     1. Renders the Application's chart
     2. If the rendered output contains ApplicationSets, parses them
     3. For each ApplicationSet, extracts child Application configs
-    4. Renders each child Application's chart
+    4. Renders each child Application's chart (in parallel if enabled)
     5. Combines all manifests into the output directory
 
+    Args:
+        parallel: Enable parallel rendering of child apps (default True)
+        max_workers: Maximum number of parallel workers (default 4)
+
     Returns (success, message, list of child apps that were rendered).
     """
     success, rendered_content, msg = render_helm_chart_to_string(
@@ -762,20 +1243,38 @@ def render_application_with_appset_expansion(
 
     appset_dir: Path = output_dir / "_applicationset"
     appset_dir.mkdir(parents=True, exist_ok=True)
-    _write_rendered_output(rendered_content, appset_dir)
+    # The parent's _all.yaml (written below) is the only combined manifest;
+    # the ApplicationSet and child dirs just get their per-kind files.
+    _write_rendered_output(rendered_content, appset_dir, write_combined=False)
 
     rendered_children = []
     all_child_content = []
     child_errors = []
 
-    for child_app in child_apps:
-        child_output_dir: Path = output_dir / child_app.name
-        child_success, child_rendered, child_msg = render_helm_chart_to_string(
+    def _render_child(child_app: ArgoAppConfig) -> tuple[bool, str, str]:
+        return render_helm_chart_to_string(
             child_app, repo_root, chart_path_resolver, include_crds
         )
 
+    # Children render concurrently (each is a helm subprocess or a cache hit);
+    # map() keeps their order, so the output and messages stay deterministic.
+    results: list[tuple[bool, str, str]]
+    if parallel and len(child_apps) > 1:
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(_render_child, child_apps))
+    else:
+        results = [_render_child(child_app) for child_app in child_apps]
+
+    for child_app, (child_success, child_rendered, child_msg) in zip(
+        child_apps, results, strict=True
+    ):
+        child_output_dir: Path = output_dir / child_app.name
         if child_success:
-            _write_rendered_output(child_rendered, child_output_dir)
+            _write_rendered_output(
+                child_rendered, child_output_dir, write_combined=False
+            )
             all_child_content.append(f"# === {child_app.name} ===\n{child_rendered}")
             rendered_children.append(child_app)
         else:
@@ -925,6 +1424,8 @@ def render_recursive(
 
     if all_child_apps:
         if parallel and len(all_child_apps) > 1:
+            from concurrent.futures import ThreadPoolExecutor, as_completed
+
             with ThreadPoolExecutor(max_workers=max_workers) as executor:
                 futures = {
                     executor.submit(
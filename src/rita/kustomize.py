@@ -3,14 +3,22 @@
 from __future__ import annotations
 
 import subprocess
+from contextlib import ExitStack
 from subprocess import CompletedProcess
-from typing import TYPE_CHECKING, Any, TypedDict
+from typing import IO, TYPE_CHECKING, Any, TypedDict
 
 if TYPE_CHECKING:
     from pathlib import Path
 
 import yaml
 
+try:
+    from yaml import CSafeDumper as _SafeDumper
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeDumper as _SafeDumper  # type: ignore[assignment]
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
 
 class K8sResource(TypedDict, total=False):
     """Basic Kubernetes resource structure."""
@@ -83,15 +91,9 @@ def _write_rendered_output(rendered: str, output_dir: Path) -> int:
     output_dir.mkdir(parents=True, exist_ok=True)
 
     try:
-        docs: list[Any] = list(yaml.safe_load_all(rendered))
-        by_kind: dict[str, list[K8sResource]] = _group_docs_by_kind(docs)
-
-        for kind, resources in by_kind.items():
-            _write_kind_file(output_dir, kind, resources)
-
-        doc_count: int = len([d for d in docs if d])
+        doc_count: int = _write_kind_files(rendered, output_dir)
     except yaml.YAMLError:
-        doc_count: int = rendered.count("\n---\n") + 1
+        doc_count = rendered.count("\n---\n") + 1
 
     all_file: Path = output_dir / "_all.yaml"
     with all_file.open("w", encoding="utf-8") as f:
@@ -100,25 +102,33 @@ def _write_rendered_output(rendered: str, output_dir: Path) -> int:
     return doc_count
 
 
-def _group_docs_by_kind(docs: list[Any]) -> dict[str, list[K8sResource]]:
-    by_kind: dict[str, list[K8sResource]] = {}
-    for doc in docs:
-        if not doc:
-            continue
-        kind: str = doc.get("kind", "Unknown")
-        if kind not in by_kind:
-            by_kind[kind] = []
-        by_kind[kind].append(doc)
-    return by_kind
-
-
-def _write_kind_file(output_dir: Path, kind: str, resources: list[K8sResource]) -> None:
-    kind_file: Path = output_dir / f"{kind.lower()}.yaml"
-    with kind_file.open("w", encoding="utf-8") as f:
-        for i, resource in enumerate(resources):
-            if i > 0:
+def _write_kind_files(rendered: str, output_dir: Path) -> int:
+    """Stream each document into its kind's file, opening files as kinds appear."""
+    doc_count: int = 0
+    with ExitStack() as stack:
+        open_files: dict[str, IO[str]] = {}
+        for doc in yaml.load_all(rendered, Loader=_SafeLoader):
+            if not doc:
+                continue
+            resource: K8sResource = doc
+            kind: str = resource.get("kind", "Unknown")
+            f: IO[str] | None = open_files.get(kind)
+            if f is None:
+                kind_file: Path = output_dir / f"{kind.lower()}.yaml"
+                f = open_files[kind] = stack.enter_context(
+                    kind_file.open("w", encoding="utf-8")
+                )
+            else:
                 f.write("---\n")
-            yaml.safe_dump(resource, f, default_flow_style=False, sort_keys=False)
+            yaml.dump(
+                resource,
+                f,
+                Dumper=_SafeDumper,
+                default_flow_style=False,
+                sort_keys=False,
+            )
+            doc_count += 1
+    return doc_count
 
 
 def render_kustomize_to_string(
@@ -81,10 +81,14 @@ class ArgoAppSetConfig:
     ) -> list[ArgoAppConfig]:
         """Convert generator elements to ArgoAppConfig objects for rendering."""
         apps = []
+        # Elements often share a handful of origins; resolve and stat each once.
+        is_local_by_origin: dict[str, bool] = {}
         for elem in self.generator_elements:
             origin = elem.extra_fields.get("origin", elem.chart_name)
-            local_chart_path = chart_path_resolver(origin)
-            is_local = local_chart_path.exists()
+            is_local = is_local_by_origin.get(origin)
+            if is_local is None:
+                is_local = chart_path_resolver(origin).exists()
+                is_local_by_origin[origin] = is_local
 
             values_files = []
             if elem.values_file:
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import subprocess
-from functools import lru_cache
+from functools import cache, lru_cache
 from pathlib import Path
 from subprocess import CompletedProcess
 
@@ -38,6 +38,7 @@ class ConfigProvider:
     def reset(cls) -> None:
         cls._instance = None
         cls._config = None
+        _clear_discovery_caches()
 
     def get_config(self) -> RitaConfig:
         if self._config is None:
@@ -46,6 +47,7 @@ class ConfigProvider:
 
     def reload(self) -> RitaConfig:
         self._config: RitaConfig = load_config()
+        _clear_discovery_caches()
         return self._config
 
 
@@ -53,7 +55,9 @@ def get_config() -> RitaConfig:
     return ConfigProvider.get_instance().get_config()
 
 
+@cache
 def get_chart_path(chart_name: str) -> Path:
+    # Called for every app on each render; memoized like app discovery.
     config: RitaConfig = get_config()
     return get_repo_root() / config.charts.path / chart_name
 
@@ -84,20 +88,25 @@ def get_rendered_path(env: str, app_name: str) -> Path:
 
 
 def list_available_envs() -> list[str]:
+    return list(_discover_envs())
+
+
+@lru_cache(maxsize=1)
+def _discover_envs() -> tuple[str, ...]:
     config: RitaConfig = get_config()
 
     if config.environments:
-        return [env.name for env in config.environments]
+        return tuple(env.name for env in config.environments)
 
     apps_base: Path = get_repo_root() / "kubernetes" / "argocd" / "applications"
     if not apps_base.exists():
-        return []
+        return ()
 
     envs = []
     for env_dir in apps_base.iterdir():
         if env_dir.is_dir() and (env_dir / "templates").exists():
             envs.append(env_dir.name)
-    return sorted(envs)
+    return tuple(sorted(envs))
 
 
 def get_changed_files_from_git(base_ref: str = "origin/main") -> list[str]:
@@ -117,6 +126,28 @@ def list_apps_for_env(env: str) -> list:
     """List ArgoCD applications for an environment.
 
     Convenience wrapper that combines get_argocd_apps_paths and get_chart_path.
+    Manifests are parsed once per process and environment, like the config
+    they come from; the list is a fresh copy, but the app objects are shared
+    and must not be modified.
     """
+    return list(_discover_apps(env))
+
+
+@cache
+def _discover_apps(env: str) -> tuple:
     apps_paths: list[Path] = get_argocd_apps_paths(env)
-    return list_argocd_applications(apps_paths, get_chart_path)
+    return tuple(list_argocd_applications(apps_paths, get_chart_path))
+
+
+def _clear_discovery_caches() -> None:
+    _discover_envs.cache_clear()
+    _discover_apps.cache_clear()
+    get_chart_path.cache_clear()
+
+
+def apps_by_name(env: str) -> dict:
+    """Index an environment's applications by name (first definition wins)."""
+    index: dict = {}
+    for app in list_apps_for_env(env):
+        index.setdefault(app.name, app)
+    return index
@@ -10,11 +10,15 @@ S3 storage enables:
 from __future__ import annotations
 
 import configparser
+import contextlib
+import hashlib
 import json
 import os
 import subprocess
 import tarfile
 import tempfile
+import threading
+import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
@@ -23,8 +27,22 @@ from subprocess import CompletedProcess
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
+    from concurrent.futures import ThreadPoolExecutor
+
     from rita.config import RitaConfig, StorageConfig
 
+S3_PROBE_TTL_SECONDS = 300
+"""How long a successful bucket access probe is trusted before re-checking."""
+
+S3_RANGE_THRESHOLD = 16 * 1024 * 1024
+"""Objects larger than this are downloaded as parallel byte ranges."""
+
+S3_RANGE_PART_SIZE = 8 * 1024 * 1024
+"""Byte-range size for objects fetched in parallel parts (S3's default part size)."""
+
+S3_RANGE_MAX_WORKERS = 8
+"""Maximum concurrent extra range GETs per backend, across all objects."""
+
 
 @dataclass
 class ManifestRef:
@@ -47,6 +65,34 @@ class ManifestRef:
         return f"{self.env}/{self.app_name}/_all.yaml"
 
 
+@dataclass
+class ManifestObject:
+    """A stored manifest as reported by a bucket listing."""
+
+    ref: ManifestRef
+    """Reference the object's key resolves to."""
+
+    etag: str
+    """Object ETag, as returned by S3 (including quotes)."""
+
+    size: int
+    """Object size in bytes."""
+
+    def matches(self, content: str) -> bool:
+        """Whether the object is known to hold exactly `content`.
+
+        A single-part upload's ETag is the MD5 of its bytes; multipart ETags
+        (suffixed with "-<parts>") can't be compared and never match.
+        """
+        etag: str = self.etag.strip('"')
+        if "-" in etag:
+            return False
+        data: bytes = content.encode("utf-8")
+        if len(data) != self.size:
+            return False
+        return hashlib.md5(data, usedforsecurity=False).hexdigest() == etag
+
+
 @dataclass
 class ChartRef:
     """Reference to a cached chart in S3."""
@@ -158,13 +204,25 @@ class S3StorageBackend(StorageBackend):
         profile: str | None = None,
         region: str | None = None,
         endpoint_url: str | None = None,
+        max_pool_connections: int | None = None,
     ):
         self.bucket: str = bucket
         self.prefix: str = prefix.rstrip("/")
         self.profile: str | None = profile
         self.region: str | None = region
         self.endpoint_url: str | None = endpoint_url
+        # HTTP connections kept open by the client; raise it before the first
+        # use of `client` when sharing it across many threads.
+        self.max_pool_connections: int | None = max_pool_connections
         self._client = None
+        # Shared by every read so parallel range GETs never need more than
+        # S3_RANGE_MAX_WORKERS connections beyond the readers themselves, and
+        # kept across reads so each large object doesn't start new threads.
+        self._range_pool: ThreadPoolExecutor | None = None
+        self._range_pool_lock = threading.Lock()
+        # Chart cache keys already looked up (or uploaded) through this
+        # backend, so apps sharing a chart don't each HEAD it again.
+        self._known_charts: dict[str, bool] = {}
 
     @property
     def client(self):
@@ -191,6 +249,12 @@ class S3StorageBackend(StorageBackend):
             endpoint = self.endpoint_url or os.environ.get("AWS_ENDPOINT_URL")
             if endpoint:
                 client_kwargs["endpoint_url"] = endpoint
+            if self.max_pool_connections:
+                from botocore.config import Config
+
+                client_kwargs["config"] = Config(
+                    max_pool_connections=self.max_pool_connections
+                )
 
             self._client = session.client("s3", **client_kwargs)
 
@@ -210,18 +274,106 @@ class S3StorageBackend(StorageBackend):
                 return False
             raise
 
-    def read(self, ref: ManifestRef) -> str | None:
+    def _get_object_bytes(self, key: str) -> bytes | None:
+        """Download an object, fetching large ones as parallel byte ranges.
+
+        The first GET asks for the first S3_RANGE_THRESHOLD bytes; its
+        Content-Range reveals the total size, and any remainder is fetched as
+        concurrent S3_RANGE_PART_SIZE ranges (pinned to the first response's
+        ETag) into a preallocated buffer. Returns None if the object does not
+        exist.
+        """
         import botocore.exceptions
 
         try:
             response = self.client.get_object(
-                Bucket=self.bucket, Key=self._get_key(ref)
+                Bucket=self.bucket, Key=key, Range=f"bytes=0-{S3_RANGE_THRESHOLD - 1}"
             )
-            return response["Body"].read().decode("utf-8")
         except botocore.exceptions.ClientError as e:
-            if e.response["Error"]["Code"] == "NoSuchKey":
+            code: str = e.response["Error"]["Code"]
+            if code == "NoSuchKey":
                 return None
-            raise
+            if code != "InvalidRange":
+                raise
+            # Empty objects cannot satisfy any range.
+            response = self.client.get_object(Bucket=self.bucket, Key=key)
+
+        first: bytes = response["Body"].read()
+        content_range: str | None = response.get("ContentRange")
+        if not content_range:
+            return first
+
+        total: int = int(content_range.rpartition("/")[2])
+        if total <= len(first):
+            return first
+
+        buffer = bytearray(total)
+        buffer[: len(first)] = first
+        self._fetch_ranges(key, response["ETag"], buffer, len(first))
+        return bytes(buffer)
+
+    def _fetch_ranges(self, key: str, etag: str, buffer: bytearray, start: int) -> None:
+        """Fill `buffer` from offset `start` with concurrent range GETs."""
+        total: int = len(buffer)
+
+        def fetch_range(offset: int) -> None:
+            end: int = min(offset + S3_RANGE_PART_SIZE, total) - 1
+            part = self.client.get_object(
+                Bucket=self.bucket,
+                Key=key,
+                Range=f"bytes={offset}-{end}",
+                IfMatch=etag,
+            )
+            buffer[offset : end + 1] = part["Body"].read()
+
+        starts = range(start, total, S3_RANGE_PART_SIZE)
+        list(self._get_range_pool().map(fetch_range, starts))
+
+    def _get_range_pool(self) -> ThreadPoolExecutor:
+        with self._range_pool_lock:
+            if self._range_pool is None:
+                from concurrent.futures import ThreadPoolExecutor
+
+                self._range_pool = ThreadPoolExecutor(
+                    max_workers=S3_RANGE_MAX_WORKERS,
+                    thread_name_prefix="rita-s3-range",
+                )
+            return self._range_pool
+
+    def read(self, ref: ManifestRef) -> str | None:
+        data: bytes | None = self._get_object_bytes(self._get_key(ref))
+        return data.decode("utf-8") if data is not None else None
+
+    def read_object(self, obj: ManifestObject) -> str | None:
+        """Read a manifest whose ETag and size are known from a listing.
+
+        Skips the size probe of `read`: small objects take one GET and large
+        ones go straight to parallel ranges, all pinned to the listed ETag.
+        If the object changed since it was listed, falls back to `read`.
+        """
+        import botocore.exceptions
+
+        if obj.size == 0:
+            return ""
+
+        key: str = self._get_key(obj.ref)
+        try:
+            if obj.size <= S3_RANGE_THRESHOLD:
+                response = self.client.get_object(
+                    Bucket=self.bucket, Key=key, IfMatch=obj.etag
+                )
+                return response["Body"].read().decode("utf-8")
+
+            buffer = bytearray(obj.size)
+            self._fetch_ranges(key, obj.etag, buffer, 0)
+            return buffer.decode("utf-8")
+        except botocore.exceptions.ClientError as e:
+            code: str = e.response["Error"]["Code"]
+            if code == "NoSuchKey":
+                return None
+            if code != "PreconditionFailed":
+                raise
+            return self.read(obj.ref)
 
     def write(self, ref: ManifestRef, content: str) -> None:
         self.client.put_object(
@@ -235,7 +387,11 @@ class S3StorageBackend(StorageBackend):
         self.client.delete_object(Bucket=self.bucket, Key=self._get_key(ref))
 
     def list_manifests(self, env: str | None = None) -> list[ManifestRef]:
-        refs: list[ManifestRef] = []
+        return [obj.ref for obj in self.list_manifest_objects(env)]
+
+    def list_manifest_objects(self, env: str | None = None) -> list[ManifestObject]:
+        """List stored manifests along with their ETag and size."""
+        objects: list[ManifestObject] = []
         prefix: str = f"{self.prefix}/{env}/" if env else f"{self.prefix}/"
 
         paginator = self.client.get_paginator("list_objects_v2")
@@ -250,15 +406,16 @@ class S3StorageBackend(StorageBackend):
                     if len(parts) >= 3:
                         env_name: str = parts[0]
                         app_name: str = parts[1]
-                        refs.append(
-                            ManifestRef(
-                                env=env_name,
-                                app_name=app_name,
-                                git_ref=parts[2] if len(parts) > 3 else None,
-                            )
+                        ref = ManifestRef(
+                            env=env_name,
+                            app_name=app_name,
+                            git_ref=parts[2] if len(parts) > 3 else None,
+                        )
+                        objects.append(
+                            ManifestObject(ref=ref, etag=obj["ETag"], size=obj["Size"])
                         )
 
-        return refs
+        return objects
 
     def get_presigned_url(self, ref: ManifestRef, expires_in: int = 3600) -> str:
         """Get a presigned URL for downloading a manifest."""
@@ -286,18 +443,8 @@ class S3StorageBackend(StorageBackend):
 
         Returns None if not found.
         """
-        import botocore.exceptions
-
-        try:
-            response = self.client.get_object(
-                Bucket=self.bucket,
-                Key=f"{self.prefix}/{s3_key}",
-            )
-            return response["Body"].read().decode("utf-8")
-        except botocore.exceptions.ClientError as e:
-            if e.response["Error"]["Code"] == "NoSuchKey":
-                return None
-            raise
+        data: bytes | None = self._get_object_bytes(f"{self.prefix}/{s3_key}")
+        return data.decode("utf-8") if data is not None else None
 
     def list_manifest_keys(self, prefix: str) -> list[str]:
         """List all manifest keys under a given prefix.
@@ -372,16 +519,26 @@ class S3StorageBackend(StorageBackend):
         return f"{self.prefix}/{ref.key}"
 
     def chart_exists(self, ref: ChartRef) -> bool:
-        """Check if a chart is cached in S3."""
+        """Check if a chart is cached in S3.
+
+        Answers are remembered for the life of this backend.
+        """
         import botocore.exceptions
 
+        key: str = self._get_chart_key(ref)
+        known: bool | None = self._known_charts.get(key)
+        if known is not None:
+            return known
+
         try:
-            self.client.head_object(Bucket=self.bucket, Key=self._get_chart_key(ref))
-            return True
+            self.client.head_object(Bucket=self.bucket, Key=key)
+            exists = True
         except botocore.exceptions.ClientError as e:
-            if e.response["Error"]["Code"] == "404":
-                return False
-            raise
+            if e.response["Error"]["Code"] != "404":
+                raise
+            exists = False
+        self._known_charts[key] = exists
+        return exists
 
     def download_chart(self, ref: ChartRef, dest_path: Path) -> bool:
         """Download a cached chart from S3.
@@ -415,12 +572,14 @@ class S3StorageBackend(StorageBackend):
             ref: Chart reference
             source_path: Path to the .tgz file to upload
         """
+        key: str = self._get_chart_key(ref)
         self.client.upload_file(
             Filename=str(source_path),
             Bucket=self.bucket,
-            Key=self._get_chart_key(ref),
+            Key=key,
             ExtraArgs={"ContentType": "application/gzip"},
         )
+        self._known_charts[key] = True
 
     def list_cached_charts(self) -> list[ChartRef]:
         """List all cached charts."""
@@ -625,6 +784,65 @@ def list_aws_profiles() -> list[str]:
     return sorted(set(profiles))
 
 
+def get_cache_dir() -> Path:
+    """Get the per-user rita cache directory (honours XDG_CACHE_HOME)."""
+    base: str = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(base) / "rita"
+
+
+def probe_bucket_access(
+    backend: StorageBackend,
+    force: bool = False,
+    ttl: int = S3_PROBE_TTL_SECONDS,
+) -> bool:
+    """Verify the storage backend is reachable by listing its manifests.
+
+    For S3 backends, a successful probe is recorded in the user cache keyed on
+    (profile, region, endpoint, bucket) and skipped for ``ttl`` seconds unless
+    ``force`` is set. Failures are never cached and propagate to the caller.
+
+    Returns True if the backend was probed, False if a cached success was used.
+    """
+    if not isinstance(backend, S3StorageBackend):
+        backend.list_manifests()
+        return True
+
+    cache_file: Path = get_cache_dir() / "s3_ok.json"
+    key: str = "|".join(
+        [backend.profile or "", backend.region or "", backend.endpoint_url or "", backend.bucket]
+    )
+
+    entries: dict[str, float] = {}
+    with contextlib.suppress(OSError, ValueError):
+        cached = json.loads(cache_file.read_text(encoding="utf-8"))
+        # Anything but a mapping (e.g. a hand-edited or foreign file) is no cache.
+        if isinstance(cached, dict):
+            entries = cached
+
+    now: float = time.time()
+    checked_at = entries.get(key)
+    if (
+        not force
+        and isinstance(checked_at, int | float)
+        and now - checked_at < ttl
+    ):
+        return False
+
+    backend.list_manifests()
+
+    entries[key] = now
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(json.dumps(entries), encoding="utf-8")
+    except OSError:
+        pass
+    return True
+
+
+_chart_caches: dict[tuple[str | None, ...], S3StorageBackend] = {}
+_chart_caches_lock = threading.Lock()
+
+
 def get_chart_cache(config: RitaConfig) -> S3StorageBackend | None:
     """Get the S3 storage backend for chart caching.
 
@@ -637,12 +855,21 @@ def get_chart_cache(config: RitaConfig) -> S3StorageBackend | None:
 
     try:
         backend: StorageBackend = create_storage_backend(config)
-        if isinstance(backend, S3StorageBackend):
-            return backend
     except Exception:
-        pass
+        return None
+    if not isinstance(backend, S3StorageBackend):
+        return None
 
-    return None
+    # One backend (boto3 client and chart lookups) per bucket for the process.
+    key: tuple[str | None, ...] = (
+        backend.bucket,
+        backend.prefix,
+        backend.profile,
+        backend.region,
+        backend.endpoint_url,
+    )
+    with _chart_caches_lock:
+        return _chart_caches.setdefault(key, backend)
 
 
 class AWSTokenExpiredError(Exception):
@@ -656,6 +883,10 @@ class AWSTokenExpiredError(Exception):
             msg = "AWS SSO token has expired. Run: aws sso login"
         super().__init__(msg)
 
+    def __reduce__(self):
+        # Rebuild from the profile so the error survives crossing a process pool.
+        return (type(self), (self.profile,))
+
 
 def _is_token_expired_error(error: Exception) -> bool:
     """Check if an error is due to expired AWS SSO token."""
@@ -746,17 +977,85 @@ def upload_chart_to_cache(
         return True
 
     try:
-        with tempfile.NamedTemporaryFile(suffix=".tgz", delete=False) as tmp:
-            tgz_path = Path(tmp.name)
+        tgz_path: Path = _archive_chart(chart_name, chart_dir)
+    except Exception:
+        return False
+    return _send_chart_archive(cache, ref, tgz_path)
+
+
+_chart_upload_pool: ThreadPoolExecutor | None = None
+_chart_upload_pool_lock = threading.Lock()
+_CHART_UPLOAD_WORKERS = 4
 
+
+def queue_chart_upload(
+    cache: S3StorageBackend,
+    chart_name: str,
+    version: str,
+    chart_dir: Path,
+) -> None:
+    """Upload a chart directory to S3 cache in the background.
+
+    The chart is archived before returning, so chart_dir may be removed right
+    away; only the network transfer happens on a background thread. Failed
+    uploads are ignored, as with upload_chart_to_cache. Pending uploads finish
+    before the process exits, or when drain_chart_uploads() is called.
+    """
+    ref = ChartRef(chart_name=chart_name, version=version)
+
+    if cache.chart_exists(ref):
+        return
+
+    tgz_path: Path = _archive_chart(chart_name, chart_dir)
+    _get_chart_upload_pool().submit(_send_chart_archive, cache, ref, tgz_path)
+
+
+def drain_chart_uploads() -> None:
+    """Wait for chart uploads queued by queue_chart_upload to finish."""
+    global _chart_upload_pool
+
+    with _chart_upload_pool_lock:
+        pool: ThreadPoolExecutor | None = _chart_upload_pool
+        _chart_upload_pool = None
+    if pool is not None:
+        pool.shutdown(wait=True)
+
+
+def _get_chart_upload_pool() -> ThreadPoolExecutor:
+    global _chart_upload_pool
+
+    with _chart_upload_pool_lock:
+        if _chart_upload_pool is None:
+            import multiprocessing.util
+            from concurrent.futures import ThreadPoolExecutor
+
+            _chart_upload_pool = ThreadPoolExecutor(
+                max_workers=_CHART_UPLOAD_WORKERS, thread_name_prefix="rita-upload"
+            )
+            # Finalize (unlike atexit) also runs when pool workers exit, and
+            # its priority puts it ahead of the prepared-chart cleanup.
+            multiprocessing.util.Finalize(None, drain_chart_uploads, exitpriority=10)
+        return _chart_upload_pool
+
+
+def _archive_chart(chart_name: str, chart_dir: Path) -> Path:
+    with tempfile.NamedTemporaryFile(suffix=".tgz", delete=False) as tmp:
+        tgz_path = Path(tmp.name)
+
+    try:
         with tarfile.open(tgz_path, "w:gz") as tar:
             tar.add(chart_dir, arcname=chart_name)
+    except BaseException:
+        tgz_path.unlink(missing_ok=True)
+        raise
+    return tgz_path
 
-        cache.upload_chart(ref, tgz_path)
-
-        tgz_path.unlink()
 
+def _send_chart_archive(cache: S3StorageBackend, ref: ChartRef, tgz_path: Path) -> bool:
+    try:
+        cache.upload_chart(ref, tgz_path)
         return True
-
     except Exception:
         return False
+    finally:
+        tgz_path.unlink(missing_ok=True)
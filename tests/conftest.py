@@ -7,3 +7,9 @@ import pytest
 def sample_data() -> dict[str, str]:
     """Provide sample data for tests."""
     return {"key": "value"}
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cache_dir(tmp_path_factory, monkeypatch) -> None:
+    """Keep rita's per-user cache (e.g. helm template output) out of $HOME."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path_factory.mktemp("cache")))
@@ -171,3 +171,37 @@ spec:
         assert app.chart_name == "test-chart"
         assert app.chart_version == "0.2.14"
         assert app.namespace == "test-feature-namespace"
+
+    def test_to_app_configs_resolves_each_origin_once(self, tmp_path: Path):
+        (tmp_path / "local-chart").mkdir()
+        elements: list[ArgoAppSetGeneratorElement] = [
+            ArgoAppSetGeneratorElement(
+                name=f"app-{i}",
+                chart_name=origin,
+                chart_version="1.0.0",
+                values_file="",
+                namespace="ns",
+            )
+            for i, origin in enumerate(
+                ["local-chart", "remote-chart", "local-chart", "remote-chart"]
+            )
+        ]
+        appset = ArgoAppSetConfig(
+            name="appset",
+            namespace="argocd",
+            chart_repo="ghcr.io/SMLoureiro",
+            destination_server="https://kubernetes.default.svc",
+            destination_namespace="ns",
+            generator_elements=elements,
+            template_spec={},
+        )
+        resolved: list[str] = []
+
+        def resolver(name: str) -> Path:
+            resolved.append(name)
+            return tmp_path / name
+
+        apps: list[ArgoAppConfig] = appset.to_app_configs(resolver, tmp_path)
+
+        assert resolved == ["local-chart", "remote-chart"]
+        assert [app.is_local_chart for app in apps] == [True, False, True, False]
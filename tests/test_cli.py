@@ -95,6 +95,23 @@ class TestGetLocalChartVersion:
         version: str | None = get_local_chart_version(chart_path)
         assert version == "1.2.3"
 
+    def test_version_after_long_description(self, tmp_path: Path):
+        (tmp_path / "Chart.yaml").write_text(
+            "apiVersion: v2\n"
+            f"description: {'x' * 4096}\n"
+            "dependencies:\n"
+            "  - name: dep\n"
+            "    version: 9.9.9\n"
+            "version: '1.2.3' # bumped by CI\n"
+        )
+
+        assert get_local_chart_version(tmp_path) == "1.2.3"
+
+    def test_block_scalar_version_falls_back_to_yaml(self, tmp_path: Path):
+        (tmp_path / "Chart.yaml").write_text("name: c\nversion: >-\n  2.0.0\n")
+
+        assert get_local_chart_version(tmp_path) == "2.0.0"
+
     def test_chart_not_found(self, tmp_path: Path):
         nonexistent: Path = tmp_path / "nonexistent"
 
@@ -4,19 +4,26 @@ from __future__ import annotations
 
 from pathlib import Path
 from typing import Any
+from unittest.mock import MagicMock, patch
 
 import yaml
 
+from rita import config as config_mod
 from rita.config import (
     ChartConfig,
     ChartTestConfig,
     EnvironmentConfig,
+    RegistryConfig,
     RenderConfig,
     RitaConfig,
     StorageConfig,
+    clear_config_cache,
+    fetch_secret_from_aws,
     find_config_file,
     generate_default_config,
+    get_registry_credentials,
     load_config,
+    resolve_env_var,
     save_config,
 )
 
@@ -233,6 +240,33 @@ class TestRitaConfig:
         assert original.render.storage is not None
         assert restored.render.storage.s3_bucket == original.render.storage.s3_bucket
 
+    def test_save_config_with_tuple_paths(self, tmp_path: Path):
+        config_file: Path = tmp_path / ".rita.yaml"
+        config = RitaConfig(
+            environments=[EnvironmentConfig(name="test", paths=("a", "b"))],  # type: ignore[arg-type]
+        )
+
+        save_config(config, config_file)
+
+        data = yaml.safe_load(config_file.read_text())
+        assert data["environments"][0]["paths"] == ["a", "b"]
+
+    def test_save_config_shared_lists_have_no_anchors(self, tmp_path: Path):
+        config_file: Path = tmp_path / ".rita.yaml"
+        aliases = ["development"]
+        config = RitaConfig(
+            environments=[
+                EnvironmentConfig(name="dev", aliases=aliases),
+                EnvironmentConfig(name="staging", aliases=aliases),
+            ],
+        )
+
+        save_config(config, config_file)
+
+        content = config_file.read_text()
+        assert "&id" not in content
+        assert "*id" not in content
+
 
 class ChartTestConfigIO:
     """Tests for config file I/O functions."""
@@ -310,6 +344,7 @@ class ChartTestConfigIO:
 
         data = yaml.safe_load(yaml_str)
         assert data["auto_discover"] is True
+        assert generate_default_config() is yaml_str
 
 
 class TestEnvironmentConfig:
@@ -363,3 +398,139 @@ class TestChartTestConfig:
         assert config.cleanup_on_success is True
         assert config.cleanup_on_failure is False
         assert config.pre_install_manifests == []
+
+
+class TestRegistryConfig:
+    """Tests for RegistryConfig dataclass."""
+
+    def test_host_without_scheme(self):
+        reg = RegistryConfig(url="Docker.io")
+
+        assert reg.host == "docker.io"
+
+    def test_host_with_scheme_and_path(self):
+        reg = RegistryConfig(url="https://ghcr.io/example")
+
+        assert reg.host == "ghcr.io"
+
+
+    def test_credentials_match_docker_hub_aliases(self):
+        config = RitaConfig(
+            registries=[
+                RegistryConfig(url="https://ghcr.io", username="gh"),
+                RegistryConfig(url="docker.io", username="hub", password="pw"),
+            ]
+        )
+
+        assert get_registry_credentials(config, "registry-1.docker.io") == (
+            "hub",
+            "pw",
+        )
+        assert get_registry_credentials(config, "GHCR.io/org") == ("gh", None)
+        assert get_registry_credentials(config, "quay.io") == (None, None)
+
+    def test_to_dict_omits_unset_registry_fields(self):
+        config = RitaConfig(
+            registries=[
+                RegistryConfig(url="docker.io", aws_secret_name="hub"),
+                RegistryConfig(url="ghcr.io", username="gh", password="$TOKEN"),
+            ]
+        )
+
+        assert config.to_dict()["registries"] == [
+            {"url": "docker.io", "aws_secret_name": "hub"},
+            {"url": "ghcr.io", "username": "gh", "password": "$TOKEN"},
+        ]
+
+
+class TestLoadConfigCache:
+    """Tests for reuse of the located and parsed config file."""
+
+    def test_find_config_file_is_memoized(self, tmp_path: Path):
+        """Test that lookups are reused until the file goes away or is written."""
+        nested: Path = tmp_path / "a" / "b"
+        nested.mkdir(parents=True)
+        clear_config_cache()
+
+        assert find_config_file(nested) is None
+        config_file: Path = tmp_path / ".rita.yaml"
+        config_file.write_text("auto_discover: true\n")
+        assert find_config_file(nested) is None
+
+        clear_config_cache()
+        assert find_config_file(nested) == config_file
+        config_file.unlink()
+        assert find_config_file(nested) is None
+
+    def test_load_config_parses_each_version_once(self, tmp_path: Path):
+        """Test that an unchanged file is parsed once and edits are picked up."""
+        config_file: Path = tmp_path / ".rita.yaml"
+        config_file.write_text(yaml.safe_dump({"environments": [{"name": "a"}]}))
+
+        with patch.object(
+            RitaConfig, "from_dict", wraps=RitaConfig.from_dict
+        ) as from_dict:
+            first: RitaConfig = load_config(config_file)
+            first.environments.clear()
+            second: RitaConfig = load_config(config_file)
+            config_file.write_text(
+                yaml.safe_dump({"environments": [{"name": "edited"}]})
+            )
+            third: RitaConfig = load_config(config_file)
+
+        assert [e.name for e in second.environments] == ["a"]
+        assert [e.name for e in third.environments] == ["edited"]
+        assert from_dict.call_count == 2
+
+
+class TestResolveEnvVar:
+    """Tests for resolving env var references in credentials."""
+
+    def test_references_and_plain_values(self, monkeypatch):
+        monkeypatch.setenv("DOCKER_TOKEN", "secret")
+        monkeypatch.delenv("UNSET_TOKEN", raising=False)
+
+        assert resolve_env_var("$DOCKER_TOKEN") == "secret"
+        assert resolve_env_var("${DOCKER_TOKEN}") == "secret"
+        assert resolve_env_var("$UNSET_TOKEN") is None
+        assert resolve_env_var("plain") == "plain"
+        assert resolve_env_var(None) is None
+
+
+class TestFetchSecretFromAws:
+    """Tests for reuse of Secrets Manager clients and fetched secrets."""
+
+    def test_secret_is_fetched_once_per_key(self, monkeypatch):
+        monkeypatch.setattr(config_mod, "_secrets_clients", {})
+        monkeypatch.setattr(config_mod, "_fetched_secrets", {})
+        monkeypatch.delenv("CI", raising=False)
+        monkeypatch.delenv("GITHUB_ACTIONS", raising=False)
+        client = MagicMock()
+        client.get_secret_value.return_value = {
+            "SecretString": '{"username": "u", "password": "p"}'
+        }
+
+        with patch("boto3.Session") as session:
+            session.return_value.client.return_value = client
+            first = fetch_secret_from_aws("hub", "eu-west-1", "dev")
+            first["password"] = "changed"
+            second = fetch_secret_from_aws("hub", "eu-west-1", "dev")
+            fetch_secret_from_aws("other", "eu-west-1", "dev")
+
+        assert second == {"username": "u", "password": "p"}
+        session.assert_called_once_with(profile_name="dev", region_name="eu-west-1")
+        assert client.get_secret_value.call_count == 2
+
+    def test_failed_fetch_is_retried(self, monkeypatch):
+        monkeypatch.setattr(config_mod, "_secrets_clients", {})
+        monkeypatch.setattr(config_mod, "_fetched_secrets", {})
+        client = MagicMock()
+        client.get_secret_value.side_effect = [
+            RuntimeError("throttled"),
+            {"SecretString": '{"username": "u"}'},
+        ]
+
+        with patch("boto3.Session") as session:
+            session.return_value.client.return_value = client
+            assert fetch_secret_from_aws("hub") is None
+            assert fetch_secret_from_aws("hub") == {"username": "u"}
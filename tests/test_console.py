@@ -6,6 +6,7 @@ if TYPE_CHECKING:
     from rich.table import Table
 
 from rita.console import (
+    console,
     create_table,
     format_app,
     format_chart,
@@ -15,13 +16,16 @@ from rita.console import (
     format_local_marker,
     format_path,
     format_version,
+    print_app_list,
     print_bullet,
+    print_chart_list,
     print_diff,
     print_error,
     print_header,
     print_hint,
     print_info,
     print_key_value,
+    print_key_value_batch,
     print_note,
     print_progress,
     print_subheader,
@@ -116,6 +120,20 @@ class TestOutputFunctions:
     def test_print_key_value_no_crash(self):
         print_key_value("Key", "Value")
 
+    def test_print_key_value_batch_no_crash(self):
+        print_key_value_batch([("Key", "Value"), ("Other key", "Other value")])
+
+    def test_print_chart_list_no_crash(self):
+        print_chart_list([("nginx", True), ("redis", False)])
+
+    def test_print_app_list_no_crash(self):
+        print_app_list(
+            [
+                ("web", "nginx", "1.0.0", "default", True, ["values.yaml"]),
+                ("cache", "redis", "2.0.0", "cache", False, []),
+            ]
+        )
+
     def test_print_bullet_no_crash(self):
         print_bullet("Bullet point")
 
@@ -137,6 +155,12 @@ class TestOutputFunctions:
         ]
         print_diff(diff_lines)
 
+    def test_print_diff_keeps_brackets_literal(self):
+        with console.capture() as capture:
+            print_diff(["@@ -1 +1 @@", "-args: [a]", "+args: [/b]", " [bold]x"])
+
+        assert capture.get() == "@@ -1 +1 @@\n-args: [a]\n+args: [/b]\n [bold]x\n"
+
     def test_print_summary_no_crash(self):
         print_summary(success=5, errors=2)
 
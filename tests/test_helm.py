@@ -0,0 +1,501 @@
+"""Tests for helm chart operations."""
+
+from __future__ import annotations
+
+import datetime
+import io
+import math
+import threading
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+import yaml
+
+from rita import helm
+from rita.models import ArgoAppConfig
+
+
+def _app(name: str, chart_version: str = "1.0.0") -> ArgoAppConfig:
+    return ArgoAppConfig(
+        name=name,
+        chart_repo="oci://registry.example.com/charts",
+        chart_name="shared-chart",
+        chart_version=chart_version,
+        values_files=[],
+        namespace=name,
+        release_name=name,
+    )
+
+
+class TestPreparedChartCache:
+    """Tests for per-process reuse of prepared charts."""
+
+    @pytest.fixture(autouse=True)
+    def _clear_cache(self):
+        helm._prepared_charts.clear()
+        helm._prepared_chart_locks.clear()
+        yield
+        helm._prepared_charts.clear()
+        helm._prepared_chart_locks.clear()
+
+    @staticmethod
+    def _fake_prepare(app, temp_dir, _resolver):
+        chart_path = temp_dir / app.chart_name
+        chart_path.mkdir()
+        return True, "Chart pulled from OCI", chart_path
+
+    def test_apps_sharing_a_chart_prepare_it_once(self):
+        """Test that a second app with the same chart reuses the first pull."""
+        with patch.object(
+            helm, "prepare_chart_for_rendering", side_effect=self._fake_prepare
+        ) as mock_prepare:
+            first = helm.get_prepared_chart(_app("a"), lambda name: name)
+            second = helm.get_prepared_chart(_app("b"), lambda name: name)
+
+        assert mock_prepare.call_count == 1
+        assert first == second
+        assert first[2].is_dir()
+
+    def test_different_versions_are_prepared_separately(self):
+        """Test that the chart version is part of the cache key."""
+        with patch.object(
+            helm, "prepare_chart_for_rendering", side_effect=self._fake_prepare
+        ) as mock_prepare:
+            first = helm.get_prepared_chart(_app("a", "1.0.0"), lambda name: name)
+            second = helm.get_prepared_chart(_app("a", "2.0.0"), lambda name: name)
+
+        assert mock_prepare.call_count == 2
+        assert first[2] != second[2]
+
+    def test_failures_are_not_cached(self):
+        """Test that a failed preparation is retried on the next call."""
+        with patch.object(
+            helm,
+            "prepare_chart_for_rendering",
+            side_effect=[(False, "pull failed", None), (True, "ok", None)],
+        ) as mock_prepare:
+            assert helm.get_prepared_chart(_app("a"), lambda name: name)[0] is False
+            helm.get_prepared_chart(_app("a"), lambda name: name)
+
+        assert mock_prepare.call_count == 2
+
+
+class TestTemplateCache:
+    """Tests for per-process reuse of `helm template` output."""
+
+    @pytest.fixture(autouse=True)
+    def _clear_cache(self):
+        helm._template_cache.clear()
+        yield
+        helm._template_cache.clear()
+
+    @staticmethod
+    def _render(app, repo_root):
+        return helm.render_helm_chart_to_string(app, repo_root, lambda name: name)
+
+    def test_identical_inputs_render_once(self, tmp_path):
+        """Test that the same chart, release and values reuse the output."""
+        (tmp_path / "values.yaml").write_text("replicas: 1\n")
+        app = _app("a")
+        app.values_files = ["values.yaml"]
+        completed = MagicMock(stdout="kind: ConfigMap\n")
+
+        with (
+            patch.object(
+                helm, "get_prepared_chart", return_value=(True, "ok", tmp_path)
+            ),
+            patch.object(helm.subprocess, "run", return_value=completed) as run,
+        ):
+            first = self._render(app, tmp_path)
+            second = self._render(app, tmp_path)
+            (tmp_path / "values.yaml").write_text("replicas: 2\n")
+            third = self._render(app, tmp_path)
+
+        assert first == third == (True, "kind: ConfigMap\n", "ok")
+        assert second == (True, "kind: ConfigMap\n", "cached render")
+        assert run.call_count == 2
+
+    def test_inline_values_file_is_removed_after_render(self, tmp_path):
+        """Test that inline values reach helm through a short-lived scratch file."""
+        app = _app("a")
+        app.values_object = {"replicas": 3, "name": "web"}
+        seen: list[str] = []
+
+        def fake_helm(cmd, **_kwargs):
+            values_file = Path(cmd[cmd.index("--values") + 1])
+            seen.append(values_file.read_text())
+            return MagicMock(stdout="kind: ConfigMap\n")
+
+        with (
+            patch.object(
+                helm, "get_prepared_chart", return_value=(True, "ok", tmp_path)
+            ),
+            patch.object(helm.subprocess, "run", side_effect=fake_helm) as run,
+        ):
+            assert self._render(app, tmp_path)[0]
+
+        values_path = Path(run.call_args.args[0][-1])
+        assert seen == ['{"replicas": 3, "name": "web"}']
+        assert values_path.parent == helm._get_prepared_charts_root()
+        assert not values_path.exists()
+
+    def test_non_json_inline_values_are_written_as_yaml(self):
+        """Test that dates and NaN keep their YAML types in the values file."""
+        values = {
+            "since": datetime.date(2024, 1, 2),
+            "ratio": float("nan"),
+            "limits": {"cpu": float("inf"), "replicas": 2},
+        }
+        out = io.StringIO()
+
+        helm._dump_inline_values(values, out)
+
+        loaded = yaml.safe_load(out.getvalue())
+        assert loaded["since"] == datetime.date(2024, 1, 2)
+        assert math.isnan(loaded["ratio"])
+        assert loaded["limits"] == {"cpu": float("inf"), "replicas": 2}
+
+    def test_mixed_type_keys_in_inline_values(self, tmp_path):
+        """Test that values mapping int and str keys still produce a stable key."""
+
+        def key(values):
+            return helm._template_cache_key(
+                _app("a"), tmp_path, lambda name: name, False, values
+            )
+
+        assert key({1: "x", "b": {2: "y", "c": "z"}}) == key(
+            {"b": {"c": "z", 2: "y"}, 1: "x"}
+        )
+        assert key({1: "x"}) != key({"1": "x"})
+
+    def test_release_and_namespace_are_part_of_the_key(self, tmp_path):
+        """Test that apps differing only in release/namespace render separately."""
+        completed = MagicMock(stdout="kind: ConfigMap\n")
+
+        with (
+            patch.object(
+                helm, "get_prepared_chart", return_value=(True, "ok", tmp_path)
+            ),
+            patch.object(helm.subprocess, "run", return_value=completed) as run,
+        ):
+            self._render(_app("a"), tmp_path)
+            self._render(_app("b"), tmp_path)
+
+        assert run.call_count == 2
+
+
+class TestTemplateDiskCache:
+    """Tests for reuse of `helm template` output across runs."""
+
+    @pytest.fixture(autouse=True)
+    def _clear_cache(self):
+        helm._template_cache.clear()
+        helm._local_chart_digest.cache_clear()
+        yield
+        helm._template_cache.clear()
+        helm._local_chart_digest.cache_clear()
+
+    @staticmethod
+    def _render(app, repo_root, resolver=lambda name: name):
+        return helm.render_helm_chart_to_string(app, repo_root, resolver)
+
+    def test_later_run_skips_chart_preparation(self, tmp_path):
+        """Test that a new process reuses the rendered output from disk."""
+        completed = MagicMock(stdout="kind: ConfigMap\n")
+
+        with (
+            patch.object(
+                helm, "get_prepared_chart", return_value=(True, "ok", tmp_path)
+            ) as prepare,
+            patch.object(helm.subprocess, "run", return_value=completed) as run,
+        ):
+            self._render(_app("a"), tmp_path)
+            helm._template_cache.clear()
+            second = self._render(_app("a"), tmp_path)
+
+        assert second == (True, "kind: ConfigMap\n", "cached render")
+        assert run.call_count == 1
+        assert prepare.call_count == 1
+
+    def test_local_chart_is_keyed_by_content(self, tmp_path):
+        """Test that editing a local chart's template invalidates its renders."""
+        chart_dir = tmp_path / "charts" / "local-chart"
+        (chart_dir / "templates").mkdir(parents=True)
+        (chart_dir / "Chart.yaml").write_text("name: local-chart\nversion: 1.0.0\n")
+        template = chart_dir / "templates" / "cm.yaml"
+        template.write_text("kind: ConfigMap\n")
+        app = _app("a")
+        app.chart_name = "local-chart"
+        app.is_local_chart = True
+        completed = MagicMock(stdout="kind: ConfigMap\n")
+
+        def resolve(name):
+            return tmp_path / "charts" / name
+
+        with (
+            patch.object(
+                helm, "get_prepared_chart", return_value=(True, "ok", chart_dir)
+            ),
+            patch.object(helm.subprocess, "run", return_value=completed) as run,
+        ):
+            self._render(app, tmp_path, resolve)
+            helm._template_cache.clear()
+            self._render(app, tmp_path, resolve)
+            template.write_text("kind: Secret\n")
+            helm._template_cache.clear()
+            helm._local_chart_digest.cache_clear()
+            self._render(app, tmp_path, resolve)
+
+        assert run.call_count == 2
+
+    def test_unlocked_remote_dependencies_are_not_persisted(self, tmp_path):
+        """Test that a chart whose dependencies may float is never cached."""
+        (tmp_path / "Chart.yaml").write_text(
+            "name: c\ndependencies:\n"
+            "  - name: redis\n    version: ^18\n"
+            "    repository: https://charts.example.com\n"
+        )
+        assert helm._local_chart_digest(str(tmp_path)) is None
+
+        (tmp_path / "Chart.lock").write_text("dependencies: []\n")
+        helm._local_chart_digest.cache_clear()
+        assert helm._local_chart_digest(str(tmp_path)) is not None
+
+    @pytest.mark.parametrize(
+        ("version", "persisted"),
+        [
+            ("1.2.3", True),
+            ("v1.2.3-rc.1+build.5", True),
+            ("latest", False),
+            ("1.2.*", False),
+            (">=1.0.0", False),
+            ("^1.2", False),
+            ("", False),
+        ],
+    )
+    def test_only_pinned_remote_versions_are_persisted(
+        self, tmp_path, version, persisted
+    ):
+        """Test that floating remote versions never reach the disk cache."""
+        key = helm._persistent_template_key(
+            _app("a", chart_version=version), tmp_path, lambda name: name, False
+        )
+        assert (key is not None) is persisted
+
+    def test_cull_drops_least_recently_used(self, tmp_path):
+        """Test that culling removes the oldest renders first."""
+        import os
+
+        for i, name in enumerate(["old", "mid", "new"]):
+            path = tmp_path / "ab" / f"{name}.yaml"
+            path.parent.mkdir(exist_ok=True)
+            path.write_text("x" * 100)
+            os.utime(path, (i, i))
+
+        helm._cull_template_disk_cache(tmp_path, max_bytes=250)
+
+        assert sorted(p.stem for p in tmp_path.glob("*/*.yaml")) == ["mid", "new"]
+
+
+class TestExtractRegistryHost:
+    """Tests for reducing a registry URL to the host helm logs in to."""
+
+    def test_scheme_and_path_are_dropped(self):
+        assert helm._extract_registry_host("https://ghcr.io/org/charts") == "ghcr.io"
+        assert helm._extract_registry_host("http://localhost:5000") == "localhost:5000"
+        assert helm._extract_registry_host("registry.example.com") == (
+            "registry.example.com"
+        )
+
+
+class TestAppSetExpansion:
+    """Tests for rendering the children of an ApplicationSet."""
+
+    def test_children_render_concurrently_in_order(self, tmp_path):
+        """Test that children render on worker threads and keep their order."""
+        children = [_app(f"child-{i}") for i in range(4)]
+        appset = MagicMock()
+        appset.to_app_configs.return_value = children
+        started = threading.Barrier(len(children), timeout=5)
+
+        def render(app, *_args):
+            if app.name.startswith("child"):
+                started.wait()
+            if app.name == "child-2":
+                return False, "", "boom"
+            return True, f"name: {app.name}\n", "ok"
+
+        with (
+            patch.object(helm, "render_helm_chart_to_string", side_effect=render),
+            patch.object(
+                helm, "parse_applicationset_from_manifest", return_value=appset
+            ),
+        ):
+            success, msg, rendered = helm.render_application_with_appset_expansion(
+                _app("root"), tmp_path, tmp_path, lambda name: name
+            )
+
+        assert success
+        assert [app.name for app in rendered] == ["child-0", "child-1", "child-3"]
+        assert msg.endswith("child-0, child-1, child-3 (errors: child-2: boom)")
+        combined = (tmp_path / "_all.yaml").read_text()
+        assert combined.index("child-0") < combined.index("child-3")
+        assert sorted(p.relative_to(tmp_path) for p in tmp_path.rglob("_all.yaml")) == [
+            Path("_all.yaml")
+        ]
+        assert (tmp_path / "child-0" / "unknown.yaml").read_text() == "name: child-0\n"
+
+
+class TestWriteRenderedOutput:
+    """Tests for splitting rendered manifests into per-kind files."""
+
+    def test_documents_are_grouped_by_top_level_kind(self, tmp_path):
+        """Test that documents are bucketed verbatim and comment-only ones skipped."""
+        rendered = (
+            "---\n"
+            "# Source: app/templates/cm.yaml\n"
+            "apiVersion: v1\n"
+            "kind: ConfigMap\n"
+            "data:\n"
+            "  nested: |\n"
+            "    kind: Secret\n"
+            "---\n"
+            "# Source: app/templates/empty.yaml\n"
+            "---\n"
+            'kind: "Service"\n'
+            "spec:\n"
+            "  kind: ignored\n"
+            "---\n"
+            "kind: ConfigMap\n"
+            "metadata: {name: b}\n"
+        )
+
+        assert helm._write_rendered_output(rendered, tmp_path) == 3
+        assert (tmp_path / "_all.yaml").read_text() == rendered
+        assert (tmp_path / "configmap.yaml").read_text() == (
+            "# Source: app/templates/cm.yaml\n"
+            "apiVersion: v1\n"
+            "kind: ConfigMap\n"
+            "data:\n"
+            "  nested: |\n"
+            "    kind: Secret\n"
+            "---\n"
+            "kind: ConfigMap\n"
+            "metadata: {name: b}\n"
+        )
+        assert (tmp_path / "service.yaml").read_text() == (
+            'kind: "Service"\nspec:\n  kind: ignored\n'
+        )
+        assert sorted(p.name for p in tmp_path.iterdir()) == [
+            "_all.yaml",
+            "configmap.yaml",
+            "service.yaml",
+        ]
+
+
+class TestSharedHelmRepo:
+    """Tests for reusing a traditional helm repo's config and index."""
+
+    def test_repo_is_added_once_and_refreshed_when_stale(self):
+        """Test that later calls reuse the index until it is older than the TTL."""
+        calls: list[list[str]] = []
+
+        def fake_helm(cmd, **kwargs):
+            calls.append(cmd[:3])
+            if cmd[:3] == ["helm", "repo", "add"]:
+                config = Path(kwargs["env"]["HELM_REPOSITORY_CONFIG"])
+                config.write_text("repositories: []\n")
+                cache = Path(kwargs["env"]["HELM_REPOSITORY_CACHE"])
+                cache.mkdir()
+                (cache / f"{helm.HELM_REPO_NAME}-index.yaml").write_text("")
+            return MagicMock(returncode=0)
+
+        with patch.object(helm.subprocess, "run", side_effect=fake_helm):
+            first = helm._shared_helm_repo("https://charts.example.com")
+            second = helm._shared_helm_repo("https://charts.example.com")
+            stale: int = helm.HELM_REPO_INDEX_TTL_SECONDS + 1
+            with patch.object(helm, "_repo_index_age", return_value=stale):
+                helm._shared_helm_repo("https://charts.example.com")
+            helm._shared_helm_repo("https://other.example.com")
+
+        assert first == second
+        assert calls == [
+            ["helm", "repo", "add"],
+            ["helm", "repo", "update"],
+            ["helm", "repo", "add"],
+        ]
+
+    def test_failed_add_returns_none(self):
+        with patch.object(
+            helm.subprocess, "run", return_value=MagicMock(returncode=1)
+        ) as run:
+            assert helm._shared_helm_repo("https://bad.example.com") is None
+            assert helm._shared_helm_repo("https://bad.example.com") is None
+
+        assert run.call_count == 2
+
+
+class TestCopyFileDependencies:
+    """Tests for copying file:// chart dependencies."""
+
+    def test_dependency_tree_is_copied_and_parsed_once(self, tmp_path):
+        """Test that deps are copied without VCS dirs and parsed once per file."""
+        charts = tmp_path / "charts"
+        for name, deps in (("app", ["lib"]), ("lib", ["base"]), ("base", [])):
+            (charts / name).mkdir(parents=True)
+            entries = "".join(f"  - repository: file://../{d}\n" for d in deps)
+            (charts / name / "Chart.yaml").write_text(f"dependencies:\n{entries}")
+        (charts / "lib" / ".git").mkdir()
+        helm._read_chart_dependency_repos.cache_clear()
+
+        with patch.object(helm.yaml, "load", wraps=helm.yaml.load) as load:
+            for render in ("first", "second"):
+                temp_dir = tmp_path / render
+                temp_dir.mkdir()
+                helm._copy_file_dependencies(charts / "app", charts, temp_dir)
+                assert sorted(p.name for p in temp_dir.iterdir()) == ["base", "lib"]
+
+        assert load.call_count == 3
+        assert (tmp_path / "first" / "lib" / "Chart.yaml").exists()
+        assert not (tmp_path / "first" / "lib" / ".git").exists()
+
+
+class TestIsOciRegistry:
+    """Tests for telling OCI registries from traditional helm repos."""
+
+    @pytest.mark.parametrize(
+        ("repo_url", "expected"),
+        [
+            ("oci://example.com/charts", True),
+            ("ghcr.io/org", True),
+            ("123.dkr.ecr.eu-west-1.amazonaws.com", True),
+            ("https://org.github.io/charts", False),
+            ("https://charts.bitnami.com/bitnami", False),
+            ("quay.io/org/helm", False),
+            ("https://example.com", False),
+        ],
+    )
+    def test_classification(self, repo_url, expected):
+        assert helm.is_oci_registry(repo_url) is expected
+
+
+class TestFindExtractedChart:
+    """Tests for locating the directory helm pull extracted a chart into."""
+
+    def test_prefers_chart_name_then_any_directory(self, tmp_path):
+        (tmp_path / "chart.tgz").write_text("")
+        (tmp_path / "other").mkdir()
+
+        assert helm._find_extracted_chart(tmp_path, "org/other") == (
+            True,
+            str(tmp_path / "other"),
+        )
+        assert helm._find_extracted_chart(tmp_path, "renamed") == (
+            True,
+            str(tmp_path / "other"),
+        )
+        assert helm._find_chart_dir(tmp_path / "other") == (
+            False,
+            "Chart extracted but no directory found",
+        )
@@ -10,7 +10,7 @@ from click.testing import CliRunner
 if TYPE_CHECKING:
     from pathlib import Path
 
-from rita.commands.init_cmd import init
+from rita.commands.init_cmd import _existing_paths, _gitignore_mentions, init
 from rita.config import ChartConfig, EnvironmentConfig, RenderConfig, RitaConfig, StorageConfig
 
 
@@ -189,3 +189,39 @@ class TestRenderConfigPrompts:
         )
 
         assert render_config.storage is None
+
+
+class TestGitignoreMentions:
+    """Tests for the .gitignore scan at the end of init."""
+
+    def test_found(self, tmp_path: Path):
+        gitignore: Path = tmp_path / ".gitignore"
+        gitignore.write_text("node_modules/\n.rita.yaml\n")
+
+        assert _gitignore_mentions(gitignore, ".rita.yaml") is True
+
+    def test_missing(self, tmp_path: Path):
+        gitignore: Path = tmp_path / ".gitignore"
+        gitignore.write_text("node_modules/\n")
+
+        assert _gitignore_mentions(gitignore, ".rita.yaml") is False
+
+    def test_commented_out(self, tmp_path: Path):
+        gitignore: Path = tmp_path / ".gitignore"
+        gitignore.write_text("# .rita.yaml\n")
+
+        assert _gitignore_mentions(gitignore, ".rita.yaml") is False
+
+
+class TestExistingPaths:
+    """Tests for the environment path check in init's next steps."""
+
+    def test_mixed(self, tmp_path: Path):
+        (tmp_path / "apps" / "dev").mkdir(parents=True)
+
+        existing = _existing_paths(tmp_path, ["apps/dev", "apps/prod", "missing/dir"])
+
+        assert existing == {"apps/dev"}
+
+    def test_empty(self, tmp_path: Path):
+        assert _existing_paths(tmp_path, []) == set()
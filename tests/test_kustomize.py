@@ -170,6 +170,29 @@ metadata:
         assert "app-0" in deployment_content
         assert "app-1" in deployment_content
 
+    def test_render_plain_manifests_interleaved_kinds(self, tmp_path: Path):
+        """Documents of one kind keep their order when other kinds sit between them."""
+        manifests_dir = tmp_path / "manifests"
+        manifests_dir.mkdir()
+
+        docs = [
+            {"kind": "ConfigMap", "metadata": {"name": "first"}},
+            {"kind": "Service", "metadata": {"name": "svc"}},
+            {"kind": "ConfigMap", "metadata": {"name": "second"}},
+        ]
+        (manifests_dir / "resources.yaml").write_text(yaml.safe_dump_all(docs))
+
+        output_dir = tmp_path / "output"
+        success, _message = render_plain_manifests(manifests_dir, output_dir)
+
+        assert success is True
+        configmaps = list(
+            yaml.safe_load_all((output_dir / "configmap.yaml").read_text())
+        )
+        assert [d["metadata"]["name"] for d in configmaps] == ["first", "second"]
+        services = list(yaml.safe_load_all((output_dir / "service.yaml").read_text()))
+        assert services == [docs[1]]
+
 
 class TestRenderKustomize:
     def test_render_kustomize_missing_kustomization_file(self, tmp_path: Path):
@@ -0,0 +1,887 @@
+"""Tests for the render command module."""
+
+from __future__ import annotations
+
+import hashlib
+import importlib
+import io
+import os
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import botocore.exceptions
+import pytest
+import yaml
+from click.testing import CliRunner
+
+from rita.storage import ManifestObject, ManifestRef, S3StorageBackend
+
+render_mod = importlib.import_module("rita.commands.render")
+
+
+class TestScratchDirPool:
+    """Tests for the per-process scratch directory pool."""
+
+    def test_slot_is_reused_and_emptied(self):
+        """Test that a released slot is cleared and handed out again."""
+        pool = render_mod._ScratchDirPool()
+
+        with pool.acquire() as first:
+            (first / "helm").mkdir()
+            (first / "helm" / "_all.yaml").write_text("kind: ConfigMap\n")
+            (first / "current.yaml").write_text("kind: Secret\n")
+
+        assert first.is_dir()
+        assert list(first.iterdir()) == []
+
+        with pool.acquire() as second:
+            assert second == first
+
+    def test_slots_are_created_under_parent(self, tmp_path):
+        """Test that a parent directory gets its own scratch root."""
+        pool = render_mod._ScratchDirPool()
+        parent = tmp_path / "rendered" / "dev"
+
+        with pool.acquire(parent) as slot:
+            assert slot.parent.parent == parent
+
+        with pool.acquire() as default_slot:
+            assert not default_slot.is_relative_to(tmp_path)
+
+    def test_roots_of_dead_processes_are_swept(self, tmp_path):
+        """Test that scratch left by a killed render is removed on next use."""
+        stale = tmp_path / ".rita-scratch-999999999-abc" / "slot-0" / "helm"
+        stale.mkdir(parents=True)
+        (stale / "_all.yaml").write_text("kind: ConfigMap\n")
+        unrelated = tmp_path / "keep-me"
+        unrelated.mkdir()
+
+        pool = render_mod._ScratchDirPool()
+        with pool.acquire(tmp_path) as slot:
+            assert slot.parent.name.startswith(f".rita-scratch-{os.getpid()}-")
+
+        assert not stale.parents[1].exists()
+        assert unrelated.is_dir()
+
+    def test_scratch_parent_is_outside_rendered_tree(self, tmp_path):
+        """Test that render scratch never lands where push looks for apps."""
+        rendered = tmp_path / "rendered"
+
+        with patch.object(
+            render_mod, "get_rendered_manifests_path", return_value=rendered
+        ):
+            parent = render_mod._scratch_parent()
+
+        assert parent == tmp_path / ".rendered-scratch"
+        assert not parent.is_relative_to(rendered)
+        assert (parent / ".gitignore").read_text() == "*\n"
+
+    def test_nested_acquire_uses_distinct_slots(self):
+        """Test that concurrent holders never share a slot."""
+        pool = render_mod._ScratchDirPool()
+
+        with pool.acquire() as outer, pool.acquire() as inner:
+            assert outer != inner
+            assert outer.parent == inner.parent
+
+
+class TestRenderPush:
+    """Tests for the render push command."""
+
+    def test_push_uploads_every_manifest(self, tmp_path):
+        """Test that concurrent push uploads each _all.yaml once."""
+        for app in ("app-a", "app-b", "app-c"):
+            app_dir = tmp_path / "rendered" / "dev" / app
+            app_dir.mkdir(parents=True)
+            (app_dir / "_all.yaml").write_text(f"name: {app}\n")
+
+        backend = MagicMock(spec=S3StorageBackend)
+        cfg = MagicMock()
+        cfg.render.storage.s3_bucket = "bucket"
+
+        with (
+            patch.object(render_mod, "load_config", return_value=cfg),
+            patch.object(render_mod, "create_storage_backend", return_value=backend),
+            patch.object(render_mod, "get_repo_root", return_value=tmp_path),
+        ):
+            result = CliRunner().invoke(
+                render_mod.render,
+                ["push", "--env", "dev", "--branch", "main", "--push-workers", "2"],
+            )
+
+        assert result.exit_code == 0, result.output
+        uploaded = {call.args for call in backend.upload_manifest.call_args_list}
+        assert uploaded == {
+            ("dev/app-a/_all.yaml", "name: app-a\n"),
+            ("dev/app-b/_all.yaml", "name: app-b\n"),
+            ("dev/app-c/_all.yaml", "name: app-c\n"),
+        }
+
+
+class TestConcatManifests:
+    """Tests for streamed manifest concatenation."""
+
+    def test_matches_stripped_join(self, tmp_path):
+        """Test that output equals joining stripped contents with separators."""
+        contents = ["\n\nkind: A\n  \n", "kind: B\nmetadata: {}\n", "   ", "kind: C"]
+        sources = []
+        for i, text in enumerate(contents):
+            path = tmp_path / f"src{i}.yaml"
+            path.write_text(text)
+            sources.append(path)
+
+        dest = tmp_path / "out.yaml"
+        render_mod._concat_manifests(sources, dest)
+
+        expected = "\n---\n".join(text.strip() for text in contents)
+        assert dest.read_text() == expected
+
+    def test_small_chunks_keep_inner_whitespace(self):
+        """Test that whitespace between chunks is kept unless it is trailing."""
+        src = io.BytesIO(b"  a: 1\n\n   \nb: 2\n\n")
+        dst = io.BytesIO()
+
+        render_mod._copy_stripped(src, dst, chunk_size=3)
+
+        assert dst.getvalue() == b"a: 1\n\n   \nb: 2"
+
+
+class TestDiffManifests:
+    """Tests for manifest-level diffing."""
+
+    BASELINE = (
+        "apiVersion: v1\nkind: ConfigMap\nmetadata:\n  name: cm\n  namespace: ns\n"
+        "data:\n  key: old\n"
+        "---\n"
+        "apiVersion: v1\nkind: Service\nmetadata:\n  name: svc\n"
+    )
+
+    def test_identical_content_has_no_diff(self):
+        """Test that identical manifests produce no diff."""
+        assert render_mod._diff_manifests(self.BASELINE, self.BASELINE) == (False, "")
+
+    def test_identical_content_skips_parsing(self):
+        """Test that byte-identical inputs return before splitting."""
+        with patch.object(render_mod, "_parse_docs") as mock_parse:
+            assert render_mod._diff_manifests("kind: A", "kind: A") == (False, "")
+
+        mock_parse.assert_not_called()
+
+    def test_changed_manifest_is_reported_by_identity(self):
+        """Test that only the changed manifest appears in the diff."""
+        current = self.BASELINE.replace("key: old", "key: new")
+
+        has_diff, diff = render_mod._diff_manifests(self.BASELINE, current)
+
+        assert has_diff
+        assert "baseline/ConfigMap/ns/cm" in diff
+        assert "-  key: old" in diff
+        assert "+  key: new" in diff
+        assert "Service/svc" not in diff
+
+    def test_without_content_skips_formatting(self):
+        """Test that a has_diff-only check never builds the diff text."""
+        current = self.BASELINE.replace("key: old", "key: new")
+
+        with patch.object(render_mod, "_unified_manifest_diff") as mock_diff:
+            result = render_mod._diff_manifests(
+                self.BASELINE, current, with_content=False
+            )
+
+        assert result == (True, "")
+        mock_diff.assert_not_called()
+
+    def test_added_and_removed_manifests(self):
+        """Test that new and removed manifests are labelled."""
+        current = self.BASELINE.replace("name: svc", "name: svc2")
+
+        has_diff, diff = render_mod._diff_manifests(self.BASELINE, current)
+
+        assert has_diff
+        assert "+++ NEW: Service/svc2" in diff
+        assert "--- REMOVED: Service/svc" in diff
+
+    def test_long_diff_is_truncated(self):
+        """Test that a manifest diff stops at the per-manifest line limit."""
+        baseline = "kind: ConfigMap\nmetadata:\n  name: big\ndata:\n" + "".join(
+            f"  k{i}: old\n" for i in range(50)
+        )
+        current = baseline.replace(": old", ": new")
+
+        has_diff, diff = render_mod._diff_manifests(
+            baseline, current, max_lines_per_manifest=10
+        )
+
+        assert has_diff
+        assert diff.count("\n") == 11
+        assert diff.endswith("... (truncated, showing first 10 lines)\n")
+
+    def test_only_changed_top_level_keys_are_diffed(self):
+        """Test that a small edit in a large manifest yields a small diff."""
+        baseline = (
+            "kind: ConfigMap\nmetadata:\n  name: big\ndata:\n"
+            + "".join(f"  k{i}: v\n" for i in range(100))
+            + "spec:\n  replicas: 1\n"
+        )
+        current = baseline.replace("k50: v", "k50: w")
+
+        has_diff, diff = render_mod._diff_manifests(baseline, current)
+
+        assert has_diff
+        assert "### key: data\n" in diff
+        assert "### key: spec" not in diff
+        assert "-  k50: v\n+  k50: w\n" in diff
+        assert "k46: v" not in diff
+        assert "k47: v" in diff
+
+    def test_unsplittable_manifest_falls_back_to_whole_diff(self):
+        """Test that documents without plain top-level keys are diffed whole."""
+        has_diff, diff = render_mod._diff_manifests(
+            "{kind: A, metadata: {name: x}, v: 1}",
+            "{kind: A, metadata: {name: x}, v: 2}",
+        )
+
+        assert has_diff
+        assert "### key:" not in diff
+        assert "baseline/A/x" in diff
+        assert "+{kind: A, metadata: {name: x}, v: 2}" in diff
+
+    def test_unparseable_documents_have_stable_keys(self):
+        """Test that unparseable documents get a deterministic identity."""
+        render_mod._parse_docs.cache_clear()
+
+        raw = "kind: A\n  bad: [indent"
+        digest = hashlib.blake2b(raw.encode(), digest_size=8).hexdigest()
+
+        assert render_mod._parse_docs(raw) == {f"unparseable-{digest}": raw}
+
+    def test_parse_docs_is_cached_by_content(self):
+        """Test that identical content is split and parsed only once."""
+        render_mod._parse_docs.cache_clear()
+
+        first = render_mod._parse_docs(self.BASELINE)
+        second = render_mod._parse_docs("".join(list(self.BASELINE)))
+
+        assert second is first
+        assert set(first) == {"ConfigMap/ns/cm", "Service/svc"}
+
+
+class TestManifestIdentity:
+    """Tests for regex-based manifest identity extraction."""
+
+    @pytest.mark.parametrize(
+        "raw",
+        [
+            "kind: ConfigMap\nmetadata:\n  name: cm\n  namespace: ns\ndata:\n  name: x",
+            "kind: Service\nmetadata:\n  labels:\n    name: lbl\n  name: svc # note",
+            "kind: Service\nmetadata:\n    namespace: a\n\n    name: b\nspec: {}",
+            "# Source: chart/templates/job.yaml\nkind: Job\nmetadata:\n  name: j\n",
+            "kind: Job\nspec:\n  template:\n    metadata:\n      name: inner\n"
+            "metadata:\n  name: outer",
+        ],
+    )
+    def test_matches_parsed_identity(self, raw):
+        """Test that block-style manifests resolve like the parsed document."""
+        expected = render_mod._get_manifest_name(yaml.safe_load(raw))
+        assert render_mod._manifest_identity(raw) == expected
+
+    @pytest.mark.parametrize(
+        "raw",
+        [
+            'kind: Service\nmetadata:\n  name: "quoted"',
+            "kind: Service\nmetadata:\n  name: true",
+            "kind: Service\nmetadata: {name: flow}",
+            "kind: Service\nmetadata:\n  <<: *base",
+            "kind: Job\nmetadata:\n  name: 1e3",
+            "kind: Job\nmetadata:\n  name: a\n  name: b",
+            "kind: Job\nmetadata:\n  name: x\nkind: Pod",
+            "kind: Job\nmetadata:\n  generateName: job-\n",
+            'kind: Job\nmetadata:\n  "name": foo',
+            "kind: Job\nmetadata:\n  labels:\n    a: b\n# comment\n  name: late",
+            "kind: Job\nmetadata:\n  name: foo#bar",
+            "kind: Job\nmetadata:\n  name: foo\n    bar",
+        ],
+    )
+    def test_ambiguous_manifests_fall_back(self, raw):
+        """Test that anything the regexes can't read exactly is left to YAML."""
+        assert render_mod._manifest_identity(raw) is None
+
+
+class TestGetChangedFilesFromGit:
+    """Tests for listing changed files from git."""
+
+    def test_paths_are_split_on_nul(self):
+        """Test that NUL-separated output keeps paths with spaces intact."""
+        completed = MagicMock(stdout="charts/a b/values.yaml\0README.md\0")
+
+        with patch.object(render_mod.subprocess, "run", return_value=completed) as run:
+            files = render_mod._get_changed_files_from_git("origin/main")
+
+        assert files == ["charts/a b/values.yaml", "README.md"]
+        assert "-z" in run.call_args.args[0]
+        assert "--no-renames" in run.call_args.args[0]
+
+
+class TestFindAffectedApps:
+    """Tests for mapping changed files to affected apps."""
+
+    @staticmethod
+    def _app(name, chart_name="", is_local_chart=False, values_files=()):
+        return SimpleNamespace(
+            name=name,
+            chart_name=chart_name,
+            is_local_chart=is_local_chart,
+            values_files=list(values_files),
+        )
+
+    def test_first_matching_file_per_app(self):
+        """Test that each app is reported once with its first matching file."""
+        web = self._app("web", "web-chart", True, ["values/web.yaml"])
+        api = self._app("api", "api-chart", False)
+        db = self._app("db")
+        changed = [
+            "README.md",
+            "values/web.yaml",
+            "charts/web-chart/templates/deploy.yaml",
+            "charts/api-chart/Chart.yaml",
+            "kubernetes/api/kustomization.yaml",
+        ]
+
+        with patch.object(render_mod, "list_apps_for_env", return_value=[web, api, db]):
+            affected = render_mod._find_affected_apps(changed, ["dev", "prod"])
+
+        assert [(env, app.name, f) for env, app, f in affected] == [
+            ("dev", "web", "values/web.yaml"),
+            ("dev", "api", "kubernetes/api/kustomization.yaml"),
+            ("prod", "web", "values/web.yaml"),
+            ("prod", "api", "kubernetes/api/kustomization.yaml"),
+        ]
+
+    def test_directory_prefix_must_match_whole_name(self):
+        """Test that charts/<name>-suffix/ doesn't match chart <name>."""
+        app = self._app("web", "web", True)
+
+        with patch.object(render_mod, "list_apps_for_env", return_value=[app]):
+            affected = render_mod._find_affected_apps(
+                ["charts/web-extra/values.yaml", "kubernetes/webapp/a.yaml"], ["dev"]
+            )
+
+        assert affected == []
+
+
+class TestLinkOrCopy:
+    """Tests for placing single-source manifests."""
+
+    def test_links_on_same_filesystem(self, tmp_path):
+        """Test that the destination shares the source inode when possible."""
+        src = tmp_path / "src.yaml"
+        src.write_text("kind: A\n")
+        dest = tmp_path / "dest.yaml"
+
+        render_mod._link_or_copy(src, dest)
+
+        assert dest.read_text() == "kind: A\n"
+        assert dest.stat().st_ino == src.stat().st_ino
+
+    def test_falls_back_to_copy(self, tmp_path):
+        """Test that a failed link (e.g. cross-device) copies instead."""
+        src = tmp_path / "src.yaml"
+        src.write_text("kind: A\n")
+        dest = tmp_path / "dest.yaml"
+
+        with patch.object(render_mod.os, "link", side_effect=OSError("EXDEV")):
+            render_mod._link_or_copy(src, dest)
+
+        assert dest.read_text() == "kind: A\n"
+        assert dest.stat().st_ino != src.stat().st_ino
+
+
+class TestRenderSingleAppMerge:
+    """Tests for merging multi-source renders."""
+
+    def test_kustomize_and_plain_sources_are_merged(self, tmp_path):
+        """Test that _all.yaml and shared per-kind files are concatenated."""
+
+        def fake_kustomize(_path, out_dir):
+            (out_dir / "_all.yaml").write_text("kind: Service\n")
+            (out_dir / "service.yaml").write_text("kind: Service\n")
+            (out_dir / "configmap.yaml").write_text("kind: ConfigMap\n")
+            return True, "ok"
+
+        def fake_plain(_path, out_dir):
+            (out_dir / "_all.yaml").write_text("\nkind: Secret\n")
+            (out_dir / "configmap.yaml").write_text("kind: ConfigMap\n")
+            return True, "ok"
+
+        app = SimpleNamespace(
+            name="app",
+            chart_name="",
+            is_kustomize=True,
+            kustomize_path="k",
+            plain_manifests_path="p",
+        )
+        output_path = tmp_path / "rendered" / "dev" / "app"
+
+        with (
+            patch.object(render_mod, "get_rendered_path", return_value=output_path),
+            patch.object(render_mod, "render_kustomize", side_effect=fake_kustomize),
+            patch.object(render_mod, "render_plain_manifests", side_effect=fake_plain),
+            # Scratch lives beside the output, so linking must not fall back.
+            patch.object(render_mod.shutil, "copyfile", side_effect=AssertionError),
+        ):
+            result = render_mod._render_single_app(app, "dev", False, tmp_path)
+
+        assert result.success
+        assert result.message == "Rendered Kustomize + Plain YAML"
+        assert (output_path / "_all.yaml").read_text() == (
+            "kind: Service\n---\nkind: Secret"
+        )
+        assert (output_path / "service.yaml").read_text() == "kind: Service\n"
+        assert (output_path / "configmap.yaml").read_text() == (
+            "kind: ConfigMap\n---\nkind: ConfigMap"
+        )
+
+
+class TestBrokenProcessPool:
+    """Tests for surviving a worker process that dies mid-run."""
+
+    @staticmethod
+    def _broken_pool():
+        from concurrent.futures import Future
+        from concurrent.futures.process import BrokenProcessPool
+
+        def submit(*_args, **_kwargs):
+            future = Future()
+            future.set_exception(BrokenProcessPool("worker killed"))
+            return future
+
+        pool = MagicMock()
+        pool.submit.side_effect = submit
+        return pool
+
+    def test_render_reports_apps_and_discards_pool(self, tmp_path):
+        """Test that a dead render worker fails its apps instead of the run."""
+        apps = [SimpleNamespace(name="app-a"), SimpleNamespace(name="app-b")]
+        pool = self._broken_pool()
+
+        with (
+            patch.object(render_mod, "list_apps_for_env", return_value=apps),
+            patch.object(render_mod, "get_repo_root", return_value=tmp_path),
+            patch.object(render_mod, "_get_render_pool", return_value=pool),
+            patch.object(render_mod, "_render_pool", pool),
+        ):
+            counts = render_mod._render_applications("dev", None, False, workers=2)
+            assert render_mod._render_pool is None
+
+        assert counts == (0, 2)
+        pool.shutdown.assert_called()
+
+    def test_render_single_app_skips_pool(self, tmp_path):
+        """Test that one app is rendered in-process even with several workers."""
+        app = SimpleNamespace(name="app-a")
+        result = render_mod.RenderResult(app_name="app-a", success=True, message="ok")
+
+        with (
+            patch.object(render_mod, "list_apps_for_env", return_value=[app]),
+            patch.object(render_mod, "get_repo_root", return_value=tmp_path),
+            patch.object(render_mod, "_get_render_pool") as get_pool,
+            patch.object(render_mod, "_render_single_app", return_value=result),
+        ):
+            counts = render_mod._render_applications("dev", None, False, workers=4)
+
+        assert counts == (1, 0)
+        get_pool.assert_not_called()
+
+    def test_diff_reports_app_and_discards_pool(self):
+        """Test that a dead diff worker becomes each affected app's error."""
+        apps = [
+            SimpleNamespace(name=name, is_kustomize=False, is_local_chart=True)
+            for name in ("app-a", "app-b")
+        ]
+        backend = MagicMock(spec=S3StorageBackend)
+        backend.list_manifest_objects.return_value = []
+        cfg = MagicMock()
+        cfg.render.storage.type = "s3"
+        pool = self._broken_pool()
+
+        with (
+            patch.object(render_mod, "load_config", return_value=cfg),
+            patch.object(render_mod, "create_storage_backend", return_value=backend),
+            patch.object(render_mod, "list_available_envs", return_value=["dev"]),
+            patch.object(render_mod, "list_apps_for_env", return_value=apps),
+            patch.object(render_mod, "_get_diff_pool", return_value=pool),
+            patch.object(render_mod, "_diff_pool", pool),
+        ):
+            result = CliRunner().invoke(
+                render_mod.render, ["diff", "--output-format", "json"]
+            )
+            assert render_mod._diff_pool is None
+
+        assert result.exit_code == 0, result.output
+        output = yaml.safe_load(result.output[result.output.index("{") :])
+        assert len(output["results"]) == 2
+        assert all(
+            r["error"].startswith("Diff worker exited unexpectedly")
+            for r in output["results"]
+        )
+
+
+class TestRenderDiff:
+    """Tests for the render diff command."""
+
+    def test_listed_baselines_are_read_by_etag(self, tmp_path):
+        """Test that listed baselines are read by ETag, and unlisted apps are new."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        apps = [
+            SimpleNamespace(name=name, is_kustomize=False, is_local_chart=True)
+            for name in ("app-a", "app-b", "app-c")
+        ]
+        baselines = {
+            "app-a": "kind: ConfigMap\nmetadata:\n  name: a\n",
+            "app-b": "kind: ConfigMap\nmetadata:\n  name: old\n",
+            "app-c": None,
+        }
+
+        def fake_helm(app, output_dir, **_kwargs):
+            (output_dir / "_all.yaml").write_text(
+                "kind: ConfigMap\nmetadata:\n  name: "
+                + {"app-a": "a", "app-b": "new", "app-c": "c"}[app.name]
+                + "\n"
+            )
+            return True, "ok"
+
+        backend = MagicMock(spec=S3StorageBackend)
+        backend.read_object.side_effect = lambda obj: baselines[obj.ref.app_name]
+        # app-c has no baseline, so it is absent from the listing.
+        backend.list_manifest_objects.return_value = [
+            ManifestObject(ref=ManifestRef(env="dev", app_name=name), etag='"e"', size=1)
+            for name in ("app-a", "app-b")
+        ]
+        worker_state = {
+            "repo_root": tmp_path,
+            "apps_by_env": {"dev": {app.name: app for app in apps}},
+        }
+
+        cfg = MagicMock()
+        cfg.render.storage.type = "s3"
+
+        with (
+            ThreadPoolExecutor(max_workers=2) as pool,
+            patch.object(render_mod, "load_config", return_value=cfg),
+            patch.object(render_mod, "create_storage_backend", return_value=backend),
+            patch.object(render_mod, "list_available_envs", return_value=["dev"]),
+            patch.object(render_mod, "list_apps_for_env", return_value=apps),
+            patch.object(render_mod, "_get_diff_pool", return_value=pool),
+            patch.object(render_mod, "render_helm_chart", side_effect=fake_helm),
+            patch.dict(render_mod._diff_worker_state, worker_state, clear=True),
+        ):
+            result = CliRunner().invoke(
+                render_mod.render, ["diff", "--output-format", "json"]
+            )
+
+        assert result.exit_code == 0, result.output
+        backend.list_manifest_objects.assert_called_once_with("dev")
+        assert backend.read_object.call_count == 2
+        backend.read.assert_not_called()
+        assert backend.max_pool_connections == 16 + render_mod.S3_RANGE_MAX_WORKERS
+        output = yaml.safe_load(result.output[result.output.index("{") :])
+        by_app = {r["app"]: r for r in output["results"]}
+        assert not by_app["app-a"]["has_diff"]
+        assert by_app["app-b"]["has_diff"]
+        assert by_app["app-c"]["has_diff"]
+        assert all(r["error"] is None for r in output["results"])
+
+    def test_matching_etag_skips_baseline_download(self, tmp_path):
+        """Test that a render matching its single-part ETag is never downloaded."""
+        import hashlib
+        from concurrent.futures import ThreadPoolExecutor
+
+        apps = [
+            SimpleNamespace(name=name, is_kustomize=False, is_local_chart=True)
+            for name in ("app-a", "app-b", "app-c")
+        ]
+        rendered = {
+            name: f"kind: ConfigMap\nmetadata:\n  name: {name}\n"
+            for name in ("app-a", "app-b", "app-c")
+        }
+
+        def fake_helm(app, output_dir, **_kwargs):
+            (output_dir / "_all.yaml").write_text(rendered[app.name])
+            return True, "ok"
+
+        def listed(name, etag):
+            size = len(rendered[name].encode())
+            ref = ManifestRef(env="dev", app_name=name)
+            return ManifestObject(ref=ref, etag=f'"{etag}"', size=size)
+
+        md5 = hashlib.md5(rendered["app-a"].encode()).hexdigest()
+        backend = MagicMock(spec=S3StorageBackend)
+        backend.list_manifest_objects.return_value = [
+            listed("app-a", md5),
+            # Same digest, but a multipart ETag can't be compared.
+            listed("app-b", hashlib.md5(rendered["app-b"].encode()).hexdigest() + "-2"),
+            listed("app-c", "0" * 32),
+        ]
+        backend.read_object.side_effect = lambda obj: rendered[obj.ref.app_name]
+        worker_state = {
+            "repo_root": tmp_path,
+            "apps_by_env": {"dev": {app.name: app for app in apps}},
+        }
+        cfg = MagicMock()
+        cfg.render.storage.type = "s3"
+
+        with (
+            ThreadPoolExecutor(max_workers=2) as pool,
+            patch.object(render_mod, "load_config", return_value=cfg),
+            patch.object(render_mod, "create_storage_backend", return_value=backend),
+            patch.object(render_mod, "list_available_envs", return_value=["dev"]),
+            patch.object(render_mod, "list_apps_for_env", return_value=apps),
+            patch.object(render_mod, "_get_diff_pool", return_value=pool),
+            patch.object(render_mod, "render_helm_chart", side_effect=fake_helm),
+            patch.dict(render_mod._diff_worker_state, worker_state, clear=True),
+        ):
+            result = CliRunner().invoke(
+                render_mod.render, ["diff", "--output-format", "json"]
+            )
+
+        assert result.exit_code == 0, result.output
+        read = sorted(c.args[0].ref.app_name for c in backend.read_object.call_args_list)
+        assert read == ["app-b", "app-c"]
+        output = yaml.safe_load(result.output[result.output.index("{") :])
+        assert not any(r["has_diff"] or r["error"] for r in output["results"])
+
+    def test_baseline_read_error_is_reported_per_app(self):
+        """Test that a failed baseline read becomes that app's error.
+
+        The listing is denied too, so the command falls back to plain reads.
+        """
+        app = SimpleNamespace(name="app-a", is_kustomize=False, is_local_chart=True)
+        backend = MagicMock(spec=S3StorageBackend)
+        backend.read.side_effect = RuntimeError("access denied")
+        backend.list_manifest_objects.side_effect = botocore.exceptions.ClientError(
+            {"Error": {"Code": "AccessDenied"}}, "ListObjectsV2"
+        )
+        pool = MagicMock()
+        cfg = MagicMock()
+        cfg.render.storage.type = "s3"
+
+        with (
+            patch.object(render_mod, "load_config", return_value=cfg),
+            patch.object(render_mod, "create_storage_backend", return_value=backend),
+            patch.object(render_mod, "list_available_envs", return_value=["dev"]),
+            patch.object(render_mod, "list_apps_for_env", return_value=[app]),
+            patch.object(render_mod, "_get_diff_pool", return_value=pool),
+        ):
+            result = CliRunner().invoke(
+                render_mod.render, ["diff", "--output-format", "json"]
+            )
+
+        assert result.exit_code == 0, result.output
+        pool.submit.assert_not_called()
+        output = yaml.safe_load(result.output[result.output.index("{") :])
+        assert output["results"] == [
+            {"env": "dev", "app": "app-a", "has_diff": False, "error": "access denied"}
+        ]
+
+    def test_ndjson_streams_one_line_per_app(self):
+        """Test that ndjson output is a record per app plus a summary line."""
+        import json
+
+        app = SimpleNamespace(name="app-a", is_kustomize=False, is_local_chart=True)
+        backend = MagicMock(spec=S3StorageBackend)
+        backend.read.side_effect = RuntimeError("access denied")
+        backend.list_manifest_objects.side_effect = botocore.exceptions.ClientError(
+            {"Error": {"Code": "AccessDenied"}}, "ListObjectsV2"
+        )
+        cfg = MagicMock()
+        cfg.render.storage.type = "s3"
+
+        with (
+            patch.object(render_mod, "load_config", return_value=cfg),
+            patch.object(render_mod, "create_storage_backend", return_value=backend),
+            patch.object(render_mod, "list_available_envs", return_value=["dev"]),
+            patch.object(render_mod, "list_apps_for_env", return_value=[app]),
+            patch.object(render_mod, "_get_diff_pool"),
+        ):
+            result = CliRunner().invoke(
+                render_mod.render, ["diff", "--output-format", "ndjson"]
+            )
+
+        assert result.exit_code == 0, result.output
+        lines = [json.loads(line) for line in result.output.splitlines()]
+        assert lines[0] == {
+            "env": "dev",
+            "app": "app-a",
+            "has_diff": False,
+            "error": "access denied",
+        }
+        assert lines[1]["count"] == 1
+        assert lines[1]["has_diff"] is False
+
+    def test_single_app_runs_without_a_pool(self, tmp_path):
+        """Test that one app is diffed in-process, and -w 0 is accepted."""
+        app = SimpleNamespace(name="app-a", is_kustomize=False, is_local_chart=True)
+        backend = MagicMock(spec=S3StorageBackend)
+        backend.list_manifest_objects.return_value = []
+        cfg = MagicMock()
+        cfg.render.storage.type = "s3"
+
+        def fake_helm(app, output_dir, **_kwargs):
+            (output_dir / "_all.yaml").write_text("kind: ConfigMap\n")
+            return True, "ok"
+
+        with (
+            patch.object(render_mod, "load_config", return_value=cfg),
+            patch.object(render_mod, "create_storage_backend", return_value=backend),
+            patch.object(render_mod, "list_available_envs", return_value=["dev"]),
+            patch.object(render_mod, "list_apps_for_env", return_value=[app]),
+            patch.object(render_mod, "apps_by_name", return_value={"app-a": app}),
+            patch.object(render_mod, "get_repo_root", return_value=tmp_path),
+            patch.object(render_mod, "render_helm_chart", side_effect=fake_helm),
+            patch.object(render_mod, "_get_diff_pool") as get_pool,
+            patch.dict(render_mod._diff_worker_state, clear=True),
+        ):
+            result = CliRunner().invoke(
+                render_mod.render, ["diff", "-w", "0", "--output-format", "json"]
+            )
+
+        assert result.exit_code == 0, result.output
+        get_pool.assert_not_called()
+        output = yaml.safe_load(result.output[result.output.index("{") :])
+        assert output["results"] == [
+            {"env": "dev", "app": "app-a", "has_diff": True, "error": None}
+        ]
+
+    def test_app_filter_selects_local_chart_apps(self):
+        """Test that --app diffs only that app, and fails if nothing matches."""
+        apps = [
+            SimpleNamespace(name="app-a", is_kustomize=False, is_local_chart=True),
+            SimpleNamespace(name="app-b", is_kustomize=False, is_local_chart=True),
+            SimpleNamespace(name="remote", is_kustomize=False, is_local_chart=False),
+        ]
+        backend = MagicMock(spec=S3StorageBackend)
+        backend.list_manifest_objects.return_value = []
+        cfg = MagicMock()
+        cfg.render.storage.type = "s3"
+        diffed = render_mod.DiffResult("dev", "app-a", False, "")
+
+        with (
+            patch.object(render_mod, "load_config", return_value=cfg),
+            patch.object(render_mod, "create_storage_backend", return_value=backend),
+            patch.object(render_mod, "list_available_envs", return_value=["dev"]),
+            patch.object(render_mod, "list_apps_for_env", return_value=apps),
+            patch.object(
+                render_mod, "_diff_single_app", return_value=diffed
+            ) as diff_app,
+            patch.object(render_mod, "_init_diff_worker"),
+        ):
+            found = CliRunner().invoke(
+                render_mod.render,
+                ["diff", "--app", "app-a", "--output-format", "json"],
+            )
+            missing = CliRunner().invoke(
+                render_mod.render, ["diff", "--app", "remote", "--output-format", "json"]
+            )
+
+        assert found.exit_code == 0, found.output
+        assert [c.args[0][:2] for c in diff_app.call_args_list] == [("dev", "app-a")]
+        assert missing.exit_code == 1
+        assert "not found or doesn't use a local chart" in missing.output
+
+    def test_text_lines_are_flushed_before_the_summary(self):
+        """Test that batched per-app lines are all written, errors to stderr."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        apps = [
+            SimpleNamespace(name=name, is_kustomize=False, is_local_chart=True)
+            for name in ("app-a", "app-b", "app-c")
+        ]
+        backend = MagicMock(spec=S3StorageBackend)
+        backend.list_manifest_objects.return_value = []
+        cfg = MagicMock()
+        cfg.render.storage.type = "s3"
+
+        def fake_diff(args):
+            env, name = args[:2]
+            error = "boom" if name == "app-c" else None
+            return render_mod.DiffResult(env, name, name == "app-b", "", error)
+
+        with (
+            ThreadPoolExecutor(max_workers=2) as pool,
+            patch.object(render_mod, "load_config", return_value=cfg),
+            patch.object(render_mod, "create_storage_backend", return_value=backend),
+            patch.object(render_mod, "list_available_envs", return_value=["dev"]),
+            patch.object(render_mod, "list_apps_for_env", return_value=apps),
+            patch.object(render_mod, "_get_diff_pool", return_value=pool),
+            patch.object(render_mod, "_diff_single_app", side_effect=fake_diff),
+        ):
+            result = CliRunner().invoke(render_mod.render, ["diff"])
+
+        assert result.exit_code == 0, result.output
+        assert "✓ dev/app-a unchanged" in result.stdout
+        assert "⚡ dev/app-b has changes" in result.stdout
+        assert "✗ dev/app-c: boom" in result.stderr
+
+    def test_client_error_exits_cleanly(self):
+        """Test that an unusable S3 client fails the command without a traceback."""
+        app = SimpleNamespace(name="app-a", is_kustomize=False, is_local_chart=True)
+        backend = S3StorageBackend(bucket="test-bucket", profile="missing")
+        cfg = MagicMock()
+        cfg.render.storage.type = "s3"
+
+        with (
+            patch("boto3.Session", side_effect=RuntimeError("profile not found")),
+            patch.object(render_mod, "load_config", return_value=cfg),
+            patch.object(render_mod, "create_storage_backend", return_value=backend),
+            patch.object(render_mod, "list_available_envs", return_value=["dev"]),
+            patch.object(render_mod, "list_apps_for_env", return_value=[app]),
+            patch.object(render_mod, "_get_diff_pool") as get_pool,
+        ):
+            result = CliRunner().invoke(render_mod.render, ["diff"])
+
+        assert result.exit_code == 1
+        assert isinstance(result.exception, SystemExit)
+        assert "profile not found" in result.output
+        get_pool.assert_not_called()
+
+
+class TestFastRmtree:
+    """Tests for the threaded tree removal used by render clean."""
+
+    def test_removes_nested_tree_without_following_symlinks(self, tmp_path):
+        """Test that files, subdirs and symlinks go but link targets stay."""
+        keep = tmp_path / "keep"
+        keep.mkdir()
+        (keep / "important.yaml").write_text("a: 1\n")
+
+        tree = tmp_path / "rendered"
+        for app in ("app-a", "app-b"):
+            app_dir = tree / "dev" / app
+            app_dir.mkdir(parents=True)
+            (app_dir / "_all.yaml").write_text("kind: ConfigMap\n")
+        (tree / "dev" / "link").symlink_to(keep)
+
+        render_mod._fast_rmtree(tree, workers=2)
+
+        assert not tree.exists()
+        assert (keep / "important.yaml").exists()
+
+
+class TestFormatGithubDiff:
+    """Tests for the GitHub comment formatter."""
+
+    def test_changed_files_are_attributed_per_env(self):
+        """Test that files mentioning the env or a changed app are listed."""
+        results = [
+            render_mod.DiffResult("prod", "api", True, "+x"),
+            render_mod.DiffResult("dev", "web", True, "+y"),
+            render_mod.DiffResult("dev", "db", False, ""),
+        ]
+        changed = ["values/prod/api.yaml", "charts/web/a.yaml", "charts/db/b.yaml"]
+
+        output = render_mod._format_github_diff(results, changed, 1.0, 2)
+
+        assert "| 🔧 dev | 1 | `charts/web/a.yaml` |" in output
+        assert "| 🚀 prod | 1 | `values/prod/api.yaml` |" in output
+        assert output.index("### dev") < output.index("### prod")
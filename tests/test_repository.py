@@ -0,0 +1,99 @@
+"""Tests for repository helpers."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from rita import repository
+
+
+class TestAppsByName:
+    """Tests for indexing an environment's apps by name."""
+
+    def test_first_definition_wins(self):
+        """Test that a duplicated name resolves like a linear search would."""
+        first = SimpleNamespace(name="web")
+        apps = [first, SimpleNamespace(name="api"), SimpleNamespace(name="web")]
+
+        with patch.object(repository, "list_apps_for_env", return_value=apps):
+            index = repository.apps_by_name("dev")
+
+        assert index["web"] is first
+        assert set(index) == {"web", "api"}
+        assert index.get("missing") is None
+
+
+class TestDiscoveryCache:
+    """Tests for per-process memoization of env and app discovery."""
+
+    @pytest.fixture(autouse=True)
+    def _clear_caches(self):
+        repository._clear_discovery_caches()
+        yield
+        repository._clear_discovery_caches()
+
+    def test_apps_are_parsed_once_per_env(self):
+        """Test that repeated listings reuse the parsed apps."""
+        apps = [SimpleNamespace(name="web")]
+
+        with (
+            patch.object(repository, "get_argocd_apps_paths", return_value=[]),
+            patch.object(
+                repository, "list_argocd_applications", return_value=apps
+            ) as parse,
+        ):
+            first = repository.list_apps_for_env("dev")
+            first.clear()
+            second = repository.list_apps_for_env("dev")
+            repository.list_apps_for_env("prod")
+
+        assert second == apps
+        assert parse.call_count == 2
+
+    def test_reload_clears_the_cache(self):
+        """Test that reloading the config rediscovers apps and envs."""
+        config = MagicMock()
+        config.environments = [SimpleNamespace(name="dev")]
+
+        with (
+            patch.object(repository, "load_config", return_value=config),
+            patch.object(repository, "get_argocd_apps_paths", return_value=[]),
+            patch.object(
+                repository, "list_argocd_applications", return_value=[]
+            ) as parse,
+        ):
+            repository.ConfigProvider.reset()
+            assert repository.list_available_envs() == ["dev"]
+            repository.list_apps_for_env("dev")
+            config.environments = [SimpleNamespace(name="prod")]
+            repository.ConfigProvider.get_instance().reload()
+            assert repository.list_available_envs() == ["prod"]
+            repository.list_apps_for_env("dev")
+
+        assert parse.call_count == 2
+        repository.ConfigProvider.reset()
+
+    def test_chart_paths_are_resolved_once(self):
+        """Test that chart paths are memoized and cleared with the config."""
+        config = MagicMock()
+        config.charts.path = "charts"
+
+        with (
+            patch.object(repository, "load_config", return_value=config) as load,
+            patch.object(repository, "get_repo_root", return_value=Path("/repo")),
+        ):
+            repository.ConfigProvider.reset()
+            first = repository.get_chart_path("web")
+            assert repository.get_chart_path("web") is first
+            config.charts.path = "helm"
+            repository.ConfigProvider.get_instance().reload()
+            moved = repository.get_chart_path("web")
+
+        assert first == Path("/repo/charts/web")
+        assert moved == Path("/repo/helm/web")
+        assert load.call_count == 2
+        repository.ConfigProvider.reset()
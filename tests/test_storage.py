@@ -1,21 +1,29 @@
 from __future__ import annotations
 
+import hashlib
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import botocore.exceptions
+import pytest
 
 from rita.config import RenderConfig, RitaConfig, StorageConfig
 from rita.storage import (
+    ChartRef,
     LocalStorageBackend,
+    ManifestObject,
     ManifestRef,
     S3StorageBackend,
     StorageBackend,
     check_aws_credentials,
     create_storage_backend,
+    drain_chart_uploads,
+    get_chart_cache,
     get_current_git_ref,
     get_default_branch,
     list_aws_profiles,
+    probe_bucket_access,
+    queue_chart_upload,
 )
 
 
@@ -29,6 +37,23 @@ class TestManifestRef:
         assert ref.key == "prod/my-app/main/_all.yaml"
 
 
+class TestManifestObject:
+    def _listed(self, content: str, etag: str) -> ManifestObject:
+        ref = ManifestRef(env="dev", app_name="my-app")
+        return ManifestObject(ref=ref, etag=f'"{etag}"', size=len(content.encode()))
+
+    def test_matches_single_part_etag(self):
+        content = "kind: ConfigMap\n"
+        obj = self._listed(content, hashlib.md5(content.encode()).hexdigest())
+        assert obj.matches(content)
+        assert not obj.matches("kind: Secret\n")
+
+    def test_multipart_etag_never_matches(self):
+        content = "kind: ConfigMap\n"
+        obj = self._listed(content, hashlib.md5(content.encode()).hexdigest() + "-3")
+        assert not obj.matches(content)
+
+
 class TestLocalStorageBackend:
     def test_write_and_read(self, tmp_path: Path):
         backend = LocalStorageBackend(tmp_path)
@@ -192,6 +217,19 @@ class TestS3StorageBackend:
             endpoint_url="https://nyc3.digitaloceanspaces.com",
         )
 
+    @patch("boto3.Session")
+    def test_client_with_max_pool_connections(self, mock_session_cls):
+        """Test that the connection pool size is passed to the client config."""
+        mock_session = MagicMock()
+        mock_session_cls.return_value = mock_session
+
+        backend = S3StorageBackend(bucket="test-bucket", max_pool_connections=32)
+
+        _ = backend.client
+
+        config = mock_session.client.call_args.kwargs["config"]
+        assert config.max_pool_connections == 32
+
     def test_endpoint_url_stored(self):
         """Test that endpoint_url is properly stored in the backend."""
         backend = S3StorageBackend(
@@ -255,8 +293,61 @@ class TestS3StorageBackend:
         mock_client.get_object.assert_called_once_with(
             Bucket="test-bucket",
             Key="rendered-manifests/main/rendered/dev/app/_all.yaml",
+            Range="bytes=0-16777215",
         )
 
+    @patch("rita.storage.S3_RANGE_THRESHOLD", 4)
+    @patch("rita.storage.S3_RANGE_PART_SIZE", 4)
+    @patch("boto3.Session")
+    def test_download_manifest_in_ranges(self, mock_session_cls):
+        """Test that large objects are reassembled from parallel range GETs."""
+        data = b"kind: ConfigMap\n"
+
+        def get_object(**kwargs):
+            start, end = map(int, kwargs["Range"][len("bytes=") :].split("-"))
+            body = MagicMock()
+            body.read.return_value = data[start : end + 1]
+            return {
+                "Body": body,
+                "ContentRange": f"bytes {start}-{end}/{len(data)}",
+                "ETag": '"abc"',
+            }
+
+        mock_client = MagicMock()
+        mock_client.get_object.side_effect = get_object
+        mock_session_cls.return_value.client.return_value = mock_client
+
+        backend = S3StorageBackend(bucket="test-bucket")
+
+        assert backend.download_manifest("dev/app/_all.yaml") == data.decode()
+        assert mock_client.get_object.call_count == 4
+        for call in mock_client.get_object.call_args_list[1:]:
+            assert call.kwargs["IfMatch"] == '"abc"'
+
+        # Later large reads reuse the backend's range threads.
+        pool = backend._range_pool
+        assert backend.download_manifest("dev/app/_all.yaml") == data.decode()
+        assert backend._range_pool is pool
+
+    @patch("boto3.Session")
+    def test_download_empty_manifest(self, mock_session_cls):
+        """Test that an empty object falls back to a plain GET."""
+        body = MagicMock()
+        body.read.return_value = b""
+        mock_client = MagicMock()
+        mock_client.get_object.side_effect = [
+            botocore.exceptions.ClientError(
+                {"Error": {"Code": "InvalidRange"}}, "GetObject"
+            ),
+            {"Body": body},
+        ]
+        mock_session_cls.return_value.client.return_value = mock_client
+
+        backend = S3StorageBackend(bucket="test-bucket")
+
+        assert backend.download_manifest("dev/app/_all.yaml") == ""
+        assert "Range" not in mock_client.get_object.call_args.kwargs
+
     @patch("boto3.Session")
     def test_download_manifest_not_found(self, mock_session_cls):
         mock_client = MagicMock()
@@ -278,6 +369,73 @@ class TestS3StorageBackend:
 
         assert content is None
 
+    @patch("boto3.Session")
+    def test_list_manifest_objects(self, mock_session_cls):
+        """Test that listings carry each manifest's ETag and size."""
+        mock_paginator = MagicMock()
+        mock_paginator.paginate.return_value = [
+            {
+                "Contents": [
+                    {"Key": "m/dev/app/_all.yaml", "ETag": '"a"', "Size": 10},
+                    {"Key": "m/dev/app/feature/_all.yaml", "ETag": '"b"', "Size": 20},
+                    {"Key": "m/dev/app/values.yaml", "ETag": '"c"', "Size": 30},
+                ]
+            }
+        ]
+        mock_client = MagicMock()
+        mock_client.get_paginator.return_value = mock_paginator
+        mock_session_cls.return_value.client.return_value = mock_client
+
+        backend = S3StorageBackend(bucket="test-bucket", prefix="m")
+
+        assert backend.list_manifest_objects("dev") == [
+            ManifestObject(ref=ManifestRef("dev", "app"), etag='"a"', size=10),
+            ManifestObject(
+                ref=ManifestRef("dev", "app", "feature"), etag='"b"', size=20
+            ),
+        ]
+        assert backend.list_manifests("dev") == [
+            ManifestRef("dev", "app"),
+            ManifestRef("dev", "app", "feature"),
+        ]
+
+    @patch("boto3.Session")
+    def test_read_object_pins_listed_etag(self, mock_session_cls):
+        """Test that a listed manifest is read in one GET pinned to its ETag."""
+        body = MagicMock()
+        body.read.return_value = b"kind: ConfigMap\n"
+        mock_client = MagicMock()
+        mock_client.get_object.return_value = {"Body": body}
+        mock_session_cls.return_value.client.return_value = mock_client
+
+        backend = S3StorageBackend(bucket="test-bucket", prefix="m")
+        obj = ManifestObject(ref=ManifestRef("dev", "app"), etag='"a"', size=16)
+
+        assert backend.read_object(obj) == "kind: ConfigMap\n"
+        mock_client.get_object.assert_called_once_with(
+            Bucket="test-bucket", Key="m/dev/app/_all.yaml", IfMatch='"a"'
+        )
+
+    @patch("boto3.Session")
+    def test_read_object_falls_back_when_changed(self, mock_session_cls):
+        """Test that an object replaced since listing is re-read by key."""
+        body = MagicMock()
+        body.read.return_value = b"new"
+        mock_client = MagicMock()
+        mock_client.get_object.side_effect = [
+            botocore.exceptions.ClientError(
+                {"Error": {"Code": "PreconditionFailed"}}, "GetObject"
+            ),
+            {"Body": body},
+        ]
+        mock_session_cls.return_value.client.return_value = mock_client
+
+        backend = S3StorageBackend(bucket="test-bucket", prefix="m")
+        obj = ManifestObject(ref=ManifestRef("dev", "app"), etag='"old"', size=3)
+
+        assert backend.read_object(obj) == "new"
+        assert "IfMatch" not in mock_client.get_object.call_args.kwargs
+
     @patch("boto3.Session")
     def test_list_manifest_keys(self, mock_session_cls):
         mock_client = MagicMock()
@@ -330,6 +488,21 @@ class TestS3StorageBackend:
 
         assert keys == []
 
+    def test_chart_lookups_are_remembered(self):
+        backend = S3StorageBackend(bucket="test-bucket")
+        backend._client = MagicMock()
+        backend._client.head_object.side_effect = botocore.exceptions.ClientError(
+            {"Error": {"Code": "404"}}, "HeadObject"
+        )
+        ref = ChartRef(chart_name="nginx", version="1.0.0")
+
+        assert backend.chart_exists(ref) is False
+        assert backend.chart_exists(ref) is False
+        backend.upload_chart(ref, Path("nginx.tgz"))
+        assert backend.chart_exists(ref) is True
+
+        assert backend._client.head_object.call_count == 1
+
 
 class TestCheckAwsCredentials:
     @patch("boto3.Session")
@@ -524,3 +697,105 @@ class TestCreateStorageBackend:
 
         assert isinstance(backend, S3StorageBackend)
         assert backend.endpoint_url == "http://minio.local:9000"
+
+
+class TestGetChartCache:
+    def test_backend_is_shared_per_bucket(self, monkeypatch):
+        monkeypatch.setattr("rita.storage._chart_caches", {})
+        monkeypatch.delenv("RITA_S3_BUCKET", raising=False)
+        config = RitaConfig(
+            render=RenderConfig(storage=StorageConfig(type="s3", s3_bucket="b"))
+        )
+        other = RitaConfig(
+            render=RenderConfig(storage=StorageConfig(type="s3", s3_bucket="c"))
+        )
+
+        first = get_chart_cache(config)
+
+        assert first is not None
+        assert get_chart_cache(config) is first
+        assert get_chart_cache(other) is not first
+
+
+class TestQueueChartUpload:
+    def test_chart_is_archived_now_and_uploaded_in_background(self, tmp_path):
+        chart_dir = tmp_path / "nginx"
+        chart_dir.mkdir()
+        (chart_dir / "Chart.yaml").write_text("name: nginx\n")
+        cache = MagicMock()
+        cache.chart_exists.return_value = False
+        uploaded: list[tuple[ChartRef, bool]] = []
+        cache.upload_chart.side_effect = lambda ref, path: uploaded.append(
+            (ref, path.exists())
+        )
+
+        queue_chart_upload(cache, "nginx", "1.0.0", chart_dir)
+        (chart_dir / "Chart.yaml").unlink()
+        chart_dir.rmdir()
+        drain_chart_uploads()
+
+        assert uploaded == [(ChartRef(chart_name="nginx", version="1.0.0"), True)]
+        tgz_path = cache.upload_chart.call_args.args[1]
+        assert not tgz_path.exists()
+
+    def test_cached_chart_is_not_uploaded(self, tmp_path):
+        cache = MagicMock()
+        cache.chart_exists.return_value = True
+
+        queue_chart_upload(cache, "nginx", "1.0.0", tmp_path)
+        drain_chart_uploads()
+
+        cache.upload_chart.assert_not_called()
+
+
+class TestProbeBucketAccess:
+    def _backend(self) -> S3StorageBackend:
+        backend = S3StorageBackend(bucket="bucket", profile="dev", region="eu-west-1")
+        backend.list_manifests = MagicMock(return_value=[])  # type: ignore[method-assign]
+        return backend
+
+    def test_success_is_cached(self, tmp_path: Path):
+        backend = self._backend()
+        with patch.dict("os.environ", {"XDG_CACHE_HOME": str(tmp_path)}):
+            assert probe_bucket_access(backend)
+            assert not probe_bucket_access(backend)
+
+        backend.list_manifests.assert_called_once()
+        assert (tmp_path / "rita" / "s3_ok.json").exists()
+
+    def test_force_reprobes(self, tmp_path: Path):
+        backend = self._backend()
+        with patch.dict("os.environ", {"XDG_CACHE_HOME": str(tmp_path)}):
+            probe_bucket_access(backend)
+            probe_bucket_access(backend, force=True)
+
+        assert backend.list_manifests.call_count == 2
+
+    def test_stale_entry_reprobes(self, tmp_path: Path):
+        backend = self._backend()
+        with patch.dict("os.environ", {"XDG_CACHE_HOME": str(tmp_path)}):
+            probe_bucket_access(backend)
+            probe_bucket_access(backend, ttl=0)
+
+        assert backend.list_manifests.call_count == 2
+
+    def test_failure_is_not_cached(self, tmp_path: Path):
+        backend = self._backend()
+        backend.list_manifests.side_effect = RuntimeError("denied")
+        with patch.dict("os.environ", {"XDG_CACHE_HOME": str(tmp_path)}):
+            for _ in range(2):
+                with pytest.raises(RuntimeError):
+                    probe_bucket_access(backend)
+
+        assert backend.list_manifests.call_count == 2
+
+    @pytest.mark.parametrize("content", ["[]", '{"other": 1}', "not json"])
+    def test_unusable_cache_reprobes(self, tmp_path: Path, content: str):
+        backend = self._backend()
+        cache_file = tmp_path / "rita" / "s3_ok.json"
+        cache_file.parent.mkdir()
+        cache_file.write_text(content)
+        with patch.dict("os.environ", {"XDG_CACHE_HOME": str(tmp_path)}):
+            assert probe_bucket_access(backend)
+
+        backend.list_manifests.assert_called_once()
@@ -0,0 +1,42 @@
+"""Tests for the values commands."""
+
+from __future__ import annotations
+
+import importlib
+from unittest.mock import patch
+
+from click.testing import CliRunner
+
+values_mod = importlib.import_module("rita.commands.values")
+
+
+class TestValuesClean:
+    """Tests for removing .temp.yaml files."""
+
+    def test_removes_nested_temp_files_only(self, tmp_path):
+        """Test that temp files at any depth are deleted and others kept."""
+        nested = tmp_path / "kubernetes" / "apps" / "web"
+        nested.mkdir(parents=True)
+        (tmp_path / "kubernetes" / "top.temp.yaml").write_text("a: 1\n")
+        (nested / "values.temp.yaml").write_text("a: 1\n")
+        (nested / "values.yaml").write_text("a: 1\n")
+
+        with patch.object(values_mod, "get_repo_root", return_value=tmp_path):
+            result = CliRunner().invoke(values_mod.values, ["clean"])
+
+        assert result.exit_code == 0, result.output
+        assert "Deleted 2 files." in result.output
+        assert sorted(p.name for p in tmp_path.rglob("*.yaml")) == ["values.yaml"]
+
+    def test_dry_run_keeps_files(self, tmp_path):
+        """Test that --dry-run only lists what would be deleted."""
+        (tmp_path / "kubernetes").mkdir()
+        temp_file = tmp_path / "kubernetes" / "x.temp.yaml"
+        temp_file.write_text("a: 1\n")
+
+        with patch.object(values_mod, "get_repo_root", return_value=tmp_path):
+            result = CliRunner().invoke(values_mod.values, ["clean", "--dry-run"])
+
+        assert result.exit_code == 0, result.output
+        assert "Would delete: kubernetes/x.temp.yaml" in result.output
+        assert temp_file.exists()